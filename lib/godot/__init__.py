@@ -27,3 +27,7 @@ from .types import CustomCallable
 
 from .types import writable_memoryview # XXX
 
+from ._internal.property_buffers import gather, scatter
+
+
+from ._internal.file_io import open_file
@@ -1,6 +1,7 @@
 import sys
 import pathlib
 import importlib
+import atexit
 
 try:
 	import _gdextension as gde
@@ -19,6 +20,7 @@ if not gde:
 
 
 from . import utils
+from . import binding_cache
 
 
 def _init():
@@ -73,18 +75,38 @@ def _try_restart_headless_if_cli():
 
 
 def _load_api_data():
+	from . import api_info
+
 	with utils.timer('api parse'):
 		res_root = pathlib.Path().resolve()
 
 		likely_running_from_editor = (res_root / 'project.godot').exists() and (res_root / '.godot').exists()
 
 		if not likely_running_from_editor:
-			import gzip
+			# get api snapshot from packed data
+			if snapshot := _try_get_file_as_bytes(f'res://.python/{api_info.snapshot_file_name}'):
+				try:
+					api_info.load_api_snapshot(snapshot)
+
+				except ValueError as exc:
+					# snapshots are tied to the python version they were exported with, no json is shipped
+					# along to fall back to
+					raise RuntimeError(
+						f'the api snapshot of this project is not compatible with this build ({exc}), '
+						'the project must be exported again'
+					) from exc
+
+			else:
+				import gzip
+
+				# fall back to the api json for projects exported before snapshots were added
+				data = utils.get_file_as_bytes('res://.python/extension_api.json.gz')
+				if data:
+					data = gzip.decompress(data)
 
-			# get api json from packed data
-			data = utils.get_file_as_bytes('res://.python/extension_api.json.gz')
-			if data:
-				data = gzip.decompress(data)
+				api_info.load_api_data(data)
+
+			binding_cache_data = _try_get_file_as_bytes(f'res://.python/{binding_cache.cache_file_name}')
 
 		else:
 			# try to get or update cached api json when running from editor
@@ -97,14 +119,16 @@ def _load_api_data():
 				(python_dir / '.gitignore').write_text('*\n')
 
 			api_json_path = python_dir / 'extension_api.json'
+			api_snapshot_path = python_dir / api_info.snapshot_file_name
 
 			api_json_mtime_ns = api_json_path.stat().st_mtime_ns if api_json_path.exists() else 0
 			godot_binary_mtime_ns = pathlib.Path(sys.executable).stat().st_mtime_ns
 
+			import os
+
 			# check mtimes
 			if api_json_mtime_ns // 1000**3 != godot_binary_mtime_ns // 1000**3:
 				# cached api json either doens't exist or doesn't match the current godot binary
-				import os
 				import subprocess
 
 				# generate api json in cache dir
@@ -116,12 +140,42 @@ def _load_api_data():
 				# set api json mtime to match the godot binary
 				os.utime(api_json_path, ns=(godot_binary_mtime_ns, godot_binary_mtime_ns))
 
-			# read the cached api json
-			data = api_json_path.read_text()
+			api_snapshot_mtime_ns = api_snapshot_path.stat().st_mtime_ns if api_snapshot_path.exists() else 0
+
+			try:
+				if api_snapshot_mtime_ns // 1000**3 != godot_binary_mtime_ns // 1000**3:
+					raise ValueError('api snapshot out of date')
+
+				api_info.load_api_snapshot(api_snapshot_path.read_bytes())
 
-		# load api from data
-		from . import api_info
-		api_info.load_api_data(data)
+			except ValueError:
+				# snapshot is either missing, out of date or from another python version, regenerate it
+				# from the cached api json
+				data = api_json_path.read_text()
+
+				api_snapshot_path.write_bytes(api_info.dump_api_snapshot(data))
+				os.utime(api_snapshot_path, ns=(godot_binary_mtime_ns, godot_binary_mtime_ns))
+
+				api_info.load_api_data(data)
+
+			# read the cached binding code and write it back on exit if anything new was generated
+			binding_cache_path = python_dir / binding_cache.cache_file_name
+			binding_cache_data = binding_cache_path.read_bytes() if binding_cache_path.exists() else None
+
+			@atexit.register
+			def _save_binding_cache():
+				if binding_cache.is_modified():
+					binding_cache_path.write_bytes(binding_cache.dumps())
+
+		binding_cache.set_api_hash(api_info.api_hash)
+		binding_cache.loads(binding_cache_data)
+
+
+def _try_get_file_as_bytes(path: str) -> bytes | None:
+	try:
+		return utils.get_file_as_bytes(path)
+	except Exception:
+		return None
 
 
 _init()
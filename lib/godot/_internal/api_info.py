@@ -7,6 +7,8 @@ import types
 import json
 import re
 import textwrap
+import hashlib
+import marshal
 
 
 # NOTE: This file intentionally avoids importing from any other local modules.
@@ -23,11 +25,27 @@ import _json # XXX: ensure fast decoding
 raise_not_found = {}
 
 
+def _invalidating(method):
+	def wrapper(self, *args, **kwargs):
+		self._indexes.clear()
+		return method(self, *args, **kwargs)
+
+	wrapper.__name__ = method.__name__
+	wrapper.__qualname__ = f'ListWithNames.{method.__name__}'
+
+	return wrapper
+
+
 class ListWithNames(list):
+	__slots__ = ('_indexes',)
+
 	def __init__(self, *args, **kwargs):
 		super().__init__(*args, **kwargs)
 
-		#self._cache = {}
+		# per key mappings of item values to items, built on first lookup with a key and
+		# dropped whenever the list is mutated
+		# NOTE: items modified in place are only noticed when a stale entry is hit
+		self._indexes = {}
 
 	# XXX: unsure of the performance impact of this method, only used by _find_broken_properties below?
 	if __name__ == '__main__':
@@ -40,27 +58,69 @@ class ListWithNames(list):
 				return True
 
 	def __getattr__(self, name):
+		if name == '_indexes':
+			# not yet initialized, ie when copied
+			self._indexes = {}
+			return self._indexes
+
 		return self.get(name, default = raise_not_found)
 
 	def get(self, name: str, *, key: str = 'name', default=None):
-		# TODO: cache
+		index = self._indexes.get(key)
+		if index is None:
+			index = self._build_index(key)
 
-		#if item := self._cache.get((name, key)):
-		#	return item
+		try:
+			item = index.get(name, default)
+		except TypeError:
+			item = default # unhashable name
 
-		for item in self:
-			if hasattr(item, key) and name == getattr(item, key):
-				#self._cache[(name, key)] = item
-				return item
-			elif isinstance(item, dict) and key in item and name == item[key]:
-				#self._cache[(name, key)] = item
-				return item
-
-		if default is raise_not_found:
+		if item is not default and _item_value(item, key, default) != name:
+			# an item was modified in place since the index was built
+			item = self._build_index(key).get(name, default)
+
+		if item is raise_not_found:
 			raise ValueError(f'{self.__class__.__name__!r} object has no item with key {key!r} matching {name!r}')
 
-		#self._cache[(name, key)] = default # XXX
-		return default
+		return item
+
+	def _build_index(self, key: str) -> dict:
+		index = {}
+
+		for item in self:
+			value = _item_value(item, key, raise_not_found)
+			if value is raise_not_found:
+				continue
+
+			try:
+				# keep the first item matching like a linear search would
+				index.setdefault(value, item)
+			except TypeError:
+				pass # unhashable value
+
+		self._indexes[key] = index
+
+		return index
+
+	__setitem__ = _invalidating(list.__setitem__)
+	__delitem__ = _invalidating(list.__delitem__)
+	__iadd__ = _invalidating(list.__iadd__)
+	__imul__ = _invalidating(list.__imul__)
+	append = _invalidating(list.append)
+	extend = _invalidating(list.extend)
+	insert = _invalidating(list.insert)
+	remove = _invalidating(list.remove)
+	pop = _invalidating(list.pop)
+	clear = _invalidating(list.clear)
+	sort = _invalidating(list.sort)
+	reverse = _invalidating(list.reverse)
+
+
+def _item_value(item, key: str, default):
+	if isinstance(item, dict):
+		return dict.get(item, key, default)
+
+	return getattr(item, key, default)
 
 
 class Namespace(dict):
@@ -73,20 +133,31 @@ class Namespace(dict):
 	def __getattr__(self, key):
 		if key not in self:
 			raise AttributeError(f'{self.__class__.__name__!r} object has no attribute {key!r}')
-		value = self[key]
-		if isinstance(value, list):
-			return ListWithNames(value)
-		return value
+		return self._wrap_value(key, self[key])
 
 	def get(self, name: str, default=None):
-		res = super().get(name, default)
+		if name not in self:
+			if default is raise_not_found:
+				raise ValueError(f'{self.__class__.__name__!r} object has no item matching {name!r}')
 
-		if res is raise_not_found:
-			raise ValueError(f'{self.__class__.__name__!r} object has no item matching {name!r}')
+			if isinstance(default, list) and type(default) is not ListWithNames:
+				return ListWithNames(default)
+			return default
 
-		if isinstance(res, list):
-			return ListWithNames(res)
-		return res
+		return self._wrap_value(name, self[name])
+
+	def _wrap_value(self, key, value):
+		# values loaded from a snapshot are plain dicts and lists, convert them on first access
+		if type(value) is dict:
+			value = Namespace(value)
+			super().__setitem__(key, value)
+
+		elif isinstance(value, list) and type(value) is not ListWithNames:
+			# store the converted list so its name indexes are kept between accesses
+			value = ListWithNames(Namespace(item) if type(item) is dict else item for item in value)
+			super().__setitem__(key, value)
+
+		return value
 
 
 class ObjectPath(list):
@@ -172,12 +243,20 @@ def get_via_path(root_obj, path):
 	return obj
 
 
+def _dict_items(obj):
+	if isinstance(obj, Namespace):
+		# access through `get` so snapshot entries are converted like regular accesses
+		return ((key, obj.get(key)) for key in list(obj.keys()))
+
+	return obj.items()
+
+
 def visit_object(obj, func, types_ = ()):
 	if not types_ or isinstance(obj, types_):
 		func(obj)
 
 	if isinstance(obj, (Namespace, dict)):
-		for key, value in obj.items():
+		for key, value in _dict_items(obj):
 			visit_object(value, func, types_)
 		
 	elif isinstance(obj, list):
@@ -193,7 +272,7 @@ def visit_object_with_path(obj, func, types_ = (), *, path: ObjectPath = None, t
 		func(obj, path)
 
 	if isinstance(obj, (Namespace, dict)):
-		for key, value in obj.items():
+		for key, value in _dict_items(obj):
 			visit_object_with_path(value, func, types_, path = path + key, try_get_names = try_get_names)
 		
 	elif isinstance(obj, list):
@@ -253,31 +332,47 @@ def pretty_string(obj, *, max_depth: int | None = None):
 		return repr(obj)
 
 
-def load_api_data(data: bytes | str | None = None) -> Namespace:
-	global api
+def _read_api_json() -> str:
+	data = None
+
+	if __package__:
+		try:
+			data = (importlib.resources.files(__package__) / 'extension_api.json').read_text()
+		except FileNotFoundError:
+			pass
 
 	if data is None:
-		if __package__:
-			try:
-				data = (importlib.resources.files(__package__) / 'extension_api.json').read_text()
-			except FileNotFoundError:
-				pass
+		try:
+			data = (pathlib.Path(__file__).parent / 'extension_api.json').read_text()
 
-		if data is None:
-			try:
-				data = (pathlib.Path(__file__).parent / 'extension_api.json').read_text()
+		except FileNotFoundError:
+			# XXX: if the file doesn't exist in the module directory try to find it
+			# in the project's extern directory
+
+			project_root = pathlib.Path(__file__).resolve().parent.parent.parent.parent
+			gdextension_dir = project_root / 'extern' / 'gdextension'
+
+			if not gdextension_dir.exists():
+				raise
+
+			data = (gdextension_dir / 'extension_api.json').read_text()
+
+	return data
+
+
+def hash_api_data(data: bytes | str) -> str:
+	'''Return a hash identifying the api json `data`.'''
+	if isinstance(data, str):
+		data = data.encode()
 
-			except FileNotFoundError:
-				# XXX: if the file doesn't exist in the module directory try to find it
-				# in the project's extern directory
+	return hashlib.sha256(data).hexdigest()
 
-				project_root = pathlib.Path(__file__).resolve().parent.parent.parent.parent
-				gdextension_dir = project_root / 'extern' / 'gdextension'
 
-				if not gdextension_dir.exists():
-					raise
+def load_api_data(data: bytes | str | None = None) -> Namespace:
+	global api, api_hash
 
-				data = (gdextension_dir / 'extension_api.json').read_text()
+	if data is None:
+		data = _read_api_json()
 
 	elif isinstance(data, bytes):
 		data = data.decode()
@@ -289,12 +384,61 @@ def load_api_data(data: bytes | str | None = None) -> Namespace:
 	api = json.loads(data,
 		object_hook = lambda obj: Namespace(**obj))
 
+	api_hash = hash_api_data(data)
+
+	return api
+
+
+# api snapshots hold the parsed api json as plain dicts and lists serialized with `marshal`
+# this avoids the json parse on load, entries are converted to `Namespace` lazily when accessed
+
+snapshot_file_name = 'extension_api.marshal'
+
+_snapshot_magic = b'GDAPI'
+_snapshot_format_version = 1
+
+
+def dump_api_snapshot(data: bytes | str | None = None) -> bytes:
+	'''Return a snapshot of the api json `data` that can be loaded with `load_api_snapshot`.'''
+	if data is None:
+		data = _read_api_json()
+
+	elif isinstance(data, bytes):
+		data = data.decode()
+
+	return marshal.dumps((
+		_snapshot_magic,
+		_snapshot_format_version,
+		sys.implementation.cache_tag, # marshal format may change between python versions
+		hash_api_data(data),
+		json.loads(data),
+	))
+
+
+def load_api_snapshot(data: bytes) -> Namespace:
+	'''Load the api from a snapshot created with `dump_api_snapshot`.'''
+	global api, api_hash
+
+	try:
+		magic, format_version, cache_tag, hash_, obj = marshal.loads(data)
+
+	except (ValueError, EOFError, TypeError) as exc:
+		raise ValueError('invalid api snapshot') from exc
+
+	if (magic, format_version, cache_tag) != (_snapshot_magic, _snapshot_format_version,
+			sys.implementation.cache_tag):
+		raise ValueError('incompatible api snapshot')
+
+	api = Namespace(obj)
+	api_hash = hash_
+
 	return api
 
 
 def __getattr__(name):
-	if name == 'api':
-		return load_api_data()
+	if name in ('api', 'api_hash'):
+		load_api_data()
+		return globals()[name]
 
 	raise AttributeError(
 		f'module {__name__!r} has no attribute {name!r}')
@@ -349,7 +493,7 @@ def _find_broken_properties():
 			print()
 			had_missing = False
 
-		methods = class_.get('methods', [])
+		methods = ListWithNames(class_.get('methods', []))
 
 		for method in methods:
 			if method.name.startswith('_') and not method.get('is_virtual'):
@@ -416,8 +560,11 @@ def main():
 		case ['--find-broken-properties']:
 			_find_broken_properties()
 
+		case ['--write-snapshot', output_path]:
+			pathlib.Path(output_path).write_bytes(dump_api_snapshot())
+
 		case ['--help'] | _:
-			print(f'''usage: {pathlib.Path(sys.argv[0]).name} [--display-api-layout] [--max-depth MAX_DEPTH] [API_OBJECT_PATH]''')
+			print(f'''usage: {pathlib.Path(sys.argv[0]).name} [--display-api-layout] [--write-snapshot OUTPUT_PATH] [--max-depth MAX_DEPTH] [API_OBJECT_PATH]''')
 			sys.exit(1)
 
 
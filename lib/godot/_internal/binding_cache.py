@@ -0,0 +1,98 @@
+import os
+import types
+import marshal
+import importlib.util
+
+
+# NOTE: The code generated while binding methods and variant constructors depends only on the
+# extension api data and the generator itself. The compiled code objects are stored keyed by their
+# filename (ie `<godot.Vector2.__init__>`), or a key derived from it for variants of the generated
+# code, and reused on the next start if the api data matches.
+
+
+# bump when the code generated in `method_bind` changes
+_generator_version = 3
+
+cache_file_name = 'binding_cache.marshal'
+
+_enabled = not os.environ.get('GODOT_PYTHON_DISABLE_BINDING_CACHE')
+
+_api_hash: str | None = None
+_code_objects: dict[str, types.CodeType] = {}
+_modified = False
+
+
+def _cache_key(api_hash: str) -> tuple:
+	return (importlib.util.MAGIC_NUMBER, _generator_version, api_hash)
+
+
+def set_api_hash(api_hash: str):
+	'''Set the hash of the api data the cache is valid for. Any cached code objects are discarded.'''
+	global _api_hash, _modified
+
+	_api_hash = api_hash
+
+	_code_objects.clear()
+	_modified = False
+
+
+def loads(data: bytes | None):
+	'''Load cached code objects from `data` if they match the current api data.'''
+	global _modified
+
+	if not _enabled or not data or _api_hash is None:
+		return
+
+	try:
+		key, code_objects = marshal.loads(data)
+	except Exception:
+		return # XXX: corrupt or from another python version, regenerate
+
+	if key != _cache_key(_api_hash) or not isinstance(code_objects, dict):
+		return
+
+	_code_objects.update(code_objects)
+	_modified = False
+
+
+def dumps(api_hash: str | None = None) -> bytes:
+	'''Return the cached code objects serialized for the api hash, defaults to the current api data.'''
+	if api_hash is None:
+		api_hash = _api_hash
+
+	return marshal.dumps((_cache_key(api_hash), _code_objects))
+
+
+def is_modified() -> bool:
+	return _modified
+
+
+def get(filename: str) -> types.CodeType | None:
+	'''Return the cached code object stored for `filename`, if any.'''
+	if not _enabled:
+		return None
+
+	return _code_objects.get(filename)
+
+
+def put(filename: str, code: types.CodeType):
+	'''Store the code object for `filename`, the name it was compiled with or a key derived from it.'''
+	global _modified
+
+	if not _enabled or _api_hash is None:
+		return
+
+	_code_objects[filename] = code
+	_modified = True
+
+
+def compile_cached(make_source, filename: str) -> types.CodeType:
+	'''Return the cached code object for `filename` or compile the source returned by `make_source`.'''
+	if (code := get(filename)) is not None:
+		return code
+
+	code = compile(make_source(), filename, 'exec')
+	put(filename, code)
+
+	return code
+
@@ -0,0 +1,210 @@
+import io
+
+import _gdextension as gde
+
+import godot
+
+
+# buffer size of `open`, larger than `io.DEFAULT_BUFFER_SIZE` as each chunk is a call into the engine
+_default_buffer_size = 64 * 1024
+
+
+def _open_error(path: str, error) -> OSError:
+	error = godot.Error(error)
+
+	match error:
+		case godot.Error.ERR_FILE_NOT_FOUND:
+			exc_type = FileNotFoundError
+		case godot.Error.ERR_FILE_NO_PERMISSION:
+			exc_type = PermissionError
+		case godot.Error.ERR_FILE_ALREADY_IN_USE | godot.Error.ERR_BUSY:
+			exc_type = BlockingIOError
+		case _:
+			exc_type = OSError
+
+	return exc_type(f'cannot open file {path!r}: godot.Error.{error.name}')
+
+
+class FileAccessIO(io.RawIOBase):
+	'''Raw binary file backed by `FileAccess`, works with `res://`, `user://` and files inside .pck files.
+
+	Reads go straight into the caller's buffer (`readinto`), use `open_file` for buffered and text files.
+	'''
+
+	def __init__(self, path: str, mode: str = 'r'):
+		super().__init__()
+
+		self._file = None
+		self._readable = self._writable = False
+
+		ModeFlags = godot.FileAccess.ModeFlags
+
+		match mode.replace('b', ''):
+			case 'r':
+				flags = ModeFlags.READ
+			case 'w':
+				flags = ModeFlags.WRITE
+			case 'a':
+				flags = ModeFlags.READ_WRITE if godot.FileAccess.file_exists(path) else ModeFlags.WRITE
+			case 'a+':
+				flags = ModeFlags.READ_WRITE if godot.FileAccess.file_exists(path) else ModeFlags.WRITE_READ
+			case 'r+':
+				flags = ModeFlags.READ_WRITE
+			case 'w+':
+				flags = ModeFlags.WRITE_READ
+			case _:
+				raise ValueError(f'invalid mode: {mode!r}')
+
+		self.name = path
+		self.mode = mode
+		self._readable = 'r' in mode or '+' in mode
+		self._writable = not mode.startswith('r') or '+' in mode
+		self._append = mode.startswith('a')
+
+		self._file = godot.FileAccess.open(path, flags)
+
+		if self._file is None:
+			raise _open_error(path, godot.FileAccess.get_open_error())
+
+		if self._append:
+			self._file.seek_end(0)
+
+	def __repr__(self):
+		return f'<{type(self).__qualname__} name={self.name!r} mode={self.mode!r}>'
+
+	def readable(self) -> bool:
+		self._checkClosed()
+		return self._readable
+
+	def writable(self) -> bool:
+		self._checkClosed()
+		return self._writable
+
+	def seekable(self) -> bool:
+		self._checkClosed()
+		return True
+
+	def readinto(self, buffer) -> int:
+		self._checkClosed()
+		self._checkReadable()
+
+		return gde.file_access_readinto(self._file, buffer)
+
+	def readall(self) -> bytes:
+		self._checkClosed()
+		self._checkReadable()
+
+		# the remaining size is known, read it with a single call
+		data = bytearray(max(0, self._file.get_length() - self._file.get_position()))
+		size = gde.file_access_readinto(self._file, data)
+
+		del data[size:]
+		return bytes(data)
+
+	def write(self, buffer) -> int:
+		self._checkClosed()
+		self._checkWritable()
+
+		# like O_APPEND, writes go to the end of the file even after seeking to read
+		if self._append:
+			self._file.seek_end(0)
+
+		return gde.file_access_write(self._file, buffer)
+
+	def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+		self._checkClosed()
+
+		match whence:
+			case io.SEEK_SET:
+				self._file.seek(offset)
+			case io.SEEK_CUR:
+				self._file.seek(self._file.get_position() + offset)
+			case io.SEEK_END:
+				self._file.seek_end(offset)
+			case _:
+				raise ValueError(f'invalid whence: {whence!r}')
+
+		return self._file.get_position()
+
+	def tell(self) -> int:
+		self._checkClosed()
+		return self._file.get_position()
+
+	def truncate(self, size: int | None = None) -> int:
+		self._checkClosed()
+		self._checkWritable()
+
+		size = self.tell() if size is None else size
+
+		if (error := self._file.resize(size)) != godot.Error.OK:
+			raise OSError(f'cannot truncate file {self.name!r}: godot.Error.{godot.Error(error).name}')
+
+		return size
+
+	def flush(self):
+		super().flush()
+
+		if self._writable and self._file is not None:
+			self._file.flush()
+
+	def close(self):
+		if self.closed:
+			return
+
+		try:
+			super().close() # flushes
+		finally:
+			if self._file is not None:
+				self._file.close()
+				self._file = None
+
+
+def open_file(path: str, mode: str = 'r', buffering: int = -1, encoding: str | None = None, errors: str | None = None,
+	newline: str | None = None):
+	'''Open a file through `FileAccess`, like the builtin `open`, ie to stream large files from a .pck::
+
+		with godot.open_file('res://levels/level_1.csv', newline='') as file:
+			for row in csv.reader(file):
+				...
+
+	Supports the 'r', 'w', 'a', 'r+', 'w+' and 'a+' modes, text or binary, 'x' is not supported. In append modes
+	writes always go to the end of the file. Binary files with `buffering=0` return the `FileAccessIO` raw file.
+	'''
+	if 'x' in mode or 'U' in mode:
+		raise ValueError(f'invalid mode: {mode!r}')
+
+	binary = 'b' in mode
+	raw_mode = mode.replace('t', '')
+
+	if binary and (encoding is not None or errors is not None or newline is not None):
+		raise ValueError('binary mode doesn\'t take encoding, errors or newline arguments')
+
+	if buffering == 0 and not binary:
+		raise ValueError('can\'t have unbuffered text I/O')
+
+	raw = FileAccessIO(path, raw_mode)
+
+	try:
+		if buffering == 0:
+			return raw
+
+		buffer_size = _default_buffer_size if buffering in (-1, 1) else buffering
+
+		if raw.readable() and raw.writable():
+			buffer = io.BufferedRandom(raw, buffer_size)
+		elif raw.writable():
+			buffer = io.BufferedWriter(raw, buffer_size)
+		else:
+			buffer = io.BufferedReader(raw, buffer_size)
+
+		if binary:
+			return buffer
+
+		text = io.TextIOWrapper(buffer, encoding or 'utf-8', errors, newline, line_buffering=(buffering == 1))
+		text.mode = mode
+
+		return text
+
+	except BaseException:
+		raw.close()
+		raise
@@ -0,0 +1,133 @@
+import sys
+import struct
+
+import _gdextension as gde
+
+import godot
+
+
+# (channels, struct format of a channel) of uncompressed image formats, the first format of a layout is the
+# one picked by `create_from_buffer`, packed formats (ie RGB565) are a single channel of their pixel size
+# and are only used when given explicitly (see `_packed_formats`)
+_format_layouts = {
+	'R8': (1, 'B'),
+	'RG8': (2, 'B'),
+	'RGB8': (3, 'B'),
+	'RGBA8': (4, 'B'),
+	'L8': (1, 'B'),
+	'LA8': (2, 'B'),
+	'RGBA4444': (1, 'H'),
+	'RGB565': (1, 'H'),
+	'RF': (1, 'f'),
+	'RGF': (2, 'f'),
+	'RGBF': (3, 'f'),
+	'RGBAF': (4, 'f'),
+	'RH': (1, 'e'),
+	'RGH': (2, 'e'),
+	'RGBH': (3, 'e'),
+	'RGBAH': (4, 'e'),
+	'RGBE9995': (1, 'I'),
+	'R16': (1, 'H'),
+	'RG16': (2, 'H'),
+	'RGB16': (3, 'H'),
+	'RGBA16': (4, 'H'),
+	'R16I': (1, 'H'),
+	'RG16I': (2, 'H'),
+	'RGB16I': (3, 'H'),
+	'RGBA16I': (4, 'H'),
+}
+
+# formats packing several channels into one value, a buffer of that layout is more likely plain single channel data
+# (ie a `uint16` height map is R16, not RGBA4444)
+_packed_formats = {
+	'RGBA4444',
+	'RGB565',
+	'RGBE9995',
+}
+
+_layouts_by_format = {}
+_formats_by_layout = {}
+
+
+def _init_layouts():
+	if _layouts_by_format:
+		return
+
+	for name, layout in _format_layouts.items():
+		# formats missing from older engine versions are skipped
+		if (format_ := getattr(godot.Image.Format, f'FORMAT_{name}', None)) is None:
+			continue
+
+		_layouts_by_format[int(format_)] = layout
+
+		if name not in _packed_formats:
+			_formats_by_layout.setdefault(layout, format_)
+
+
+def _get_layout(format_) -> tuple[int, str]:
+	_init_layouts()
+
+	if (layout := _layouts_by_format.get(int(format_))) is None:
+		raise ValueError(f'image format {godot.Image.Format(format_).name} has no pixel layout (compressed?)')
+
+	return layout
+
+
+def get_data_view(image, mipmap: int = 0, *, writable: bool = False) -> memoryview:
+	'''Return a `(height, width, channels)` memoryview of the pixels of a mipmap of `image`, without copying.
+
+	The item format follows the image format (`B` for RGBA8, `f` for RGBAF, `e` for RGBAH, ...). A writable view
+	writes to the image directly::
+
+		pixels = numpy.asarray(image.get_data_view(writable=True))
+		pixels[..., 3] = 255
+	'''
+	channels, item_format = _get_layout(image.get_format())
+
+	if not 0 <= mipmap <= image.get_mipmap_count():
+		raise IndexError(f'mipmap {mipmap} out of range, image has {image.get_mipmap_count()} mipmaps')
+
+	width = max(1, image.get_width() >> mipmap)
+	height = max(1, image.get_height() >> mipmap)
+
+	offset = image.get_mipmap_offset(mipmap)
+	size = width * height * channels * struct.calcsize(item_format)
+
+	data = gde.image_ptrw(image) if writable else gde.image_ptr(image)
+
+	return data[offset:offset + size].cast(item_format, (height, width, channels))
+
+
+def create_from_buffer(data, format_=None) -> 'godot.Image':
+	'''Create an image from a C-contiguous `(height, width[, channels])` buffer, with a single copy.
+
+	The image format is inferred from the number of channels and the item format (ie `uint8` with 4 channels is
+	RGBA8, `float32` with 3 channels RGBF) unless `format_` is given. Packed formats such as RGB565 are only
+	used when given as `format_`.
+	'''
+	view = memoryview(data)
+
+	if not view.c_contiguous:
+		raise ValueError('image data must be C-contiguous')
+
+	if view.ndim not in (2, 3):
+		raise ValueError(f'image data must have shape (height, width[, channels]), got {view.shape}')
+
+	height, width, channels = view.shape if view.ndim == 3 else (*view.shape, 1)
+
+	item_format = view.format.lstrip('@=')
+
+	if sys.byteorder == 'little':
+		item_format = item_format.removeprefix('<')
+
+	if format_ is None:
+		_init_layouts()
+
+		if (format_ := _formats_by_layout.get((channels, item_format))) is None:
+			raise ValueError(f'no image format with {channels} channels of {item_format!r}')
+
+	elif _get_layout(format_) != (channels, item_format):
+		raise ValueError(f'image data with {channels} channels of {item_format!r} does not match format '
+			f'{godot.Image.Format(format_).name}')
+
+	return godot.Image.create_from_data(width, height, False, format_, godot.PackedByteArray(view.cast('B')))
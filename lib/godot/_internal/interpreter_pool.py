@@ -0,0 +1,513 @@
+import os
+import sys
+import importlib
+import atexit
+import pickle
+import queue
+import itertools
+import threading
+import collections.abc
+import concurrent.futures
+
+import __future__
+
+
+# NOTE: Each worker thread owns an isolated sub-interpreter with its own GIL (python 3.12+), so
+# python code running on different workers executes in parallel. The `godot` package can not be
+# imported in sub-interpreters (the native module keeps per-process state), callables and their
+# arguments are pickled and must only use plain python. Variant arguments are converted to plain
+# python values before being sent, results are sent back pickled.
+#
+# Sub-interpreters can't read res:// files, the sources of the project modules imported in the main
+# interpreter are sent to the workers instead and imported from there. Callables defined in project
+# modules can be used as long as their modules don't import `godot`.
+
+
+# the default number of workers of the shared pool, defaults to the number of cpus
+_default_pool_size = int(os.environ.get('GODOT_PYTHON_INTERPRETER_POOL_SIZE', 0)) or os.cpu_count() or 1
+
+# number of chunks each worker gets of a group task, more chunks balance uneven elements better
+_group_chunks_per_worker = 4
+
+
+# runs once in each sub-interpreter, `task` and `channel` are set as globals for each task
+_setup_script = '''
+import sys
+import pickle
+import importlib
+import importlib.abc
+import importlib.util
+
+_channels = importlib.import_module(channels_module)
+
+sys.path[:] = pickle.loads(path)
+
+
+class _ProjectSourceImporter(importlib.abc.MetaPathFinder, importlib.abc.InspectLoader):
+	# project module name -> (filename, source, is_package), source is `None` for namespace packages
+	sources = {}
+
+	def find_spec(self, fullname, path, target=None):
+		if (entry := self.sources.get(fullname)) is None:
+			return None
+
+		filename, source, is_package = entry
+
+		return importlib.util.spec_from_loader(fullname,
+			loader = self if source is not None else None, origin = filename, is_package = is_package)
+
+	def get_source(self, fullname):
+		if (entry := self.sources.get(fullname)) is None:
+			raise ImportError(name = fullname)
+
+		return entry[1]
+
+	def is_package(self, fullname):
+		if (entry := self.sources.get(fullname)) is None:
+			raise ImportError(name = fullname)
+
+		return entry[2]
+
+	def get_code(self, fullname):
+		filename, source, is_package = self.sources[fullname]
+
+		return compile(source, filename, 'exec', flags = compile_flags, dont_inherit = True)
+
+	def exec_module(self, module):
+		exec(self.get_code(module.__name__), module.__dict__)
+
+
+_project_source_importer = _ProjectSourceImporter()
+sys.meta_path.insert(0, _project_source_importer)
+
+
+def _update_sources(sources):
+	_project_source_importer.sources = pickle.loads(sources)
+	importlib.invalidate_caches()
+
+	# import project modules again from the new sources, modules depending on a changed one would keep
+	# references to its old contents so all are dropped
+	for name, module in list(sys.modules.items()):
+		if (getattr(module, '__spec__', None) and module.__spec__.origin or '').startswith('res://'):
+			del sys.modules[name]
+
+
+def _send(channel, data):
+	try:
+		_channels.send(channel, data, blocking=False)
+	except TypeError:
+		_channels.send(channel, data) # no `blocking` argument, never blocks
+
+
+def _run_task(task, channel):
+	try:
+		action, start, stop, args = pickle.loads(task)
+
+		if start is None:
+			result = action(*args)
+		else:
+			result = [action(index, *args) for index in range(start, stop)]
+
+		data = pickle.dumps((True, result))
+
+	except BaseException as exc:
+		try:
+			data = pickle.dumps((False, exc))
+		except Exception:
+			data = pickle.dumps((False, RuntimeError(f'{type(exc).__name__}: {exc}')))
+
+	_send(channel, data)
+'''
+
+_update_sources_script = '_update_sources(sources)'
+
+_task_script = '_run_task(task, channel)'
+
+# flags project modules are compiled with, matching `GodotFileSystemModuleImporter`
+_compile_flags = __future__.annotations.compiler_flag
+
+
+def _import_interpreters():
+	if sys.version_info < (3, 12):
+		raise RuntimeError('sub-interpreters with their own GIL require python 3.12 or newer')
+
+	# the private modules were renamed in python 3.13
+	if sys.version_info >= (3, 13):
+		names = ('_interpreters', '_interpchannels')
+	else:
+		names = ('_xxsubinterpreters', '_xxinterpchannels')
+
+	try:
+		return tuple(importlib.import_module(name) for name in names)
+	except ImportError as exc:
+		raise RuntimeError('sub-interpreters are not available in this python build') from exc
+
+
+def _create_interpreter(interpreters):
+	if sys.version_info >= (3, 13):
+		return interpreters.create('isolated')
+
+	return interpreters.create(isolated=True)
+
+
+def _create_channel(channels):
+	try:
+		return channels.create()
+	except TypeError:
+		return channels.create(1) # python 3.13+ requires how unbound items are handled, remove them
+
+
+def _run_string(interpreters, interpreter_id, script: str, shared: dict):
+	# raises on failure before python 3.13, returns a description of the exception since
+	if (exc_info := interpreters.run_string(interpreter_id, script, shared=shared)) is not None:
+		raise RuntimeError(f'sub-interpreter script failed: {exc_info}')
+
+
+def _recv(channels, channel_id):
+	data = channels.recv(channel_id)
+
+	# newer versions return the object along with how unbound items are handled
+	return data[0] if isinstance(data, tuple) else data
+
+
+def _get_project_sources() -> tuple[int, dict]:
+	'''Return the version and the sources of the res:// modules imported in the main interpreter.'''
+	try:
+		from godot._python_extension import godot_fs_importer
+	except ImportError:
+		return 0, {}
+
+	version, modules = godot_fs_importer.get_executed_modules()
+
+	# parents of modules in directories without an `__init__.py` are namespace packages
+	for name in list(modules):
+		while '.' in name:
+			name = name.rpartition('.')[0]
+
+			if name not in modules:
+				spec = getattr(sys.modules.get(name), '__spec__', None)
+				modules[name] = (spec.origin if spec else None, None, True)
+
+	return version, modules
+
+
+def _get_project_sources_version() -> int:
+	try:
+		from godot._python_extension import godot_fs_importer
+	except ImportError:
+		return 0
+
+	return godot_fs_importer._executed_modules_version
+
+
+def to_shareable(value):
+	'''Return `value` with variants converted to plain python values that can be sent to a sub-interpreter.
+
+	Strings and node paths become `str`, arrays `list` (`bytes` for `PackedByteArray`), dictionaries
+	`dict` and other builtin types a `tuple` of their members (ie `Vector2(1, 2)` becomes `(1.0, 2.0)`).
+	'''
+	if value is None or isinstance(value, (bool, int, float, str, bytes)):
+		return value
+
+	if isinstance(value, list | tuple):
+		return type(value)(map(to_shareable, value))
+
+	if isinstance(value, dict):
+		return {to_shareable(key): to_shareable(item) for key, item in value.items()}
+
+	import godot
+	import godot.types
+	from .api_info import api
+
+	if isinstance(value, godot.String | godot.StringName | godot.NodePath):
+		return str(value)
+
+	if isinstance(value, godot.PackedByteArray):
+		return bytes(value)
+
+	if isinstance(value, godot.Object | godot.RID | godot.Callable | godot.Signal):
+		raise TypeError(f'{type(value).__name__} can not be passed to a sub-interpreter by value')
+
+	if isinstance(value, collections.abc.Mapping):
+		return {to_shareable(key): to_shareable(value[key]) for key in value.keys()}
+
+	if isinstance(value, collections.abc.Sequence):
+		return [to_shareable(item) for item in value]
+
+	if isinstance(value, godot.types.VariantType) \
+		and (type_info := api.builtin_classes.get(type(value).__name__)) and type_info.get('members'):
+		return tuple(to_shareable(getattr(value, member_info.name)) for member_info in type_info.members)
+
+	return value # XXX: let pickle decide
+
+
+class _Worker:
+	def __init__(self, pool: 'InterpreterPool'):
+		self.pool = pool
+		self.thread = threading.Thread(target=self.run, name='godot-interpreter-pool', daemon=True)
+		self.thread.start()
+
+	def run(self):
+		interpreters, channels = self.pool._modules
+
+		interpreter_id = channel_id = None
+
+		try:
+			# the interpreter is only used from this thread and destroyed by it
+			interpreter_id = _create_interpreter(interpreters)
+			channel_id = _create_channel(channels)
+
+			path = pickle.dumps([entry for entry in sys.path if isinstance(entry, str)])
+			_run_string(interpreters, interpreter_id, _setup_script, {
+				'path': path,
+				'channels_module': channels.__name__,
+				'compile_flags': _compile_flags,
+			})
+
+		except BaseException as exc:
+			# without a worker queued tasks may never run, fail them and refuse new ones
+			self.pool._set_broken(exc)
+
+		else:
+			self._run_tasks(interpreters, interpreter_id, channels, channel_id)
+
+		finally:
+			if channel_id is not None:
+				channels.destroy(channel_id)
+			if interpreter_id is not None:
+				interpreters.destroy(interpreter_id)
+
+	def _run_tasks(self, interpreters, interpreter_id, channels, channel_id):
+		sources_version = None
+
+		while (item := self.pool._queue.get())[2] is not None:
+			_, _, task, future = item
+
+			if not future.set_running_or_notify_cancel():
+				continue
+
+			try:
+				# sources are set when tasks are submitted, send them before running a task if they changed
+				if (sources := self.pool._project_sources)[0] != sources_version:
+					_run_string(interpreters, interpreter_id, _update_sources_script,
+						{'sources': sources[1]})
+					sources_version = sources[0]
+
+				_run_string(interpreters, interpreter_id, _task_script,
+					{'task': task, 'channel': channel_id})
+
+				ok, result = pickle.loads(_recv(channels, channel_id))
+
+			except BaseException as exc:
+				future.set_exception(exc)
+
+			else:
+				if ok:
+					future.set_result(result)
+				else:
+					future.set_exception(result)
+
+
+class _GroupTask:
+	def __init__(self, futures: list, chunks: list):
+		self.futures = futures
+		self.chunks = chunks
+
+
+class InterpreterPool:
+	'''Pool of sub-interpreters, each with its own GIL, running python callables in parallel.
+
+	The api follows `godot.WorkerThreadPool`. Callables and arguments are passed by value, they must
+	be picklable and importable without the `godot` package (which is not available in sub-interpreters),
+	variant arguments are converted with `to_shareable`::
+
+		pool = godot.utils.get_interpreter_pool()
+		task_id = pool.add_task(generate_chunk, seed, size)
+		...
+		chunk = pool.wait_for_task_completion(task_id)
+	'''
+
+	def __init__(self, size: int | None = None):
+		self._modules = _import_interpreters()
+
+		self._queue = queue.PriorityQueue()
+		self._counter = itertools.count()
+
+		self._lock = threading.Lock()
+		self._tasks: dict[int, concurrent.futures.Future] = {}
+		self._group_tasks: dict[int, _GroupTask] = {}
+		self._task_ids = itertools.count(1)
+
+		# (version, pickled sources) of the project modules, replaced as a whole when the sources change
+		self._project_sources = (0, pickle.dumps({}))
+
+		self._broken: BaseException | None = None
+		self._shutdown = False
+
+		self._workers = [_Worker(self) for _ in range(size or _default_pool_size)]
+
+		_pools.add(self)
+
+	@property
+	def size(self) -> int:
+		return len(self._workers)
+
+	def _submit(self, action, start, stop, args, high_priority) -> concurrent.futures.Future:
+		if self._shutdown:
+			raise RuntimeError('interpreter pool is shut down')
+
+		task = pickle.dumps((action, start, stop, tuple(map(to_shareable, args))))
+		future = concurrent.futures.Future()
+
+		# checked under the lock so no task is queued after a broken pool failed the queued ones
+		with self._lock:
+			if self._broken is not None:
+				raise RuntimeError('interpreter pool is broken, a worker failed to start') from self._broken
+
+			self._queue.put((0 if high_priority else 1, next(self._counter), task, future))
+
+		return future
+
+	def _update_project_sources(self):
+		# the modules only need to be collected again when a module was imported or reloaded since
+		if _get_project_sources_version() == self._project_sources[0]:
+			return
+
+		version, sources = _get_project_sources()
+
+		with self._lock:
+			if version != self._project_sources[0]:
+				self._project_sources = (version, pickle.dumps(sources))
+
+	def _set_broken(self, exc: BaseException):
+		with self._lock:
+			if self._broken is None:
+				self._broken = exc
+
+		# fail the tasks queued so far, no more are queued once broken
+		error = RuntimeError('interpreter pool worker failed to start')
+		error.__cause__ = exc
+
+		stop_items = []
+
+		try:
+			while True:
+				item = self._queue.get_nowait()
+
+				if (future := item[3]) is None:
+					stop_items.append(item) # keep for the other workers to stop
+				elif future.set_running_or_notify_cancel():
+					future.set_exception(error)
+
+		except queue.Empty:
+			pass
+
+		for item in stop_items:
+			self._queue.put(item)
+
+	def add_task(self, action, *args, high_priority: bool = False) -> int:
+		'''Call `action(*args)` in a sub-interpreter, returns the task id.'''
+		self._update_project_sources()
+
+		future = self._submit(action, None, None, args, high_priority)
+
+		with self._lock:
+			task_id = next(self._task_ids)
+			self._tasks[task_id] = future
+
+		return task_id
+
+	def is_task_completed(self, task_id: int) -> bool:
+		return self._tasks[task_id].done()
+
+	def wait_for_task_completion(self, task_id: int):
+		'''Wait for the task and return its result, or raise its exception. Each task must be waited for once.'''
+		with self._lock:
+			future = self._tasks.pop(task_id)
+
+		return future.result()
+
+	def add_group_task(self, action, elements: int, *args, tasks_needed: int = -1,
+		high_priority: bool = False) -> int:
+		'''Call `action(index, *args)` for each index in `range(elements)`, split between sub-interpreters.'''
+		if tasks_needed < 0:
+			tasks_needed = self.size * _group_chunks_per_worker
+
+		tasks_needed = max(1, min(tasks_needed, elements))
+
+		bounds = [elements * i // tasks_needed for i in range(tasks_needed + 1)]
+		chunks = list(zip(bounds, bounds[1:]))
+
+		self._update_project_sources()
+
+		futures = [self._submit(action, start, stop, args, high_priority) for start, stop in chunks]
+
+		with self._lock:
+			group_id = next(self._task_ids)
+			self._group_tasks[group_id] = _GroupTask(futures, chunks)
+
+		return group_id
+
+	def is_group_task_completed(self, group_id: int) -> bool:
+		return all(future.done() for future in self._group_tasks[group_id].futures)
+
+	def get_group_processed_element_count(self, group_id: int) -> int:
+		group = self._group_tasks[group_id]
+		return sum(stop - start for future, (start, stop) in zip(group.futures, group.chunks) if future.done())
+
+	def wait_for_group_task_completion(self, group_id: int) -> list:
+		'''Wait for the group task and return the results in element order.'''
+		with self._lock:
+			group = self._group_tasks.pop(group_id)
+
+		return list(itertools.chain.from_iterable(future.result() for future in group.futures))
+
+	def shutdown(self, cancel_pending: bool = False):
+		'''Stop the workers and destroy their sub-interpreters, waiting for running tasks.'''
+		if self._shutdown:
+			return
+
+		self._shutdown = True
+		_pools.discard(self)
+
+		if cancel_pending:
+			try:
+				while True:
+					self._queue.get_nowait()[3].cancel()
+			except queue.Empty:
+				pass
+
+		# sorts after all pending tasks
+		for _ in self._workers:
+			self._queue.put((2, next(self._counter), None, None))
+
+		for worker in self._workers:
+			worker.thread.join()
+
+	def __enter__(self):
+		return self
+
+	def __exit__(self, *exc_info):
+		self.shutdown()
+
+
+_pools: set[InterpreterPool] = set()
+_default_pool: InterpreterPool | None = None
+_default_pool_lock = threading.Lock()
+
+
+def get_default_pool() -> InterpreterPool:
+	global _default_pool
+
+	with _default_pool_lock:
+		if _default_pool is None:
+			_default_pool = InterpreterPool()
+
+		return _default_pool
+
+
+@atexit.register
+def _shutdown_pools():
+	# sub-interpreters must be destroyed before the main interpreter finalizes
+	for pool in list(_pools):
+		pool.shutdown(cancel_pending=True)
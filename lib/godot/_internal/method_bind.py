@@ -1,15 +1,18 @@
+import os
 import textwrap
 import itertools
 import functools
 import collections.abc
 import copy
 import contextlib
+import inspect
 
 import _gdextension as gde
 
 import godot
 
 from . import utils
+from . import binding_cache
 from .utils import doc_utils
 
 from .utils import apply_attrs
@@ -27,6 +30,47 @@ import keyword
 _method_bind_fail_warn_and_continue = True
 
 
+# set to `True` to call bound methods through a native wrapper that fills in keyword and default arguments
+# set to `False` to call bound methods through the generated python function
+_native_method_wrappers = not os.environ.get('GODOT_PYTHON_DISABLE_NATIVE_METHOD_WRAPPERS')
+
+
+# engine methods called with the GIL released, letting other python threads run while the call blocks
+# releasing the GIL has a small cost on every call so only methods known to block or run long are listed
+# `'*'` releases the GIL for all methods of a class, more can be added with the environment variable
+# `GODOT_PYTHON_RELEASE_GIL_METHODS` as a comma separated list of `Class.method` or `Class.*`
+_release_gil_methods = {
+	'ResourceLoader': {'load', 'load_threaded_get'},
+	'ResourceSaver': {'save'},
+	'Image': {
+		'load', 'save_png', 'save_jpg', 'save_webp', 'save_exr',
+		'save_png_to_buffer', 'save_jpg_to_buffer', 'save_webp_to_buffer', 'save_exr_to_buffer',
+		'load_png_from_buffer', 'load_jpg_from_buffer', 'load_webp_from_buffer',
+		'compress', 'decompress', 'resize', 'generate_mipmaps',
+	},
+	'PhysicsDirectSpaceState2D': {'intersect_ray', 'intersect_point', 'intersect_shape', 'cast_motion', 'collide_shape'},
+	'PhysicsDirectSpaceState3D': {'intersect_ray', 'intersect_point', 'intersect_shape', 'cast_motion', 'collide_shape'},
+	'NavigationServer2D': {'map_get_path', 'bake_from_source_geometry_data'},
+	'NavigationServer3D': {'map_get_path', 'bake_from_source_geometry_data'},
+	'FileAccess': {'get_file_as_bytes', 'get_file_as_string', 'get_buffer', 'store_buffer'},
+	'OS': {'delay_msec', 'delay_usec', 'execute'},
+	'HTTPClient': {'poll'},
+	'Thread': {'wait_to_finish'},
+	'Mutex': {'lock'},
+	'Semaphore': {'wait'},
+	'WorkerThreadPool': {'wait_for_task_completion', 'wait_for_group_task_completion'},
+}
+
+for _name in filter(None, os.environ.get('GODOT_PYTHON_RELEASE_GIL_METHODS', '').split(',')):
+	_class_name, _, _method_name = _name.strip().partition('.')
+	_release_gil_methods.setdefault(_class_name, set()).add(_method_name)
+
+
+def _should_release_gil(class_name: str, method_name: str) -> bool:
+	methods = _release_gil_methods.get(class_name, ())
+	return method_name in methods or '*' in methods
+
+
 if _method_bind_fail_warn_and_continue:
 	_configured_warn_and_continue_or_raise = utils.print_exceptions_and_continue
 else:
@@ -168,12 +212,19 @@ def bind_method(cls, type_info, method_info, with_docs=True):
 				class_method_info,
 				method_info.hash
 			)
-		else:
+		elif is_variant_type:
 			method = get_method(
-				TypeInfo.from_api_info_type_string(type_info.name).variant_type if is_variant_type else type_info.name,
+				TypeInfo.from_api_info_type_string(type_info.name).variant_type,
 				class_method_info,
 				method_info.hash
 			)
+		else:
+			method = get_method(
+				type_info.name,
+				class_method_info,
+				method_info.hash,
+				release_gil = _should_release_gil(type_info.name, method_info.name),
+			)
 
 	else:
 		# XXX: virtual method?
@@ -197,42 +248,55 @@ def bind_method(cls, type_info, method_info, with_docs=True):
 
 	if is_utility:
 		method_impl_name = f'_{method_info.name}_impl'
+		full_method_name = f'{method_name}'
 	else:
 		method_impl_name = f'_{type_info.name}_{method_info.name}_impl'
+		full_method_name = f'{type_info.name}.{method_name}'
 
-	arg_infos = [ArgumentInfo(arg_info) for arg_info in method_info.get('arguments', [])]
-
-	if with_docs or any(arg_info.default_value is not utils.unspecified for arg_info in arg_infos):
-		if not method_info.get('is_static') and not is_utility:
-			arg_infos.insert(0, ArgumentInfo.self_argument)
+	code_filename = f'<godot.{full_method_name}>'
 
-		if method_info.get('is_vararg'): # XXX
-			arg_infos.append(ArgumentInfo.args_argument)
+	# the generated code differs with and without docs, cache both separately
+	code_cache_key = code_filename if with_docs else f'{code_filename} without docs'
 
-		arg_names = [arg_info.name for arg_info in arg_infos]
-		arg_docs = [arg_info.doc for arg_info in arg_infos]
+	# skip generating the wrapper code if a compiled version is already cached
+	method_code = None
+	method_code_obj = binding_cache.get(code_cache_key)
 
-		ret_type_name = utils.type_name_from_prop_info(return_value_info)
-		ret_doc = f' -> {ret_type_name}' if ret_type_name else ''
+	if method_code_obj is None:
+		arg_infos = [ArgumentInfo(arg_info) for arg_info in method_info.get('arguments', [])]
 
+	if method_code_obj is not None or with_docs or any(arg_info.default_value is not utils.unspecified for arg_info in arg_infos):
 		def method_not_implemented(func):
 			func._not_implemented = True # XXX
 			return func
 
-		decorators = []
+		if method_code_obj is None:
+			if not method_info.get('is_static') and not is_utility:
+				arg_infos.insert(0, ArgumentInfo.self_argument)
 
-		if 'hash' not in method_info or method_info.get('is_virtual'): # XXX
-			decorators.append('@method_not_implemented')
+			if method_info.get('is_vararg'): # XXX
+				arg_infos.append(ArgumentInfo.args_argument)
 
-		if method_info.get('is_static'):
-			decorators.append('@staticmethod')
+			arg_names = [arg_info.name for arg_info in arg_infos]
+			arg_docs = [arg_info.doc for arg_info in arg_infos]
 
-		method_code = textwrap.dedent(f'''
-				def {method_name}({', '.join(arg_docs)}){ret_doc}:
-					return {method_impl_name}({', '.join(arg_names)})
-			''').lstrip()
+			ret_type_name = utils.type_name_from_prop_info(return_value_info)
+			ret_doc = f' -> {ret_type_name}' if ret_type_name else ''
 
-		method_code = '\n'.join([*decorators, method_code, ''])
+			decorators = []
+
+			if 'hash' not in method_info or method_info.get('is_virtual'): # XXX
+				decorators.append('@method_not_implemented')
+
+			if method_info.get('is_static'):
+				decorators.append('@staticmethod')
+
+			method_code = textwrap.dedent(f'''
+					def {method_name}({', '.join(arg_docs)}){ret_doc}:
+						return {method_impl_name}({', '.join(arg_names)})
+				''').lstrip()
+
+			method_code = '\n'.join([*decorators, method_code, ''])
 
 		namespace = dict(
 			godot = godot,
@@ -242,15 +306,14 @@ def bind_method(cls, type_info, method_info, with_docs=True):
 			}
 		)
 
-		if is_utility:
-			full_method_name = f'{method_name}'
-		else:
-			full_method_name = f'{type_info.name}.{method_name}'
-
 		with utils.exception_note(
-			lambda: f'While binding method \'{full_method_name}\' with code:\n' + method_code
+			lambda: f'While binding method \'{full_method_name}\' with code:\n' + (method_code or '<cached>')
 		):
-			exec(compile(method_code, f'<godot.{full_method_name}>', 'exec'), namespace)
+			if method_code_obj is None:
+				method_code_obj = compile(method_code, code_filename, 'exec')
+				binding_cache.put(code_cache_key, method_code_obj)
+
+			exec(method_code_obj, namespace)
 
 		method = namespace.get(method_name)
 
@@ -272,6 +335,21 @@ def bind_method(cls, type_info, method_info, with_docs=True):
 		if docs := method_info.get('description'):
 			method.__doc__ = doc_utils.reformat_doc_bbcode(docs)
 
+		if _native_method_wrappers and 'hash' in method_info and not method_info.get('is_virtual'):
+			# the generated function is kept as `__wrapped__` for its signature
+			method = _make_native_method_wrapper(method, namespace[method_impl_name],
+				is_method = not is_utility and not method_info.get('is_static'))
+
+	if not is_utility and not is_variant_type and 'hash' in method_info and not method_info.get('is_virtual') \
+		and not method_info.get('is_static') and not method_info.get('is_vararg'):
+		# `godot.Node2D.set_position.batch(nodes, positions)` calls the method on each object natively, the
+		# arguments are sequences or buffers (ie a `PackedVector2Array` or a `(N, 2)` float32 array)
+		batch = _method_batches[(type_info.name, method_name)] = MethodBatch(
+			type_info.name, class_method_info, method_info.hash)
+
+		if hasattr(method, '__dict__'):
+			method.batch = batch
+
 	setattr(cls, method_name, method)
 
 	if is_utility:
@@ -280,6 +358,68 @@ def bind_method(cls, type_info, method_info, with_docs=True):
 		utils.set_method_info(f'godot.{type_info.name}', method_name, class_method_info)
 
 
+class MethodBatch:
+	'''Calls a class method on many objects at once, the native batch call is created on first use.'''
+
+	__slots__ = ('_class_name', '_method_info', '_hash', '_batch')
+
+	def __init__(self, class_name: str, method_info: gde.GDExtensionClassMethodInfo, hash_: int):
+		self._class_name = class_name
+		self._method_info = method_info
+		self._hash = hash_
+		self._batch = None
+
+	def __repr__(self):
+		return f'<{type(self).__name__} {self._class_name}.{self._method_info.name}>'
+
+	def __call__(self, *args, **kwargs):
+		if (batch := self._batch) is None:
+			batch = self._batch = gde.classdb_get_method_bind_batch(
+				self._class_name, self._method_info, self._hash)
+
+		return batch(*args, **kwargs)
+
+
+# batch calls of bound class methods by class and method name, also for methods that can't hold a `batch` attribute
+_method_batches: dict[tuple[str, str], MethodBatch] = {}
+
+
+def get_method_batch(cls: type, method_name: str) -> MethodBatch | None:
+	'''Return the batch call of the method `method_name` of the godot class `cls` or its bases.'''
+	getattr(cls, method_name) # bind the method if it isn't yet
+
+	for base in cls.__mro__:
+		if base.__module__ == 'godot' and (batch := _method_batches.get((base.__name__, method_name))):
+			return batch
+
+	return None
+
+
+def _make_native_method_wrapper(method, impl, *, is_method: bool):
+	'''Return a native callable calling `impl` with the arguments and defaults of the generated `method`.'''
+	func = method.__func__ if isinstance(method, staticmethod) else method
+	code = func.__code__
+
+	wrapper = gde.make_method_wrapper(impl,
+		code.co_varnames[:code.co_argcount],
+		func.__defaults__ or (),
+		is_method = is_method,
+		is_vararg = bool(code.co_flags & inspect.CO_VARARGS),
+	)
+
+	wrapper.__module__ = method.__module__
+	wrapper.__name__ = method.__name__
+	wrapper.__qualname__ = method.__qualname__
+	wrapper.__doc__ = method.__doc__
+	wrapper.__wrapped__ = func
+
+	return staticmethod(wrapper) if isinstance(method, staticmethod) else wrapper
+
+
+# limit of argument type combinations remembered per variant type constructor
+_max_cached_constructor_arg_types = 256
+
+
 @utils.with_context
 def bind_variant_constructors(cls, type_info):
 	global TypeInfo
@@ -290,8 +430,11 @@ def bind_variant_constructors(cls, type_info):
 	constructor_cases = []
 	case_doc_patterns = []
 
-	def constructor_name(index) -> str:
-		return f'_{type_info.name}_constructor_{index}'
+	code_filename = f'<godot.{cls.__qualname__}.__init__>'
+
+	# skip generating the constructor code if a compiled version is already cached
+	constructor_code = None
+	constructor_code_obj = binding_cache.get(code_filename)
 
 	for constructor_info in type_info.constructors:
 		assert(constructor_info.index == len(constructors))
@@ -311,7 +454,8 @@ def bind_variant_constructors(cls, type_info):
 			constructor_info.index
 		))
 
-		arg_casts = []
+		if constructor_code_obj is not None and constructors[-1] is not None:
+			continue
 
 		arg_infos = [ArgumentInfo(arg_info) for arg_info in constructor_info.get('arguments', [])]
 
@@ -319,12 +463,17 @@ def bind_variant_constructors(cls, type_info):
 				', '.join(arg_info.match_pattern for arg_info in arg_infos)
 			}{', ' if len(arg_infos) == 1 else ''})'''
 
-		cast_arg_casts = ', '.join(arg
-			for arg in ['self'] + [arg_infos[i].cast(f'args[{i}]') for i in range(len(arg_infos))])
+		arg_casts = [arg_infos[i].cast(f'args[{i}]') for i in range(len(arg_infos))]
+
+		if arg_casts == [f'args[{i}]' for i in range(len(arg_infos))]:
+			# arguments are passed as is, the constructor can be cached by argument types
+			case_result = f'{constructor_info.index}, None'
+		else:
+			case_result = f'''{constructor_info.index}, ({', '.join(arg_casts)}{', ' if len(arg_casts) == 1 else ''})'''
 
 		constructor_cases.append(textwrap.dedent(f'''
 				case {case_match_pattern}:
-					{constructor_name(constructor_info.index)}({cast_arg_casts})
+					return {case_result}
 			''').strip())
 
 		case_doc_patterns.append(f'''({', '.join(arg_info.type for arg_info in arg_infos)})''') # XXX: builtin?
@@ -337,7 +486,7 @@ def bind_variant_constructors(cls, type_info):
 				)
 
 	namespace = {
-		constructor_name(index): constructor for index, constructor in enumerate(constructors)
+		'_constructors': constructors,
 	}
 
 	if cls.__name__ in ['String', 'StringName']:
@@ -351,7 +500,7 @@ def bind_variant_constructors(cls, type_info):
 		#			__builtin_init__(self, *args)
 		#	''').strip())
 
-	else:
+	if constructor_code_obj is None:
 		error_msg = textwrap.dedent(f'''
 			no matching constructor for {cls.__qualname__}
 			called with:
@@ -370,26 +519,52 @@ def bind_variant_constructors(cls, type_info):
 				raise TypeError(msg)
 			''').strip())
 
-	constructor_code = textwrap.dedent(f'''
-		# constructor for {cls.__name__}
+		# the `match` in `_select_constructor` is only evaluated the first time `__init__` is called with
+		# a given tuple of argument types, after that the matched constructor is looked up by the types
+		# directly, calls needing implicit casts always take the slow path
+
+		constructor_code = textwrap.dedent(f'''
+			# constructor for {cls.__name__}
+
+			import collections.abc # XXX
+			import enum # XXX
+			import typing # XXX
+
+			import textwrap # XXX
+
+			import godot
+
+			def _select_constructor(args):
+				match args:
+					{"""
+					""".join(itertools.chain(*(case.splitlines() for case in constructor_cases)))}
 
-		import collections.abc # XXX
-		import enum # XXX
-		import typing # XXX
+			_constructors_by_arg_types = {{}}
 
-		import textwrap # XXX
+			def __init__(self, *args):
+				arg_types = tuple(map(type, args))
 
-		import godot
+				if (constructor := _constructors_by_arg_types.get(arg_types)) is None:
+					index, cast_args = _select_constructor(args)
 
-		def __init__(self, *args):
-			match args:
-				{"""
-				""".join(itertools.chain(*(case.splitlines() for case in constructor_cases)))}
-	''')
+					if cast_args is not None:
+						return _constructors[index](self, *cast_args)
 
+					constructor = _constructors[index]
 
-	with utils.exception_note(lambda: f'Constructor code:\n\n{constructor_code}'):
-		exec(compile(constructor_code, f'<godot.{cls.__qualname__}.__init__>', 'exec'), namespace)
+					if len(_constructors_by_arg_types) < {_max_cached_constructor_arg_types}:
+						_constructors_by_arg_types[arg_types] = constructor
+
+				constructor(self, *args)
+		''')
+
+
+	with utils.exception_note(lambda: f'Constructor code:\n\n{constructor_code or "<cached>"}'):
+		if constructor_code_obj is None:
+			constructor_code_obj = compile(constructor_code, code_filename, 'exec')
+			binding_cache.put(code_filename, constructor_code_obj)
+
+		exec(constructor_code_obj, namespace)
 
 	method = namespace.get('__init__')
 
@@ -455,6 +630,51 @@ def _init_op_mapping():
 	})
 
 
+def _make_operator_dispatcher():
+	'''Create a binary operator method dispatching on the type of the right hand operand.
+
+	Operators are registered with `register(type_, op)`, the operator for a given operand type is
+	resolved once, like `functools.singledispatch`, then looked up by the exact type afterwards.
+	'''
+
+	registry = {}
+	dispatch_cache = {}
+
+	missing = utils.unspecified
+
+	def resolve(other_type):
+		# exact and base classes first, then abstract base classes, `object` last
+		for base in other_type.__mro__[:-1]:
+			if (op := registry.get(base)) is not None:
+				return op
+
+		for registered_type, op in registry.items():
+			if registered_type is not object and issubclass(other_type, registered_type):
+				return op
+
+		return registry.get(object)
+
+	def register(type_, op):
+		registry[type_] = op
+		dispatch_cache.clear()
+
+	def dispatcher(self, other):
+		other_type = type(other)
+
+		if (op := dispatch_cache.get(other_type, missing)) is missing:
+			op = dispatch_cache[other_type] = resolve(other_type)
+
+		if op is None:
+			return NotImplemented
+
+		return op(self, other)
+
+	dispatcher.register = register
+	dispatcher.registry = registry
+
+	return dispatcher
+
+
 def _bind_op(cls, type_info, op_info, method_name, op_enum, reverse=False):
 	reversed_args = (method_name in ('__contains__', )) or reverse
 	is_unary = method_name in ('__neg__', '__pos__', '__inv__', '__not__')
@@ -497,19 +717,20 @@ def _bind_op(cls, type_info, op_info, method_name, op_enum, reverse=False):
 				f'''invalid operator evaluator: {left_type.__name__}.{method_name}({right_type.__name__}) -> {op_info.return_type}'''
 			)
 
-	def register(method_name, op):
-		op.__name__ = method_name
-		op.__qualname__ = f'{left_type.__name__}.{op.__name__}'
-		op.__module__ = 'godot'
-
+	def register(method_name, op, is_non_const_method=False):
 		if (not hasattr(left_type, method_name)
 			or not hasattr(getattr(left_type, method_name), 'register')
 		):
-			default_op = functools.singledispatchmethod(lambda self, other: NotImplemented)
-			utils.swap_members(left_type, method_name, default_op)
+			dispatcher = _make_operator_dispatcher()
 
-			if hasattr(op, '_is_non_const_method'):
-				default_op._is_non_const_method = op._is_non_const_method # XXX
+			dispatcher.__name__ = method_name
+			dispatcher.__qualname__ = f'{left_type.__name__}.{method_name}'
+			dispatcher.__module__ = 'godot'
+
+			utils.swap_members(left_type, method_name, dispatcher)
+
+			if is_non_const_method:
+				dispatcher._is_non_const_method = True # XXX
 
 		getattr(left_type, method_name).register(right_type, op)
 
@@ -535,7 +756,7 @@ def _bind_op(cls, type_info, op_info, method_name, op_enum, reverse=False):
 
 
 	if not reversed_args:
-		op = lambda self, other: op_eval(self, other)
+		op = op_eval # called directly with `(self, other)`
 	else:
 		op = lambda self, other: op_eval(other, self)
 
@@ -551,15 +772,43 @@ def _bind_op(cls, type_info, op_info, method_name, op_enum, reverse=False):
 
 		_iop_type = left_type
 
-		def iop(self, other):
+		def iop_fallback(self, other):
 			_iop_type.__init__(self, op_eval(self, other)) # XXX: __init__
 			return self
 
-		iop._is_non_const_method = True # XXX
+		# the result is evaluated directly into the storage of `self`, avoiding the temporary result
+		# and the `__init__` call to copy it back, `iop_fallback` is used if `self` isn't held by a variant
+		iop = gde.variant_get_ptr_operator_evaluator_inplace(
+				op_enum,
+				TypeInfo.from_api_info_type_string(type_info.name).variant_type,
+				TypeInfo.from_api_info_type_string(op_info.right_type).variant_type,
+				iop_fallback,
+			)
+
+		register(method_name, iop or iop_fallback, is_non_const_method=True)
+
+
+
+
+def _get_variant_slice(self, index: slice):
+	start, stop, step = index.indices(len(self))
+
+	if step == 1:
+		if stop <= start:
+			return type(self)()
+
+		return self.slice(start, stop)
 
-		register(method_name, iop)
+	return type(self)([self[i] for i in range(start, stop, step)])
 
 
+def _get_string_slice(self, index: slice):
+	start, stop, step = index.indices(len(self))
+
+	if step == 1:
+		return self.substr(start, max(stop - start, 0))
+
+	return type(self)(str(self)[index])
 
 
 @utils.with_context
@@ -567,6 +816,8 @@ def bind_variant_operators(cls, type_info):
 	_init_op_mapping()
 
 	if indexing_return_type := type_info.get('indexing_return_type'):
+		native_indexing = False
+
 		if type_info.get('is_keyed'):
 			getter = gde.variant_get_ptr_keyed_getter(
 				TypeInfo.from_api_info_type_string(type_info.name).variant_type,
@@ -593,10 +844,33 @@ def bind_variant_operators(cls, type_info):
 				TypeInfo.from_api_info_type_string(type_info.name).variant_type,
 				TypeInfo.from_api_info_type_string(indexing_return_type).variant_type)
 
-			if type_info.methods.get('size') or type_info.get('members') or (type_info.name == 'String'): #TODO: slice
+			native_indexing = bool(type_info.methods.get('size') or (type_info.name == 'String'))
+
+			if native_indexing:
+				# bounds checks and iteration are handled natively, slices are passed to the slice getter
+				convert = str if indexing_return_type in ['String', 'StringName'] else None # XXX: cast to str?
+
+				__getitem__ = gde.variant_get_ptr_indexed_getter_checked(
+					TypeInfo.from_api_info_type_string(type_info.name).variant_type,
+					TypeInfo.from_api_info_type_string(indexing_return_type).variant_type,
+					_get_string_slice if type_info.name == 'String' else _get_variant_slice,
+					convert)
+
+				__setitem__ = gde.variant_get_ptr_indexed_setter_checked(
+					TypeInfo.from_api_info_type_string(type_info.name).variant_type,
+					TypeInfo.from_api_info_type_string(indexing_return_type).variant_type)
+
+				for method_name, reversed_ in (('__iter__', False), ('__reversed__', True)):
+					utils.swap_members(cls, method_name, gde.variant_get_indexed_iterator(
+						TypeInfo.from_api_info_type_string(type_info.name).variant_type,
+						TypeInfo.from_api_info_type_string(indexing_return_type).variant_type,
+						reversed_,
+						convert))
+
+			elif type_info.get('members'):
 				def __getitem__(self, index):
 					if index < 0:
-						index = len(self) - index
+						index += len(self)
 						if index < 0:
 							raise IndexError
 					if index >= len(self):
@@ -605,7 +879,7 @@ def bind_variant_operators(cls, type_info):
 
 				def __setitem__(self, index, value):
 					if index < 0:
-						index = len(self) - index
+						index += len(self)
 						if index < 0:
 							raise IndexError
 					if index >= len(self):
@@ -632,7 +906,7 @@ def bind_variant_operators(cls, type_info):
 					f'''invalid indexed setter: {type_info.name}[int] = {indexing_return_type}'''
 				)
 
-		if indexing_return_type in ['String', 'StringName']:
+		if indexing_return_type in ['String', 'StringName'] and not native_indexing:
 			__getitem__inner = __getitem__
 			__getitem__ = lambda self, key: str(__getitem__inner(self, key)) # XXX: cast to str?
 
@@ -658,11 +932,35 @@ def bind_variant_operators(cls, type_info):
 
 		method_name, op_enum = _op_mapping_inv[op_info.name]
 
+		if method_name == '__contains__':
+			continue # bound below by the container type
+
 		with utils.exception_note(lambda: f'While binding operator {cls.__name__}.{method_name}'):
 			_bind_op(cls, type_info, op_info, method_name, op_enum)
 
 
+	# `in` operators are listed by the element type but registered on the container type, bind all of
+	# them here so the container doesn't depend on the element types having been bound first
 
+	for op_type, op_info in _get_contains_ops().get(type_info.name, ()):
+		method_name, op_enum = _op_mapping_inv[op_info.name]
+
+		with utils.exception_note(lambda: f'While binding operator {cls.__name__}.{method_name}'):
+			_bind_op(cls, op_type, op_info, method_name, op_enum)
+
+
+	for op_type, op_info in _get_reverse_ops():
+		if op_info.right_type == type_info.name:
+			method_name, op_enum = _op_mapping_inv[op_info.name]
+			method_name = method_name.replace('__', '__r', 1)
+
+			#print(type_info.name, op_type.name, method_name)
+
+			_bind_op(cls, op_type, op_info, method_name, op_enum, reverse=True)
+
+
+@functools.cache
+def _get_reverse_ops() -> tuple:
 	reverse_ops = []
 
 	for type_ in (api.builtin_classes.int, api.builtin_classes.float):
@@ -675,14 +973,58 @@ def bind_variant_operators(cls, type_info):
 
 			reverse_ops.append((type_, op))
 
+	return tuple(reverse_ops)
 
-	for op_type, op_info in reverse_ops:
-		if op_info.right_type == type_info.name:
-			method_name, op_enum = _op_mapping_inv[op_info.name]
-			method_name = method_name.replace('__', '__r', 1)
 
-			#print(type_info.name, op_type.name, method_name)
+@functools.cache
+def _get_contains_ops() -> dict:
+	_init_op_mapping()
+
+	contains_ops = {}
+
+	for type_info in api.builtin_classes:
+		# XXX: same as the variant types bound in `module_machinery`
+		if type_info.name.islower() or type_info.name in ('Nil', 'RID', 'Object', 'Variant'):
+			continue
+
+		for op_info in type_info.get('operators', []):
+			if op_info.name in _op_mapping_inv and _op_mapping_inv[op_info.name][0] == '__contains__':
+				contains_ops.setdefault(op_info.right_type, []).append((type_info, op_info))
+
+	return contains_ops
 
-			_bind_op(cls, op_type, op_info, method_name, op_enum, reverse=True)
 
+def get_variant_operator_names(type_info) -> set[str]:
+	'''Return the names of the operator methods `bind_variant_operators` may set for `type_info`.'''
+	_init_op_mapping()
+
+	names = set()
+
+	if type_info.get('indexing_return_type'):
+		names.update(('__getitem__', '__setitem__', '__len__'))
+
+		if not type_info.get('is_keyed') and (type_info.methods.get('size') or type_info.name == 'String'):
+			names.update(('__iter__', '__reversed__'))
+
+	for op_info in type_info.get('operators', []):
+		if op_info.name not in _op_mapping_inv:
+			continue
+
+		method_name, op_enum = _op_mapping_inv[op_info.name]
+
+		if method_name == '__contains__':
+			continue
+
+		names.add(method_name)
+
+		if op_info.get('right_type') and op_info.return_type == type_info.name:
+			names.add(method_name.replace('__', '__i', 1))
+
+	if type_info.name in _get_contains_ops():
+		names.add('__contains__')
+
+	for op_type, op_info in _get_reverse_ops():
+		if op_info.right_type == type_info.name:
+			names.add(_op_mapping_inv[op_info.name][0].replace('__', '__r', 1))
 
+	return names
@@ -1,3 +1,4 @@
+import os
 import sys
 import types
 import importlib.abc
@@ -21,6 +22,13 @@ logger = logging.Logger('godot')
 
 _singleton_names = set(singleton.name for singleton in api.singletons)
 
+# set to `True` to bind builtin variant types and utility functions on first use
+# set to `False` to bind all of them while initializing the module
+_lazy_builtin_binding = not os.environ.get('GODOT_PYTHON_EAGER_BUILTIN_BINDING')
+
+# variant types used while initializing the module, always bound immediately
+_variant_type_names_to_bind_eagerly = ('String', 'StringName', 'Callable', 'Dictionary', 'Array')
+
 _Engine = None
 
 
@@ -70,18 +78,31 @@ def initialize_module():
 		from . import typed_arrays
 
 		for type_info in variant_types_to_bind:
-			type_bind.bind_variant_type(type_info)
+			if _lazy_builtin_binding and type_info.name not in _variant_type_names_to_bind_eagerly:
+				type_bind.bind_variant_type_lazily(type_info)
+			else:
+				type_bind.bind_variant_type(type_info)
 
 		from . import variant_types # XXX
 
-	# bind utilities
+	# bind utilities, bound in `_module_getattr` when first used if lazy
 
-	with utils.timer('utility binding'):
-		for info in api.utility_functions:
-			method_bind.bind_method(godot, None, info)
+	if not _lazy_builtin_binding:
+		with utils.timer('utility binding'):
+			for info in api.utility_functions:
+				method_bind.bind_method(godot, None, info)
 
 
 def _module_getattr(key):
+	with type_bind.binding_lock:
+		# another thread may have bound it while this one was waiting
+		if (res := vars(godot).get(key)) is not None:
+			return res
+
+		return _bind_module_attr(key)
+
+
+def _bind_module_attr(key):
 	global _singleton_names, _Engine
 
 	if class_info := api.classes.get(key):
@@ -115,6 +136,12 @@ def _module_getattr(key):
 
 		return res
 
+	if utility_info := api.utility_functions.get(key):
+		method_bind.bind_method(godot, None, utility_info)
+
+		if (res := vars(godot).get(key)) is not None:
+			return res
+
 	raise AttributeError(
 		f'module {godot.__name__!r} has no attribute {key!r}')
 
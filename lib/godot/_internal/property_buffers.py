@@ -0,0 +1,100 @@
+import godot
+
+
+# packed array types holding values of a property type with the same layout as returned by a getter
+_packed_array_type_names = {
+	'int': 'PackedInt64Array',
+	'float': 'PackedFloat64Array',
+	'Vector2': 'PackedVector2Array',
+	'Vector3': 'PackedVector3Array',
+	'Vector4': 'PackedVector4Array',
+	'Color': 'PackedColorArray',
+}
+
+
+def _get_property_info(cls: type, name: str):
+	'''Return the api info of the class defining the property `name` for objects of type `cls` and the property info.'''
+	from .api_info import api
+
+	for base in cls.__mro__:
+		if base.__module__ == 'godot' and (class_info := api.classes.get(base.__name__)):
+			break
+	else:
+		raise TypeError(f'{cls.__qualname__!r} is not a godot class')
+
+	while class_info:
+		for prop_info in class_info.get('properties', []):
+			if prop_info.name == name:
+				return class_info, prop_info
+
+		class_info = api.classes.get(class_info.get('inherits')) if class_info.get('inherits') else None
+
+	raise AttributeError(f'{cls.__qualname__!r} has no property {name!r}')
+
+
+def _get_accessor_batch(objects, name: str, accessor: str):
+	if not objects:
+		return None, None, ()
+
+	class_info, prop_info = _get_property_info(type(objects[0]), name)
+
+	if not (method_name := prop_info.get(accessor)):
+		raise AttributeError(f'property {class_info.name}.{name} has no {accessor}')
+
+	from . import method_bind
+
+	if (batch := method_bind.get_method_batch(getattr(godot, class_info.name), method_name)) is None:
+		raise TypeError(f'{class_info.name}.{method_name} can not be called in batches')
+
+	# indexed properties share an accessor taking the index as first argument
+	index_args = ([prop_info.index] * len(objects), ) if 'index' in prop_info else ()
+
+	return batch, prop_info, index_args
+
+
+def gather(objects, name: str, out=None):
+	'''Read the property `name` of each object with a single call.
+
+	Returns a packed array for `int`, `float`, `Vector2`, `Vector3`, `Vector4` and `Color` properties, a list
+	otherwise. If `out` is given the values are written to it instead, any writable buffer with the layout of the
+	property type (ie a `PackedVector2Array` or a `(N, 2)` float32 numpy array for `Vector2`)::
+
+		positions = numpy.empty((len(nodes), 2), numpy.float32)
+		godot.gather(nodes, 'global_position', positions)
+	'''
+	objects = objects if isinstance(objects, list | tuple) else list(objects)
+
+	batch, prop_info, index_args = _get_accessor_batch(objects, name, 'getter')
+
+	if batch is None:
+		return out if out is not None else []
+
+	if out is None and (packed_array_type_name := _packed_array_type_names.get(prop_info.type)):
+		from godot.types import writable_memoryview
+
+		res = getattr(godot, packed_array_type_name)()
+		res.resize(len(objects))
+
+		batch(objects, *index_args, out=writable_memoryview(res))
+
+		return res
+
+	return batch(objects, *index_args, out=out)
+
+
+def scatter(objects, name: str, values):
+	'''Write the property `name` of each object with a single call.
+
+	`values` holds one value for each object, a sequence or any buffer with the layout of the property type (ie a
+	`PackedVector2Array` or a `(N, 2)` float32 numpy array for `Vector2`)::
+
+		godot.scatter(nodes, 'global_position', positions + velocities * delta)
+	'''
+	objects = objects if isinstance(objects, list | tuple) else list(objects)
+
+	batch, prop_info, index_args = _get_accessor_batch(objects, name, 'setter')
+
+	if batch is None:
+		return
+
+	batch(objects, *index_args, values)
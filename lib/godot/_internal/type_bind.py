@@ -1,6 +1,11 @@
+import os
+import sys
 import types
 import enum
 import functools
+import threading
+import contextlib
+import contextvars
 
 import _gdextension as gde
 
@@ -16,6 +21,16 @@ from . import class_type
 #from . import method_bind
 
 
+# set to `True` to bind class methods on first access instead of all at once when the class is bound
+# set to `False` to bind all class methods when the class is bound
+_lazy_class_method_binding = not os.environ.get('GODOT_PYTHON_EAGER_METHOD_BINDING')
+
+
+# held while binding types and methods, bindings may be triggered from several threads at once (in parallel on
+# free-threaded builds) and each must only be created once, reentrant as binding a class binds its bases
+binding_lock = threading.RLock()
+
+
 class TypeBindError(Exception):
 	__module__ = Exception.__module__ # hide module to make traceback easier to read
 
@@ -29,16 +44,111 @@ class TypeBindInProgressError(TypeBindError):
 	__module__ = Exception.__module__ # hide module to make traceback easier to read
 
 
+def _get_variant_type_class(type_info) -> type:
+	if type_info.name == 'Array':
+		from .typed_arrays import ArrayBase
+		return ArrayBase
+
+	return getattr(godot, type_info.name) # gde vs godot, arrays
+
+
+class lazy_variant_type_attr:
+	'''Placeholder for an attribute of a builtin variant type, binds the whole type on first access.'''
+
+	__slots__ = ('_cls', '_name')
+
+	def __set_name__(self, cls, name):
+		self._cls = cls
+		self._name = name
+
+	def __repr__(self):
+		return f'<{type(self).__name__} {self._cls.__name__}.{self._name}>'
+
+	def __get__(self, obj, obj_type=None):
+		ensure_variant_type_bound(self._cls)
+
+		# placeholders are removed once bound, look the attribute up again
+		return getattr(obj if obj is not None else obj_type or self._cls, self._name)
+
+
+# variant types waiting to be bound, mapping of class to type info and the class attributes
+# replaced by placeholders
+_lazy_variant_types = {}
+
+# variant types being bound by `ensure_variant_type_bound`, guards against reentrant binding from the same thread
+_variant_bindings_in_progress = set()
+
+
+def bind_variant_type_lazily(type_info):
+	'''Defer binding of a builtin variant type until any of its attributes is first accessed.'''
+	from . import method_bind
+
+	cls = _get_variant_type_class(type_info)
+
+	names = {
+		'__init__',
+		'__str__',
+		'__repr__',
+		'__copy__',
+		'__deepcopy__',
+		'copy',
+		'_variant_type_has_members',
+		'_variant_type_has_non_const_methods',
+		'_variant_type_has_destructor',
+	}
+
+	names.update(info.name for info in type_info.get('constants', []))
+	names.update(info.name for info in type_info.get('enums', []))
+	names.update(info.name for info in type_info.get('members', []))
+	names.update(method_bind.keyword_sanitize_identifier(info.name) for info in type_info.get('methods', []))
+	names.update(method_bind.get_variant_operator_names(type_info))
+
+	cls_dict = vars(cls)
+	replaced = {name: cls_dict.get(name, utils.unspecified) for name in names}
+
+	_lazy_variant_types[cls] = (type_info, replaced)
+
+	for name in names:
+		class_set_attr(cls, name, lazy_variant_type_attr())
+
+
+def ensure_variant_type_bound(cls: type):
+	'''Bind the builtin variant type `cls` if its binding was deferred by `bind_variant_type_lazily`.'''
+	# entries are only removed once the type is fully bound so this check can't pass while another thread is
+	# still binding it
+	if cls not in _lazy_variant_types:
+		return
+
+	with binding_lock:
+		if (entry := _lazy_variant_types.get(cls)) is None or cls in _variant_bindings_in_progress:
+			return
+
+		_variant_bindings_in_progress.add(cls)
+
+		try:
+			type_info, replaced = entry
+
+			# restore the class to how it was before the placeholders were added
+			for name, value in replaced.items():
+				if value is utils.unspecified:
+					delattr(cls, name)
+				else:
+					setattr(cls, name, value)
+
+			bind_variant_type(type_info)
+
+		finally:
+			_variant_bindings_in_progress.discard(cls)
+			del _lazy_variant_types[cls]
+
+
+@utils.traced(lambda type_info: f'bind variant type {type_info.name}', 'binding')
 @utils.with_context
 def bind_variant_type(type_info):
 	from . import method_bind
 	from .type_info import TypeInfo
 
-	if type_info.name == 'Array':
-		from .typed_arrays import ArrayBase
-		cls = ArrayBase
-	else:
-		cls = getattr(godot, type_info.name) # gde vs godot, arrays
+	cls = _get_variant_type_class(type_info)
 
 	method_bind.bind_variant_constructors(cls, type_info)
 
@@ -155,11 +265,11 @@ class property_proxy_attr_descriptor:
 
 	#@utils.log_calls
 	def __get__(self, prop_proxy, obj_type=None):
-		return self._descriptor.__get__(prop_proxy._bound_property_proxy__get(), obj_type)
+		return self._descriptor.__get__(prop_proxy._bound_property_proxy__get(sys._getframe(1)), obj_type)
 
 	#@utils.log_calls
 	def __set__(self, prop_proxy, value):
-		self._descriptor.__set__(prop_proxy._bound_property_proxy__get(), value)
+		self._descriptor.__set__(prop_proxy._bound_property_proxy__get(sys._getframe(1)), value)
 		prop_proxy._bound_property_proxy__set()
 
 
@@ -167,7 +277,7 @@ def property_proxy_non_const_method(method):
 	#@utils.log_calls
 	@functools.wraps(method)
 	def wrapper(prop_proxy, *args, **kwargs):
-		res = method.__get__(prop_proxy._bound_property_proxy__get())(*args, **kwargs)
+		res = method.__get__(prop_proxy._bound_property_proxy__get(sys._getframe(1)))(*args, **kwargs)
 		prop_proxy._bound_property_proxy__set()
 		return res
 
@@ -178,6 +288,32 @@ def _is_non_const_method(obj):
 	return getattr(obj, '_is_non_const_method', False) # XXX
 
 
+# while a write back scope is active property proxies are read once per object and property, changes
+# are made to the local copy and written back once when the scope exits
+
+_property_write_back_scope = contextvars.ContextVar('_property_write_back_scope', default=None)
+
+
+@contextlib.contextmanager
+def property_write_back():
+	'''Context manager deferring the writes of property proxies until it exits.'''
+	if _property_write_back_scope.get() is not None:
+		yield # nested, written back by the outer scope
+		return
+
+	scope = {}
+	token = _property_write_back_scope.set(scope)
+
+	try:
+		yield
+
+	finally:
+		_property_write_back_scope.reset(token)
+
+		for prop in scope.values():
+			prop._bound_property_proxy__flush()
+
+
 #property
 class property_proxy(): # XXX
 	_bound_property_proxy_types = {}
@@ -187,37 +323,68 @@ class property_proxy(): # XXX
 		self.fset = setter
 		self._type = type
 
-	def __set_name__(self, cls, name):
-		self._name = f'_{cls.__name__}__{name}'
-
 	def __repr__(self):
-		return f'<{type(self).__name__} {self._name!r}>'
+		return f'<{type(self).__name__} {getattr(self.fget, "__name__", self.fget)!r}>'
 
 	@classmethod
 	def _get_bound_property_proxy_type(cls, type_):
 		if proxy_type := cls._bound_property_proxy_types.get(type_):
 			return proxy_type
 
+		ensure_variant_type_bound(type_) # members are copied below
+
 		assert(not type_._variant_type_has_destructor)
 
 		class bound_property_proxy(type_):
-			def __init__(self, obj, getter, setter):
+			def __init__(self, obj, prop, scope, frame):
 				self.__obj = obj
-				self.__getter = getter
-				self.__setter = setter
+				self.__prop = prop
+				self.__scope = scope
+				self.__dirty = False
+
+				# outside of a scope the value read here is only used by the first access made on the same line
+				# of the frame that read the property (`node.position.x`), later accesses read it again
+				self.__read_at = (id(frame), frame.f_lineno, frame.f_lasti) if scope is None else None
+				super().__init__(prop.fget(obj)) # XXX: __init__
 
-				self.__get()
+			def __is_bound_to(self, obj, prop):
+				return self.__obj is obj and self.__prop is prop
 
 			#@utils.log_calls
-			def __get(self):
-				super().__init__(self.__getter(self.__obj)) # XXX: __init__
+			def __get(self, frame):
+				if self.__scope is not None:
+					return self # read once, stays valid until the scope exits
+
+				if read_at := self.__read_at:
+					self.__read_at = None
+
+					frame_id, lineno, lasti = read_at
+
+					if id(frame) == frame_id and frame.f_lineno == lineno and frame.f_lasti > lasti:
+						return self
+
+				super().__init__(self.__prop.fget(self.__obj)) # XXX: __init__
 				return self
 
 			#@utils.log_calls
 			def __set(self):
-				self.__setter(self.__obj, self)
+				if self.__scope is not None:
+					self.__dirty = True
+				else:
+					self.__prop.fset(self.__obj, self)
 				return self
 
+			def __reload(self):
+				self.__dirty = False
+				super().__init__(self.__prop.fget(self.__obj)) # XXX: __init__
+
+			def __flush(self):
+				self.__scope = None
+
+				if self.__dirty:
+					self.__dirty = False
+					self.__prop.fset(self.__obj, self)
+
 		for name, value in list(vars(type_).items()):
 			if hasattr(value, '__get__'):
 				if name.startswith('__init_') or name in ('__new__', ):
@@ -242,26 +409,72 @@ class property_proxy(): # XXX
 		if not obj:
 			return self
 
-		if prop := getattr(obj, self._name, None):
-			return prop
+		# proxies are not stored on `obj`, outside of a write back scope each access reads the value
+		scope = _property_write_back_scope.get()
 
-		else:
-			prop = self._get_bound_property_proxy_type(self._type)(obj, self.fget, self.fset)
-			setattr(obj, self._name, prop)
-			return prop
+		if scope is None:
+			return self._get_bound_property_proxy_type(self._type)(obj, self, None, sys._getframe(1))
+
+		key = (id(obj), self) # `obj` is kept alive by the proxy while the scope is active
+
+		if (prop := scope.get(key)) is None:
+			prop = scope[key] = self._get_bound_property_proxy_type(self._type)(obj, self, scope, None)
+
+		return prop
 
 	#@utils.log_calls
 	def __set__(self, obj, value):
-		if prop := getattr(obj, self._name, None):
-			if value is prop:
-				return # XXX: implace ops may call __set__ twice, is this the best way to handle?
+		if (is_bound_to := getattr(value, '_bound_property_proxy__is_bound_to', None)) and is_bound_to(obj, self):
+			return # XXX: implace ops may call __set__ twice, is this the best way to handle?
 
 		self.fset(obj, value)
 
+		if (scope := _property_write_back_scope.get()) is not None:
+			if (prop := scope.get((id(obj), self))) is not None:
+				prop._bound_property_proxy__reload() # assigned directly, drop any pending changes
+
+
+
+class lazy_method_descriptor:
+	'''Placeholder for a class method, binds the method and replaces itself on first access.'''
+
+	__slots__ = ('_class_info', '_method_info', '_cls', '_name')
+
+	def __init__(self, class_info, method_info):
+		self._class_info = class_info
+		self._method_info = method_info
+
+	def __set_name__(self, cls, name):
+		self._cls = cls
+		self._name = name
+
+	def __repr__(self):
+		return f'<{type(self).__name__} {self._class_info.name}.{self._name}>'
+
+	def __get__(self, obj, obj_type=None):
+		return self._bind().__get__(obj, obj_type)
+
+	def _bind(self):
+		from . import method_bind
+
+		method = vars(self._cls).get(self._name)
+
+		if method is self:
+			with binding_lock:
+				if (method := vars(self._cls).get(self._name)) is self:
+					method_bind.bind_method(self._cls, self._class_info, self._method_info)
+					method = vars(self._cls).get(self._name)
+
+			if method is self:
+				raise AttributeError(
+					f'failed to bind method {self._class_info.name}.{self._name}')
+
+		return method
 
 
 _class_bindings_in_progress = set()
 
+@utils.traced(lambda class_info: f'bind class {class_info.name}', 'binding')
 @utils.with_context
 def bind_class(class_info):
 	from . import method_bind
@@ -324,7 +537,11 @@ def bind_class(class_info):
 		if method_info.get('is_hidden'): # XXX
 			continue
 
-		method_bind.bind_method(cls, class_info, method_info)
+		if _lazy_class_method_binding:
+			class_set_attr(cls, method_bind.keyword_sanitize_identifier(method_info.name),
+				lazy_method_descriptor(class_info, method_info))
+		else:
+			method_bind.bind_method(cls, class_info, method_info)
 
 	# XXX
 	if class_info.name == 'Image':
@@ -339,6 +556,11 @@ def bind_class(class_info):
 
 		cls.__buffer__ = __buffer__
 
+		from . import image_buffers
+
+		cls.get_data_view = image_buffers.get_data_view
+		cls.create_from_buffer = staticmethod(image_buffers.create_from_buffer)
+
 
 	for prop_info in class_info.get('properties', []):
 		if prop_info.get('is_hidden'): # XXX
@@ -1,5 +1,6 @@
 from _godot_internal_core_utils import *
 from .general_utils import *
+from .trace_utils import *
 from .variant_utils import *
 from .callable_utils import *
 from . import metaclasses
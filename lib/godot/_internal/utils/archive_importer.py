@@ -130,6 +130,9 @@ class ArchiveTraversable(importlib.resources.abc.Traversable, importlib.resource
 @_log_method_calls
 class ArchiveImporter(importlib.abc.MetaPathFinder, importlib.abc.FileLoader,
 		importlib.resources.abc.TraversableResources):
+	# set by the startup tracer to a function returning a context manager tracing a module's execution
+	_trace_module = None
+
 	def __init__(self, archive: tarfile.TarFile | zipfile.ZipFile | bytes | str | pathlib.Path, *,
 			name: str | None = None, compile_flags = 0):
 		self._archive = archive
@@ -223,6 +226,13 @@ class ArchiveImporter(importlib.abc.MetaPathFinder, importlib.abc.FileLoader,
 					f'archive must be an instance of tarfile.TarFile, zipfile.ZipFile, '
 					f'bytes, str or path.Pathlib, received ')#{self._archive!r}')
 
+	def exec_module(self, module):
+		if self._trace_module is None:
+			return super().exec_module(module)
+
+		with self._trace_module(module.__name__):
+			return super().exec_module(module)
+
 	def get_resource_reader(self, fullname):
 		if not self.is_package(fullname):
 			return None
@@ -11,6 +11,8 @@ import atexit
 import collections.abc
 import itertools
 
+from .trace_utils import trace
+
 
 unspecified = type('unspecified', (type, ), dict(__repr__ = lambda self: 'unspecified'))('unspecified', (), {})
 
@@ -286,9 +288,10 @@ def print_exceptions_and_reraise():
 
 @contextlib.contextmanager
 def timer(name: str):
-	'''Context manager tracks and prints the time taken.'''
+	'''Context manager tracks and prints the time taken, also recorded when startup tracing is enabled.'''
 	start_time = time.time()
-	yield
+	with trace(name, 'startup'):
+		yield
 	end_time = time.time()
 	#print(f'{name} time: {(end_time - start_time) * 1000:.2f} ms') # XXX
 
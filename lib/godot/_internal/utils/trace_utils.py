@@ -0,0 +1,118 @@
+import os
+import sys
+import time
+import json
+import atexit
+import threading
+import contextlib
+import functools
+
+
+# NOTE: Startup tracing is opt-in, set `GODOT_PYTHON_STARTUP_TRACE` to the path of the file to write.
+# The trace is written on exit as Chrome trace event JSON, viewable in `chrome://tracing` or Perfetto.
+
+
+_trace_path = os.environ.get('GODOT_PYTHON_STARTUP_TRACE') or None
+
+_trace_events = []
+
+
+def trace_enabled() -> bool:
+	'''Return `True` if startup tracing is enabled.'''
+	return _trace_path is not None
+
+
+@contextlib.contextmanager
+def trace(name: str, category: str = 'python', **args):
+	'''Context manager that records a trace event spanning its body if startup tracing is enabled.'''
+	if _trace_path is None:
+		yield
+		return
+
+	start_ns = time.perf_counter_ns()
+
+	try:
+		yield
+
+	finally:
+		_add_trace_event(name, category, start_ns, time.perf_counter_ns(), args)
+
+
+def traced(get_name, category: str = 'python'):
+	'''Decorator that traces calls of the decorated function, `get_name` is called with the same arguments.'''
+	def decorator(func):
+		@functools.wraps(func)
+		def wrapper(*args, **kwargs):
+			if _trace_path is None:
+				return func(*args, **kwargs)
+
+			with trace(get_name(*args, **kwargs), category):
+				return func(*args, **kwargs)
+
+		return wrapper
+
+	return decorator
+
+
+def _make_trace_event(name: str, category: str, start_ns: int, end_ns: int, args: dict | None = None,
+		thread_id: int | None = None) -> dict:
+	event = dict(
+		name = name,
+		cat = category,
+		ph = 'X',
+		ts = start_ns / 1000,
+		dur = (end_ns - start_ns) / 1000,
+		pid = os.getpid(),
+		tid = thread_id if thread_id is not None else threading.get_native_id(),
+	)
+
+	if args:
+		event['args'] = {key: str(value) for key, value in args.items()}
+
+	return event
+
+
+def _add_trace_event(*args, **kwargs):
+	_trace_events.append(_make_trace_event(*args, **kwargs))
+
+
+def _get_native_trace_events() -> list[dict]:
+	try:
+		from _godot_internal_core_utils import get_native_startup_trace
+	except ImportError:
+		return []
+
+	events, native_now_ns = get_native_startup_trace()
+
+	# the native clock may differ from `time.perf_counter_ns`, align both at the current time
+	offset_ns = time.perf_counter_ns() - native_now_ns
+
+	return [
+		_make_trace_event(name, 'native', start_ns + offset_ns, end_ns + offset_ns,
+			thread_id = threading.main_thread().native_id)
+		for name, start_ns, end_ns in events
+	]
+
+
+def _trace_archive_imports():
+	# modules loaded from the embedded archive are traced by the importer itself
+	for finder in sys.meta_path:
+		if type(finder).__name__ == 'ArchiveImporter':
+			finder._trace_module = lambda name: trace(f'import {name}', 'import')
+
+
+def write_trace(path: str | None = None):
+	'''Write the recorded trace events as Chrome trace event JSON.'''
+	path = path or _trace_path
+
+	# native events are collected when writing as some only end after this module is imported
+	events = _get_native_trace_events() + _trace_events
+
+	with open(path, 'w') as file:
+		json.dump(dict(traceEvents = events, displayTimeUnit = 'ms'), file)
+
+
+if _trace_path is not None:
+	_trace_archive_imports()
+
+	atexit.register(write_trace)
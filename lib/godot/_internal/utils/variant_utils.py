@@ -240,10 +240,26 @@ def _init_implicit_casts():
 
 		Variant = fullnames(object),
 
-		# XXX: bytes / buffer
 		# XXX: bool?
 	)
 
+	# buffers with the element layout are copied at once, others are cast element wise like sequences
+	if (buffer_type := getattr(collections.abc, 'Buffer', None)) is not None: # python 3.12+
+		_implicit_casts.update({
+			type_name: fullnames(buffer_type, )
+			for type_name in [
+				'PackedByteArray',
+				'PackedInt32Array',
+				'PackedInt64Array',
+				'PackedFloat32Array',
+				'PackedFloat64Array',
+				'PackedVector2Array',
+				'PackedVector3Array',
+				'PackedVector4Array',
+				'PackedColorArray',
+			]
+		})
+
 	_implicit_cast_needs_convert.update(set(
 		#'int',
 		#'float',
@@ -0,0 +1,118 @@
+import os
+import sys
+import types
+import atexit
+import marshal
+import pathlib
+import importlib.util
+
+from godot._internal import utils as internal_utils
+
+
+# NOTE: Code objects of project modules are cached in a single file in the python cache dir, keyed
+# by module path and validated by the hash of the source (like checked hash based pycs), as the
+# modification times of files inside .pck files can't be relied on. Entries hold the marshalled code
+# so only the modules actually imported are unmarshalled. Exported projects ship a cache compiled
+# by the export plugin.
+
+
+cache_file_name = 'module_bytecode_cache.marshal'
+
+_cache_path = f'res://.python/{cache_file_name}'
+
+_enabled = not os.environ.get('GODOT_PYTHON_DISABLE_BYTECODE_CACHE')
+
+_entries: dict[str, tuple[bytes, bytes]] | None = None
+_modified = False
+
+
+def _cache_key() -> tuple:
+	return (importlib.util.MAGIC_NUMBER, sys.flags.optimize)
+
+
+def _get_project_cache_dir() -> pathlib.Path | None:
+	# only written when running from the project directory, ie in the editor, not from exported builds
+	res_root = pathlib.Path().resolve()
+
+	if (res_root / 'project.godot').exists() and (res_root / '.python').is_dir():
+		return res_root / '.python'
+
+	return None
+
+
+def loads(data: bytes | None) -> dict[str, tuple[bytes, bytes]]:
+	if not data:
+		return {}
+
+	try:
+		key, entries = marshal.loads(data)
+	except Exception:
+		return {} # XXX: corrupt or from another python version, recompile
+
+	if key != _cache_key() or not isinstance(entries, dict):
+		return {}
+
+	return entries
+
+
+def dumps(entries: dict[str, tuple[bytes, bytes]] | None = None) -> bytes:
+	return marshal.dumps((_cache_key(), _entries if entries is None else entries))
+
+
+def _load():
+	global _entries
+
+	if _entries is not None:
+		return
+
+	try:
+		data = internal_utils.get_file_as_bytes(_cache_path)
+	except Exception:
+		data = None
+
+	_entries = loads(data)
+
+	if (cache_dir := _get_project_cache_dir()) is not None:
+		@atexit.register
+		def _save():
+			if _prune(cache_dir.parent) or _modified:
+				(cache_dir / cache_file_name).write_bytes(dumps())
+
+
+def _prune(res_root: pathlib.Path) -> bool:
+	'''Drop the entries of modules removed from the project, return whether any were dropped.'''
+	removed = [path for path in _entries if not (res_root / path.removeprefix('res://')).is_file()]
+
+	for path in removed:
+		del _entries[path]
+
+	return bool(removed)
+
+
+def make_entry(source: str, code: types.CodeType) -> tuple[bytes, bytes]:
+	return (importlib.util.source_hash(source.encode()), marshal.dumps(code))
+
+
+def get_code(path: str, source: str, source_to_code) -> types.CodeType:
+	'''Return the cached code object of the module at `path` if `source` is unchanged, or compile it.'''
+	global _modified
+
+	if not _enabled:
+		return source_to_code(source, path)
+
+	_load()
+
+	source_hash = importlib.util.source_hash(source.encode())
+
+	if (entry := _entries.get(path)) is not None and entry[0] == source_hash:
+		try:
+			return marshal.loads(entry[1])
+		except Exception:
+			pass
+
+	code = source_to_code(source, path)
+
+	_entries[path] = (source_hash, marshal.dumps(code))
+	_modified = True
+
+	return code
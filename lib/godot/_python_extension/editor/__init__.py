@@ -80,6 +80,12 @@ def _install_icons():
 	godot.EditorInterface.get_editor_theme().set_icon('PythonScript', 'EditorIcons', texture)
 
 
+@_continue_after_fail
+def _track_module_index_changes():
+	from .. import godot_fs_importer
+	godot_fs_importer.track_editor_filesystem_changes()
+
+
 @_continue_after_fail
 def _register_export_plugin():
 	from . import export_plugin
@@ -112,6 +118,7 @@ def _init():
 	_init_settings()
 	_install_icons()
 	_install_commands()
+	_track_module_index_changes()
 
 	_register_export_plugin()
 
@@ -112,6 +112,8 @@ class PythonExportPlugin(godot.EditorExportPlugin):
 			shutil.copy2(file, dir_)
 
 		self._add_api_json()
+		self._add_bytecode_cache()
+		self._add_module_index()
 
 
 	def _add_api_json(self):
@@ -119,7 +121,6 @@ class PythonExportPlugin(godot.EditorExportPlugin):
 		import pathlib
 		import tempfile
 		import subprocess
-		import gzip
 
 		with tempfile.TemporaryDirectory() as temp_dir:
 			subprocess.run([sys.executable, '--quiet', '--headless', '--dump-extension-api'],
@@ -129,9 +130,29 @@ class PythonExportPlugin(godot.EditorExportPlugin):
 
 			data = (pathlib.Path(temp_dir) / 'extension_api.json').read_bytes()
 
-		data = gzip.compress(data, mtime=0)
+		# the generated binding code doesn't depend on the docs, so the code cached while running
+		# in the editor can be shipped keyed to the exported api json
+		from godot._internal import api_info, binding_cache
 
-		self.add_file('res://.python/extension_api.json.gz', data, False)
+		self.add_file(f'res://.python/{binding_cache.cache_file_name}',
+			binding_cache.dumps(api_info.hash_api_data(data)), False)
+
+		# ship a snapshot of the parsed api so exported projects don't need to parse the json on startup
+		self.add_file(f'res://.python/{api_info.snapshot_file_name}', api_info.dump_api_snapshot(data), False)
+
+	def _add_bytecode_cache(self):
+		from .. import bytecode_cache, godot_fs_importer
+
+		# precompiled project modules, used by exported projects as long as the module sources match
+		self.add_file(f'res://.python/{bytecode_cache.cache_file_name}', godot_fs_importer.dump_bytecode_cache(), False)
+
+	def _add_module_index(self):
+		from .. import godot_fs_importer
+
+		# the files of exported projects can't change, the index of the editor is shipped instead of walking
+		# the search path on startup
+		self.add_file(f'res://.python/{godot_fs_importer.module_index_file_name}',
+			godot_fs_importer.dump_module_index(), False)
 
 	def _export_file(self, path: str, type_: str, features: list[str]):
 		pass
@@ -3,6 +3,7 @@ import os
 import importlib.abc
 import importlib.util
 import re
+import marshal
 import pathlib
 
 import __future__
@@ -10,7 +11,7 @@ import __future__
 import godot
 
 from . import utils
-from . import python_script
+from . import bytecode_cache
 
 
 module_search_path_setting = 'python/config/module_search_path'
@@ -22,48 +23,107 @@ if godot.ProjectSettings.has_setting(module_search_path_setting):
 		str(x) for x in godot.ProjectSettings.get_setting(module_search_path_setting, ['res://']))
 
 
+# NOTE: The module index is built from listings of the directories in the search path, cached per
+# directory. Changes are applied by listing only the directories reported as changed (by saving or
+# reloading a script or by the editor filesystem), the index itself is rebuilt from the cached
+# listings without touching the filesystem. Exported projects ship the listings and never walk.
+
+
+module_index_file_name = 'module_index.marshal'
+
+_module_index_format_version = 1
+
+
 class _Cache:
 	def __init__(self):
+		# directory path (ending with '/') -> (python file names, subdirectory names)
+		self._listings: dict[str, tuple[list[str], list[str]]] = {}
+		self._stale_dirs: set[str] = set()
+
+		# set when changes are reported by the editor, `invalidate_import_caches` then keeps the index
+		self.tracks_changes = False
+
+		# set when the files can't change (exported project), `invalidate_caches` then keeps the index
+		self.is_read_only = False
+
 		self.clear()
 
 	def clear(self):
+		self._listings.clear()
+		self._stale_dirs.clear()
+		self._clear_index()
+
+	def _clear_index(self):
+		self._is_index_valid = False
 		self._module_name_to_paths: dict[str, list[str]] = {}
 		self._module_path_to_names: dict[str, list[str]] = {}
 
+	def invalidate_directory(self, dir_: str):
+		'''List `dir_` again on the next lookup, the rest of the index is kept.'''
+		if not dir_.endswith('/'):
+			dir_ += '/'
+
+		self._stale_dirs.add(dir_)
+		self._is_index_valid = False
+
+	def invalidate_all(self):
+		self._stale_dirs.update(self._listings.keys())
+		self._is_index_valid = False
+
+	def loads(self, data: bytes):
+		version, listings = marshal.loads(data)
+
+		if version != _module_index_format_version:
+			raise ValueError('module index format version mismatch')
+
+		self.clear()
+		self._listings.update(listings)
+
+	def dumps(self) -> bytes:
+		self._update()
+
+		return marshal.dumps((_module_index_format_version, self._listings))
+
 	@property
 	def search_path(self):
 		return [path for path in sys.path if path.startswith('res://')]
 
-	@classmethod
-	def _get_modules_under_path(cls, path: str):
-		if path != 'res://':
-			path = path.removesuffix('/')
+	def _get_listing(self, dir_: str) -> tuple[list[str], list[str]]:
+		if (listing := self._listings.get(dir_)) is None or dir_ in self._stale_dirs:
+			self._stale_dirs.discard(dir_)
+
+			path = dir_ if dir_.endswith('//') else dir_.removesuffix('/')
+
+			listing = self._listings[dir_] = (
+				[str(file) for file in godot.DirAccess.get_files_at(path) if file.endswith('.py')],
+				[str(name) for name in godot.DirAccess.get_directories_at(path)],
+			)
 
-		dirs = godot.DirAccess.get_directories_at(path)
-		files = godot.DirAccess.get_files_at(path)
+		return listing
 
-		if path.endswith('//'):
-			path = path.removesuffix('/')
+	def _get_modules_under_path(self, dir_: str, visited: set[str]):
+		visited.add(dir_)
+
+		files, dirs = self._get_listing(dir_)
 
 		for file in files:
-			if file.endswith('.py'):
-				yield '/'.join((path, file))
+			yield dir_ + file
 
-		for dir_ in dirs:
-			yield from cls._get_modules_under_path('/'.join((path, dir_)))
+		for name in dirs:
+			yield from self._get_modules_under_path(dir_ + name + '/', visited)
 
-	def _get_modules(self):
+	def _get_modules(self, visited: set[str]):
 		for path in self.search_path:
 			if not path.endswith('/'):
 				path += '/'
 
-			for file in self._get_modules_under_path(path):
+			for file in self._get_modules_under_path(path, visited):
 				name = file.removeprefix(path).removesuffix('.py').replace('/', '.').removesuffix('.__init__')
 
 				yield (file, name)
 
-	def _get_modules_and_packages(self):
-		modules = list(self._get_modules())
+	def _get_modules_and_packages(self, visited: set[str]):
+		modules = list(self._get_modules(visited))
 
 		names = set(name for path, name in modules)
 
@@ -87,19 +147,52 @@ class _Cache:
 			yield module
 
 	def _update(self):
-		if self._module_path_to_names:
+		if self._is_index_valid:
 			return
 
-		for path, name in self._get_modules_and_packages():
+		self._clear_index()
+
+		visited = set()
+
+		for path, name in self._get_modules_and_packages(visited):
 			names = self._module_path_to_names.setdefault(path, [])
 
 			if name not in names:
 				names.append(name)
 
-			names[:] = sorted(names, key = lambda name: (name.count('.'), names.index(name)))
-
 			self._module_name_to_paths.setdefault(name, []).append(path)
 
+		# shortest name first, the sort is stable so names of the same depth keep the search path order
+		for names in self._module_path_to_names.values():
+			names.sort(key = lambda name: name.count('.'))
+
+		# drop listings of removed directories
+		for dir_ in self._listings.keys() - visited:
+			del self._listings[dir_]
+
+		self._stale_dirs.clear()
+		self._is_index_valid = True
+
+	def invalidate_changed_directories(self, filesystem: 'godot.EditorFileSystem'):
+		'''Update the listings of directories whose python files or subdirectories changed in the editor filesystem.'''
+		for dir_, listing in list(self._listings.items()):
+			if dir_ in self._stale_dirs or (fs_dir := filesystem.get_filesystem_path(dir_)) is None:
+				continue
+
+			files, dirs = listing
+
+			fs_files = {str(fs_dir.get_file(i)) for i in range(fs_dir.get_file_count())}
+			fs_dirs = {str(fs_dir.get_subdir(i).get_name()) for i in range(fs_dir.get_subdir_count())}
+
+			if {file for file in fs_files if file.endswith('.py')} == set(files) and fs_dirs == set(dirs):
+				continue
+
+			# the editor filesystem skips some directories (ie with a .gdignore), compare with a new listing
+			self._stale_dirs.add(dir_)
+
+			if self._get_listing(dir_) != listing:
+				self._is_index_valid = False
+
 	def get_module_path_from_name(self, name: str) -> str | None:
 		self._update()
 
@@ -123,6 +216,59 @@ class _Cache:
 
 _cache = _Cache()
 
+# module sources by path, shared with `PythonScript._set_source_code` so each source is read at most once per change
+_sources: dict[str, str] = {}
+
+# modified times of the files when their sources were cached, to find files changed outside of the editor
+_source_modified_times: dict[str, int] = {}
+
+
+def _cache_source(path: str, source: str):
+	_sources[path] = source
+	_source_modified_times[path] = godot.FileAccess.get_modified_time(path)
+
+
+def _forget_sources(path: str):
+	'''Read the sources of the file at `path`, or of the files under it if a directory, again on next use.'''
+	if path.endswith('/'):
+		paths = [source_path for source_path in _sources if source_path.startswith(path)]
+	else:
+		paths = [path]
+
+	for path in paths:
+		_sources.pop(path, None)
+		_source_modified_times.pop(path, None)
+
+
+def _forget_changed_sources():
+	for path, modified_time in list(_source_modified_times.items()):
+		# removed files have no modified time
+		if godot.FileAccess.get_modified_time(path) != modified_time:
+			_forget_sources(path)
+
+
+# (path, source, is_package) of the modules executed by the importer by name, the version changes whenever a module
+# is imported or reloaded, see `get_executed_modules`
+_executed_modules: dict[str, tuple[str, str, bool]] = {}
+_executed_modules_version = 0
+
+
+def _load_module_index():
+	# exported projects ship the module index, their files can't change
+	if (pathlib.Path().resolve() / 'project.godot').exists():
+		return
+
+	try:
+		data = utils.get_file_as_bytes(f'res://.python/{module_index_file_name}')
+	except Exception:
+		return
+
+	with utils.print_exceptions_and_continue():
+		_cache.loads(data)
+		_cache.is_read_only = True
+
+_load_module_index()
+
 
 #@utils.log_method_calls
 class GodotFileSystemModuleImporter(importlib.abc.MetaPathFinder, importlib.abc.ExecutionLoader):
@@ -147,20 +293,25 @@ class GodotFileSystemModuleImporter(importlib.abc.MetaPathFinder, importlib.abc.
 		if (filename := self._get_filename(fullname)) is None:
 			raise ImportError
 
-		with utils.print_exceptions_and_continue():
-		#try:
-			with utils.exception_note(lambda: f'While getting source for: {fullname!r}'):
-				if godot.ResourceLoader.exists(filename, python_script.PythonScript.__name__):
-					script_resource = godot.ResourceLoader.load(filename,
-						python_script.PythonScript.__name__,
-						godot.ResourceLoader.CacheMode.CACHE_MODE_IGNORE) # XXX: ignore?
+		if (source := _sources.get(filename)) is not None:
+			return source
 
-					return script_resource._get_source_code()
+		with utils.exception_note(lambda: f'While getting source for: {fullname!r}'):
+			source = str(godot.FileAccess.get_file_as_string(filename))
 
-		#except Exception:
-		#	pass # XXX
+			if not source and (error := godot.FileAccess.get_open_error()) != godot.Error.OK:
+				raise ImportError(f'cannot read {filename!r}: godot.Error.{godot.Error(error).name}',
+					name = fullname, path = filename)
 
-		raise ImportError
+		_cache_source(filename, source)
+
+		return source
+
+	def get_code(self, fullname):
+		source = self.get_source(fullname)
+		path = self.get_filename(fullname)
+
+		return bytecode_cache.get_code(path, source, self.source_to_code)
 
 	@staticmethod
 	def source_to_code(data, path='<string>'):
@@ -181,6 +332,17 @@ class GodotFileSystemModuleImporter(importlib.abc.MetaPathFinder, importlib.abc.
 			or filename.endswith('/__init__.pyc')
 		)
 
+	def exec_module(self, module):
+		global _executed_modules_version
+
+		name = module.__name__
+
+		_executed_modules[name] = (self.get_filename(name), self.get_source(name), self.is_package(name))
+		_executed_modules_version += 1
+
+		with utils.trace(f'import {name}', 'import'):
+			super().exec_module(module)
+
 	def find_spec(self, fullname, path, target=None):
 		if (filename := self._get_filename(fullname)) is None:
 			return None
@@ -193,7 +355,12 @@ class GodotFileSystemModuleImporter(importlib.abc.MetaPathFinder, importlib.abc.
 			loader = loader, origin = origin, is_package = is_package)
 
 	def invalidate_caches(self):
-		_cache.clear()
+		# explicit invalidations list the directories again even when the editor reports changes, as they may
+		# not have been reported yet
+		if not _cache.is_read_only:
+			_cache.invalidate_all()
+			_sources.clear()
+			_source_modified_times.clear()
 
 
 GodotFileSystemModuleImporter = GodotFileSystemModuleImporter()
@@ -203,6 +370,50 @@ def install():
 	sys.meta_path.insert(0, GodotFileSystemModuleImporter)
 
 
+def invalidate_path(path: str):
+	'''Update the module index for a file or directory that was added, changed or removed.'''
+	_cache.invalidate_directory(path.removesuffix('/').rpartition('/')[0] + '/')
+
+	if path.endswith('/'):
+		_cache.invalidate_directory(path)
+
+	_forget_sources(path)
+
+
+def invalidate_import_caches():
+	'''Like `importlib.invalidate_caches`, but keeps the module index when it is kept up to date from the editor.'''
+	for finder in reversed(sys.meta_path):
+		if finder is GodotFileSystemModuleImporter and _cache.tracks_changes:
+			continue
+
+		if hasattr(finder, 'invalidate_caches'):
+			finder.invalidate_caches()
+
+
+def set_source(path: str, source: str):
+	'''Set the source of the module at `path`, used by the next import or reload instead of reading the file.'''
+	_cache_source(path, source)
+
+
+def track_editor_filesystem_changes():
+	'''Keep the module index up to date from the editor filesystem, `invalidate_import_caches` then keeps it.'''
+	godot.EditorInterface.get_resource_filesystem().filesystem_changed.connect(_on_editor_filesystem_changed)
+
+	_cache.tracks_changes = True
+
+
+def _on_editor_filesystem_changed():
+	_cache.invalidate_changed_directories(godot.EditorInterface.get_resource_filesystem())
+
+	# files changed, renamed or removed outside of the editor are only noticed here
+	_forget_changed_sources()
+
+
+def get_executed_modules() -> tuple[int, dict[str, tuple[str, str, bool]]]:
+	'''Return the version and the (path, source, is_package) by name of the modules imported from the search path.'''
+	return _executed_modules_version, dict(_executed_modules)
+
+
 def get_module_path_from_name(module_name: str) -> str | None:
 	return _cache.get_module_path_from_name(module_name)
 
@@ -210,3 +421,26 @@ def get_module_name_from_path(module_path: str) -> str | None:
 	return _cache.get_module_name_from_path(module_path)
 
 
+def dump_bytecode_cache() -> bytes:
+	'''Compile all modules found in the search path and return them as a bytecode cache, for exporting.'''
+	entries = {}
+
+	_cache._update()
+
+	for path, names in _cache._module_path_to_names.items():
+		# the index may still list files removed since it was updated
+		if not path.endswith('.py') or not godot.FileAccess.file_exists(path):
+			continue
+
+		with utils.print_exceptions_and_continue():
+			source = GodotFileSystemModuleImporter.get_source(names[0])
+			code = GodotFileSystemModuleImporter.source_to_code(source, path)
+
+			entries[path] = bytecode_cache.make_entry(source, code)
+
+	return bytecode_cache.dumps(entries)
+
+
+def dump_module_index() -> bytes:
+	'''Return the module index of the search path, for exporting.'''
+	return _cache.dumps()
@@ -3,6 +3,8 @@ import textwrap
 
 import godot
 
+import _godot_internal_core_utils
+
 from godot._internal.extension_classes import *
 
 from . import utils
@@ -188,10 +190,11 @@ class PythonLanguage(godot.ScriptLanguageExtension):
 		raise NotImplementedError
 
 	def _thread_enter(self) -> None:
-		pass#raise NotImplementedError
+		# keep the python thread state of engine threads between calls
+		_godot_internal_core_utils.thread_enter()
 
 	def _thread_exit(self) -> None:
-		pass#raise NotImplementedError
+		_godot_internal_core_utils.thread_exit()
 
 	def _debug_get_error(self) -> str:
 		raise NotImplementedError
@@ -296,6 +296,9 @@ class PythonScript(godot.ScriptExtension):
 		return self._source or ''
 
 	def _set_source_code(self, code: str) -> None:
+		if self._path:
+			godot_fs_importer.set_source(self._path, code)
+
 		if code == self._source:
 			return
 		self._source_changed = True
@@ -319,8 +322,14 @@ class PythonScript(godot.ScriptExtension):
 		if not self._path:
 			return godot.Error.FAILED
 
-		# invalidate caches so any new files needed for reloading are picked up by the import system
-		importlib.invalidate_caches()
+		# invalidate caches so any new files needed for reloading are picked up by the import system, the
+		# module index is kept when the editor keeps it up to date
+		godot_fs_importer.invalidate_path(self._path)
+		godot_fs_importer.invalidate_import_caches()
+
+		# the source was just set by the resource loader or the script editor, keep using it for the reload
+		if self._source is not None:
+			godot_fs_importer.set_source(self._path, self._source)
 
 		# the class object will be reused, so removed all exposed members so there is no remnants
 		if _class := self.__dict__.get('_class'): # XXX: handle all classes in a module
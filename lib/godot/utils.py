@@ -50,4 +50,33 @@ def import_enum(enum_: enum.Enum):
 	_update_globals(enum_.__members__, level=-1)
 
 
+def property_write_back():
+	'''Context manager deferring writes to variant properties of objects until it exits.
 
+	Properties such as `node.transform` are read once on first access inside the block, modified
+	locally and written back once on exit, instead of a read and a write for each modification::
+
+		with godot.utils.property_write_back():
+			node.position.x += 1
+			node.position.y += 1
+	'''
+	from ._internal.type_bind import property_write_back
+	return property_write_back()
+
+
+def get_interpreter_pool():
+	'''Return the shared `InterpreterPool`, created on first use.
+
+	Callables scheduled on it run in sub-interpreters with their own GIL, in parallel with the main
+	interpreter. They can not use the `godot` package and receive variant arguments by value. They may
+	be defined in project modules that don't import `godot`::
+
+		pool = godot.utils.get_interpreter_pool()
+		group_id = pool.add_group_task(generate_row, height, seed)
+		rows = pool.wait_for_group_task_completion(group_id)
+
+	The number of sub-interpreters defaults to the number of cpus, or `GODOT_PYTHON_INTERPRETER_POOL_SIZE`.
+	Create a `godot._internal.interpreter_pool.InterpreterPool` directly for a pool of another size.
+	'''
+	from ._internal.interpreter_pool import get_default_pool
+	return get_default_pool()
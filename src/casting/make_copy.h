@@ -134,6 +134,62 @@ py::object make_copy(Pointer ptr, GDExtensionVariantType variant_type, py::handl
 }
 
 
+// python buffer -> packed array
+
+// copies a c contiguous buffer whose scalars match the elements of the packed array with a single memcpy, ie
+// `bytes` to `PackedByteArray` or a (N, 2) float32 numpy array to `PackedVector2Array`, returns false without
+// touching `ref` if `obj` has no such buffer
+template<bool initialized, VariantBufferType Type>
+bool make_copy_from_buffer(Type& ref, py::handle obj) {
+	constexpr variant_value_layout_t layout = variant_buffer_element_layout<Type>;
+
+	if(!PyObject_CheckBuffer(obj.ptr())) {
+		return false;
+	}
+
+	auto* view = new Py_buffer();
+
+	if(PyObject_GetBuffer(obj.ptr(), view, PyBUF_C_CONTIGUOUS | PyBUF_FORMAT) != 0) {
+		delete view;
+		PyErr_Clear();
+		return false;
+	}
+
+	py::buffer_info info(view, true); // releases the buffer
+
+	if(!buffer_format_matches(*view, layout) || view->len % layout.size != 0) {
+		return false;
+	}
+
+	// the trailing dimensions of a shaped buffer must hold one element, ie (N, 2) for `PackedVector2Array`,
+	// flat buffers and any shape of scalar arrays are copied as is
+	if(layout.scalar_count > 1 && view->ndim > 1) {
+		Py_ssize_t element_scalars = 1;
+
+		for(int i = 1; i < view->ndim; i++) {
+			element_scalars *= view->shape[i];
+		}
+
+		if(element_scalars != static_cast<Py_ssize_t>(layout.scalar_count)) {
+			return false;
+		}
+	}
+
+	if constexpr(!initialized) {
+		::new(&ref) Type();
+	}
+
+	variant_type_handle<Type>().attr("resize")(
+		py::cast(ref, py::return_value_policy::reference), view->len / layout.size); // XXX
+
+	if(view->len) {
+		std::memcpy(variant_buffer_ptrw(ref), view->buf, view->len);
+	}
+
+	return true;
+}
+
+
 // python object -> variant pointer
 
 template<MaybeUninitializedPointer Pointer, PythonObject ObjectType>
@@ -264,6 +320,12 @@ auto make_copy(Pointer ptr, ObjectType obj, GDExtensionVariantType variant_type)
 			}
 		}
 		else if constexpr(is_in_type_list<Type, variant_array_type_list>) {//VariantArrayType<Type>) {
+			if constexpr(requires { variant_buffer_element_layout<Type>; }) {
+				if(make_copy_from_buffer<initialized>(ref, obj)) {
+					return;
+				}
+			}
+
 			if(!PySequence_Check(obj.ptr())) {
 				throw make_type_error(py::type::handle_of(obj),
 					py::type::handle_of<Type>(), "sequence");
@@ -1,5 +1,6 @@
 #include <array>
 #include <string>
+#include <chrono>
 #include <cstdio>
 #include <cstring>
 
@@ -32,6 +33,45 @@ void register_cleanup_func(std::function<void()> func) {
 }
 
 
+static std::vector<startup_trace_event_t> startup_trace_events;
+
+static bool startup_trace_enabled() {
+	static const bool enabled = [] {
+		const char* path = std::getenv("GODOT_PYTHON_STARTUP_TRACE");
+		return path && strlen(path) > 0;
+	}();
+
+	return enabled;
+}
+
+int64_t startup_trace_clock_ns() {
+	return std::chrono::duration_cast<std::chrono::nanoseconds>(
+		std::chrono::steady_clock::now().time_since_epoch()).count();
+}
+
+const std::vector<startup_trace_event_t>& get_startup_trace_events() {
+	return startup_trace_events;
+}
+
+// records a startup trace event spanning the lifetime of the object
+struct startup_trace_scope {
+	const char* name;
+	int64_t start_ns = 0;
+
+	startup_trace_scope(const char* name) : name(name) {
+		if(startup_trace_enabled()) {
+			start_ns = startup_trace_clock_ns();
+		}
+	}
+
+	~startup_trace_scope() {
+		if(startup_trace_enabled()) {
+			startup_trace_events.push_back({name, start_ns, startup_trace_clock_ns()});
+		}
+	}
+};
+
+
 static struct runtime_config_t {
 	std::filesystem::path executable_path;
 
@@ -170,6 +210,13 @@ static bool init_python_isolated() {
 	auto py_minor = std::to_string(PY_MINOR_VERSION);
 	auto py_version = py_major + "." + py_minor;
 	auto py_version_no_dot = py_major + py_minor;
+
+#ifdef Py_GIL_DISABLED
+	// free-threaded builds install their library under `python3.13t`
+	py_version += "t";
+	py_version_no_dot += "t";
+#endif
+
 	auto python_zip_name = "python" + py_version_no_dot + ".zip";
 	auto python_lib_name = "python" + py_version;
 
@@ -231,7 +278,11 @@ void initialize_python_module(void* userdata, GDExtensionInitializationLevel lev
 		try {
 			//printf("initializing interpreter...\n");
 
-			init_python_isolated();
+			{
+				startup_trace_scope trace("python interpreter initialization");
+
+				init_python_isolated();
+			}
 
 			//printf("interpreter initialized\n");
 
@@ -257,13 +308,21 @@ void initialize_python_module(void* userdata, GDExtensionInitializationLevel lev
 			}
 			else {
 				// embedded module
+				startup_trace_scope trace("godot module archive initialization");
+
 				if(!_init_godot_module()) {
 					throw std::runtime_error("the 'godot' python module was not embedded, the environment variable 'GODOT_PYTHON_MODULE_LIB_DIR' must be set to a directory containing the 'godot' module");
 				}
 			}
 
 			py::module_::import("_gdextension");
-			py::module_::import("godot._internal");
+
+			{
+				// events recorded while importing are added by the python side of the tracer
+				startup_trace_scope trace("import godot._internal");
+
+				py::module_::import("godot._internal");
+			}
 		}
 		CATCH_FATAL_EXCEPTIONS_PRINT_ERRORS_AND_ABORT("During godot python module initialization")
 	}
@@ -371,6 +430,8 @@ extern "C" PYBIND11_EXPORT GDExtensionBool python_extension_init(
 		"classdb_register_extension_class_property_group",
 		"classdb_register_extension_class_property_subgroup",
 		"classdb_register_extension_class_signal",
+		"file_access_get_buffer",
+		"file_access_store_buffer",
 		"get_godot_version",
 		"get_library_path",
 		"get_variant_from_type_constructor",
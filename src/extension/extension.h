@@ -1,6 +1,9 @@
 #pragma once
 
 #include <functional>
+#include <string>
+#include <vector>
+#include <cstdint>
 
 #include <pybind11/pybind11.h>
 
@@ -60,5 +63,19 @@ inline bool godot_version_is_at_least(uint32_t major, uint32_t minor, uint32_t p
 void register_cleanup_func(std::function<void()> func);
 
 
+// startup trace events recorded before the python side of the tracer is available
+// only recorded when `GODOT_PYTHON_STARTUP_TRACE` is set, see `godot._internal.utils.trace_utils`
+
+struct startup_trace_event_t {
+	std::string name;
+	int64_t start_ns;
+	int64_t end_ns;
+};
+
+int64_t startup_trace_clock_ns();
+
+const std::vector<startup_trace_event_t>& get_startup_trace_events();
+
+
 } // namespace pygodot
 
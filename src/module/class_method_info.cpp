@@ -1,3 +1,5 @@
+#include <array>
+
 #include <pybind11/stl.h>
 
 #include "extension/extension.h"
@@ -18,9 +20,66 @@ public:
 	std::vector<GDExtensionPropertyInfo> method_arguments_info;
 	std::unique_ptr<cast_t<py::args>> method_default_arguments; // XXX
 	GDExtensionPropertyInfo method_return_value_info;
+
+	// cast info for ptrcall, computed once when the method is registered
+	std::vector<cast_info_t> arguments_cast_info;
+	cast_info_t return_cast_info;
 };
 
 
+// calls `func` with `self` (if any) followed by `argument_count` arguments returned by `get_arg`
+// the arguments are passed with vectorcall instead of building an argument tuple
+template<typename GetArg>
+static py::object call_with_vectorcall(py::handle func, py::handle self, size_t argument_count, GetArg&& get_arg) {
+	static constexpr size_t max_stack_args = 16;
+
+	// the first slot is left empty for the callee, see `PY_VECTORCALL_ARGUMENTS_OFFSET`
+	const size_t slot_count = 1 + (self ? 1 : 0) + argument_count;
+
+	std::array<py::object, max_stack_args> stack_objects;
+	std::array<PyObject*, max_stack_args> stack_pointers;
+
+	std::vector<py::object> heap_objects;
+	std::vector<PyObject*> heap_pointers;
+
+	py::object* objects = stack_objects.data();
+	PyObject** pointers = stack_pointers.data();
+
+	if(slot_count > max_stack_args) {
+		heap_objects.resize(slot_count);
+		heap_pointers.resize(slot_count);
+
+		objects = heap_objects.data();
+		pointers = heap_pointers.data();
+	}
+
+	size_t slot = 1;
+
+	if(self) {
+		objects[slot++] = py::reinterpret_borrow<py::object>(self);
+	}
+
+	for(size_t i = 0; i < argument_count; i++) {
+		objects[slot++] = get_arg(i);
+	}
+
+	pointers[0] = nullptr;
+
+	for(size_t i = 1; i < slot_count; i++) {
+		pointers[i] = objects[i].ptr();
+	}
+
+	PyObject* res = PyObject_Vectorcall(func.ptr(), pointers + 1,
+		(slot_count - 1) | PY_VECTORCALL_ARGUMENTS_OFFSET, nullptr);
+
+	if(!res) {
+		throw py::error_already_set();
+	}
+
+	return py::reinterpret_steal<py::object>(res);
+}
+
+
 void PyGDExtensionClassMethodInfo::def(py::module_& module_) {
 	using type = PyGDExtensionClassMethodInfo;
 
@@ -74,6 +133,9 @@ PyGDExtensionClassMethodInfo::operator GDExtensionClassMethodInfo() {
 		_cached_data->method_return_value_info = *return_value_info;
 	}
 
+	_cached_data->arguments_cast_info = get_arguments_cast_info(*this);
+	_cached_data->return_cast_info = get_return_cast_info(*this);
+
 	GDExtensionClassMethodInfo method_info = {
 		.name = name,
 		.method_userdata = reinterpret_cast<void*>(this),
@@ -92,15 +154,15 @@ PyGDExtensionClassMethodInfo::operator GDExtensionClassMethodInfo() {
 			}
 
 			try {
-				if(method_info.method_flags & GDEXTENSION_METHOD_FLAG_STATIC) {
-					cast(res)
-						= method_info.call_func.value()(*cast(args, argument_count)); // XXX: cast info
-				}
-				else {
-					py::object self = py::cast(reinterpret_cast<Object*>(instance));
-					cast(res)
-						= method_info.call_func.value()(self, *cast(args, argument_count)); // XXX: cast info
+				py::object self;
+
+				if(!(method_info.method_flags & GDEXTENSION_METHOD_FLAG_STATIC)) {
+					self = py::cast(reinterpret_cast<Object*>(instance));
 				}
+
+				cast(res) = call_with_vectorcall(method_info.call_func.value(), self, argument_count,
+					[args](size_t i) -> py::object { return cast(args[i]); }); // XXX: cast info
+
 				return;
 			}
 			CATCH_EXCEPTIONS_AND_PRINT_ERRORS(
@@ -121,22 +183,27 @@ PyGDExtensionClassMethodInfo::operator GDExtensionClassMethodInfo() {
 
 			py::gil_scoped_acquire gil;
 
+			const auto& cached_data = *method_info._cached_data;
+
 			try {
-				if(method_info.method_flags & GDEXTENSION_METHOD_FLAG_STATIC) {
-					cast(res, get_return_cast_info(method_info)) // XXX: cache
-						= method_info.call_func.value()(*cast(args, get_arguments_cast_info(method_info)));
-				}
-				else {
-					py::object self = py::cast(reinterpret_cast<Object*>(p_instance));
-					cast(res, get_return_cast_info(method_info)) // XXX: cache
-						= method_info.call_func.value()(self, *cast(args, get_arguments_cast_info(method_info)));
+				py::object self;
+
+				if(!(method_info.method_flags & GDEXTENSION_METHOD_FLAG_STATIC)) {
+					self = py::cast(reinterpret_cast<Object*>(p_instance));
 				}
+
+				const auto& arguments_cast_info = cached_data.arguments_cast_info;
+
+				cast(res, cached_data.return_cast_info) = call_with_vectorcall(
+					method_info.call_func.value(), self, arguments_cast_info.size(),
+					[args, &arguments_cast_info](size_t i) -> py::object { return cast(args[i], arguments_cast_info[i]); });
+
 				return;
 			}
 			CATCH_EXCEPTIONS_AND_PRINT_ERRORS(
 				"While calling: " + get_fully_qualified_name(method_info.call_func.value_or(py::none())))
 
-			cast(res, get_return_cast_info(method_info)) = py::object(); // XXX
+			cast(res, cached_data.return_cast_info) = py::object(); // XXX
 		},
 
 		.method_flags = static_cast<uint32_t>(method_flags),
@@ -0,0 +1,342 @@
+#include <cstddef>
+#include <vector>
+
+#include <structmember.h>
+
+#include "module/method_wrapper.h"
+
+
+namespace pygodot {
+
+
+namespace {
+
+
+struct MethodWrapperObject {
+	PyObject_HEAD
+	vectorcallfunc vectorcall;
+
+	PyObject* func; // called with all arguments positionally
+	PyObject* arg_names; // tuple of argument names, including `self` for methods
+	PyObject* defaults; // tuple of default values for the last arguments
+	PyObject* dict; // `__name__`, `__qualname__`, `__doc__`, `__wrapped__`, ...
+
+	Py_ssize_t arg_count;
+	bool is_method;
+	bool is_vararg;
+};
+
+
+PyTypeObject* method_wrapper_type = nullptr;
+
+
+// borrowed reference to the name used in error messages
+PyObject* method_wrapper_name(MethodWrapperObject* self) {
+	static PyObject* default_name = PyUnicode_InternFromString("method");
+
+	PyObject* name = self->dict ? PyDict_GetItemString(self->dict, "__qualname__") : nullptr;
+	return name ? name : default_name;
+}
+
+
+Py_ssize_t method_wrapper_find_arg(MethodWrapperObject* self, PyObject* key) {
+	for(Py_ssize_t i = 0; i < self->arg_count; i++) {
+		if(PyTuple_GET_ITEM(self->arg_names, i) == key) {
+			return i;
+		}
+	}
+
+	// keyword names are usually interned, only compare by value when that fails
+	for(Py_ssize_t i = 0; i < self->arg_count; i++) {
+		int res = PyObject_RichCompareBool(PyTuple_GET_ITEM(self->arg_names, i), key, Py_EQ);
+
+		if(res < 0) {
+			return -2;
+		}
+		if(res) {
+			return i;
+		}
+	}
+
+	return -1;
+}
+
+
+PyObject* method_wrapper_vectorcall(PyObject* self_base, PyObject* const* args, size_t nargsf, PyObject* kwnames) {
+	auto* self = reinterpret_cast<MethodWrapperObject*>(self_base);
+
+	Py_ssize_t nargs = PyVectorcall_NARGS(nargsf);
+	Py_ssize_t nkwargs = kwnames ? PyTuple_GET_SIZE(kwnames) : 0;
+
+	if(nkwargs == 0 && (nargs == self->arg_count || (self->is_vararg && nargs > self->arg_count))) {
+		// all arguments given positionally, nothing to fill in
+		return PyObject_Vectorcall(self->func, args, nargsf, nullptr);
+	}
+
+	if(nargs > self->arg_count && !self->is_vararg) {
+		PyErr_Format(PyExc_TypeError, "%S() takes %zd positional arguments but %zd were given",
+			method_wrapper_name(self), self->arg_count, nargs);
+		return nullptr;
+	}
+
+	Py_ssize_t total = nargs > self->arg_count ? nargs : self->arg_count;
+
+	// references are borrowed from the caller and the defaults tuple for the duration of the call
+	std::vector<PyObject*> call_args(total, nullptr);
+
+	for(Py_ssize_t i = 0; i < nargs; i++) {
+		call_args[i] = args[i];
+	}
+
+	for(Py_ssize_t i = 0; i < nkwargs; i++) {
+		PyObject* key = PyTuple_GET_ITEM(kwnames, i);
+		Py_ssize_t index = method_wrapper_find_arg(self, key);
+
+		if(index == -2) {
+			return nullptr;
+		}
+
+		if(index < 0) {
+			PyErr_Format(PyExc_TypeError, "%S() got an unexpected keyword argument %R",
+				method_wrapper_name(self), key);
+			return nullptr;
+		}
+
+		if(call_args[index]) {
+			PyErr_Format(PyExc_TypeError, "%S() got multiple values for argument %R",
+				method_wrapper_name(self), key);
+			return nullptr;
+		}
+
+		call_args[index] = args[nargs + i];
+	}
+
+	Py_ssize_t defaults_start = self->arg_count - PyTuple_GET_SIZE(self->defaults);
+
+	for(Py_ssize_t i = 0; i < self->arg_count; i++) {
+		if(call_args[i]) {
+			continue;
+		}
+
+		if(i < defaults_start) {
+			PyErr_Format(PyExc_TypeError, "%S() missing required argument %R",
+				method_wrapper_name(self), PyTuple_GET_ITEM(self->arg_names, i));
+			return nullptr;
+		}
+
+		call_args[i] = PyTuple_GET_ITEM(self->defaults, i - defaults_start);
+	}
+
+	return PyObject_Vectorcall(self->func, call_args.data(), total, nullptr);
+}
+
+
+PyObject* method_wrapper_descr_get(PyObject* self_base, PyObject* obj, PyObject* type) {
+	auto* self = reinterpret_cast<MethodWrapperObject*>(self_base);
+
+	if(!self->is_method || obj == nullptr || obj == Py_None) {
+		return Py_NewRef(self_base);
+	}
+
+	return PyMethod_New(self_base, obj);
+}
+
+
+PyObject* method_wrapper_repr(PyObject* self_base) {
+	auto* self = reinterpret_cast<MethodWrapperObject*>(self_base);
+	return PyUnicode_FromFormat("<native method %S>", method_wrapper_name(self));
+}
+
+
+PyObject* method_wrapper_get_signature(PyObject* self_base, void*) {
+	auto* self = reinterpret_cast<MethodWrapperObject*>(self_base);
+
+	if(!self->dict) {
+		self->dict = PyDict_New();
+		if(!self->dict) {
+			return nullptr;
+		}
+	}
+
+	if(PyObject* signature = PyDict_GetItemString(self->dict, "__signature__")) {
+		return Py_NewRef(signature);
+	}
+
+	PyObject* wrapped = PyDict_GetItemString(self->dict, "__wrapped__");
+
+	if(!wrapped) {
+		PyErr_SetString(PyExc_AttributeError, "__signature__");
+		return nullptr;
+	}
+
+	// computed from the wrapped python function on first access, only needed by tooling
+	PyObject* inspect = PyImport_ImportModule("inspect");
+	if(!inspect) {
+		return nullptr;
+	}
+
+	PyObject* signature = PyObject_CallMethod(inspect, "signature", "O", wrapped);
+	Py_DECREF(inspect);
+
+	if(!signature || PyDict_SetItemString(self->dict, "__signature__", signature) < 0) {
+		Py_XDECREF(signature);
+		return nullptr;
+	}
+
+	return signature;
+}
+
+
+int method_wrapper_set_signature(PyObject* self_base, PyObject* value, void*) {
+	auto* self = reinterpret_cast<MethodWrapperObject*>(self_base);
+
+	if(!self->dict) {
+		self->dict = PyDict_New();
+		if(!self->dict) {
+			return -1;
+		}
+	}
+
+	if(!value) {
+		return PyDict_DelItemString(self->dict, "__signature__");
+	}
+
+	return PyDict_SetItemString(self->dict, "__signature__", value);
+}
+
+
+int method_wrapper_traverse(PyObject* self_base, visitproc visit, void* arg) {
+	auto* self = reinterpret_cast<MethodWrapperObject*>(self_base);
+
+	Py_VISIT(Py_TYPE(self_base));
+	Py_VISIT(self->func);
+	Py_VISIT(self->arg_names);
+	Py_VISIT(self->defaults);
+	Py_VISIT(self->dict);
+
+	return 0;
+}
+
+
+int method_wrapper_clear(PyObject* self_base) {
+	auto* self = reinterpret_cast<MethodWrapperObject*>(self_base);
+
+	Py_CLEAR(self->func);
+	Py_CLEAR(self->arg_names);
+	Py_CLEAR(self->defaults);
+	Py_CLEAR(self->dict);
+
+	return 0;
+}
+
+
+void method_wrapper_dealloc(PyObject* self_base) {
+	PyTypeObject* type = Py_TYPE(self_base);
+
+	PyObject_GC_UnTrack(self_base);
+	method_wrapper_clear(self_base);
+
+	type->tp_free(self_base);
+	Py_DECREF(type);
+}
+
+
+PyMemberDef method_wrapper_members[] = {
+	{"__vectorcalloffset__", T_PYSSIZET, offsetof(MethodWrapperObject, vectorcall), READONLY, nullptr},
+	{"__dictoffset__", T_PYSSIZET, offsetof(MethodWrapperObject, dict), READONLY, nullptr},
+	{"__func__", T_OBJECT, offsetof(MethodWrapperObject, func), READONLY, nullptr},
+	{"__defaults__", T_OBJECT, offsetof(MethodWrapperObject, defaults), READONLY, nullptr},
+	{nullptr},
+};
+
+
+PyGetSetDef method_wrapper_getset[] = {
+	{"__dict__", PyObject_GenericGetDict, PyObject_GenericSetDict, nullptr, nullptr},
+	{"__signature__", method_wrapper_get_signature, method_wrapper_set_signature, nullptr, nullptr},
+	{nullptr},
+};
+
+
+PyType_Slot method_wrapper_slots[] = {
+	{Py_tp_call, reinterpret_cast<void*>(PyVectorcall_Call)},
+	{Py_tp_descr_get, reinterpret_cast<void*>(method_wrapper_descr_get)},
+	{Py_tp_repr, reinterpret_cast<void*>(method_wrapper_repr)},
+	{Py_tp_traverse, reinterpret_cast<void*>(method_wrapper_traverse)},
+	{Py_tp_clear, reinterpret_cast<void*>(method_wrapper_clear)},
+	{Py_tp_dealloc, reinterpret_cast<void*>(method_wrapper_dealloc)},
+	{Py_tp_members, method_wrapper_members},
+	{Py_tp_getset, method_wrapper_getset},
+	{0, nullptr},
+};
+
+
+PyType_Spec method_wrapper_spec = {
+	"_gdextension.MethodWrapper",
+	sizeof(MethodWrapperObject),
+	0,
+	// NOTE: `Py_TPFLAGS_METHOD_DESCRIPTOR` lets `obj.method()` skip creating a bound method, wrappers
+	// that aren't methods are only stored on modules or wrapped in `staticmethod`
+	Py_TPFLAGS_DEFAULT | Py_TPFLAGS_HAVE_GC | Py_TPFLAGS_HAVE_VECTORCALL | Py_TPFLAGS_METHOD_DESCRIPTOR,
+	method_wrapper_slots,
+};
+
+
+} // namespace
+
+
+py::object make_method_wrapper(py::object func, py::tuple arg_names, py::tuple defaults,
+	bool is_method, bool is_vararg)
+{
+	if(!method_wrapper_type) {
+		throw std::runtime_error("method wrapper type not initialized");
+	}
+
+	if(defaults.size() > arg_names.size()) {
+		throw py::value_error("more defaults than arguments");
+	}
+
+	if(PyInstanceMethod_Check(func.ptr())) {
+		// pybind11 methods are wrapped to bind as methods, call the function directly
+		func = py::reinterpret_borrow<py::object>(PyInstanceMethod_GET_FUNCTION(func.ptr()));
+	}
+
+	auto* self = PyObject_GC_New(MethodWrapperObject, method_wrapper_type);
+
+	if(!self) {
+		throw py::error_already_set();
+	}
+
+	self->vectorcall = method_wrapper_vectorcall;
+
+	self->func = func.release().ptr();
+	self->arg_names = arg_names.release().ptr();
+	self->defaults = defaults.release().ptr();
+	self->dict = nullptr;
+
+	self->arg_count = PyTuple_GET_SIZE(self->arg_names);
+	self->is_method = is_method;
+	self->is_vararg = is_vararg;
+
+	PyObject_GC_Track(self);
+
+	return py::reinterpret_steal<py::object>(reinterpret_cast<PyObject*>(self));
+}
+
+
+void def_method_wrapper(py::module_& module_) {
+	method_wrapper_type = reinterpret_cast<PyTypeObject*>(PyType_FromSpec(&method_wrapper_spec));
+
+	if(!method_wrapper_type) {
+		throw py::error_already_set();
+	}
+
+	module_.attr("MethodWrapper") = py::reinterpret_borrow<py::object>(
+		reinterpret_cast<PyObject*>(method_wrapper_type));
+
+	module_.def("make_method_wrapper", make_method_wrapper,
+		py::arg("func"), py::arg("arg_names"), py::arg("defaults"),
+		py::kw_only(), py::arg("is_method"), py::arg("is_vararg"));
+}
+
+
+} // namespace pygodot
@@ -0,0 +1,21 @@
+#pragma once
+
+#include <pybind11/pybind11.h>
+
+
+namespace pygodot {
+
+
+namespace py = pybind11;
+
+
+// callable wrapping a bound method or utility function, implements vectorcall to fill in keyword and
+// default arguments natively instead of through a generated python function
+
+py::object make_method_wrapper(py::object func, py::tuple arg_names, py::tuple defaults,
+	bool is_method, bool is_vararg);
+
+void def_method_wrapper(py::module_& module_);
+
+
+} // namespace pygodot
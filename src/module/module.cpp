@@ -13,6 +13,7 @@
 #include "module/class_method_info.h"
 #include "module/class_creation_info.h"
 #include "module/script_instance_info.h"
+#include "module/method_wrapper.h"
 
 
 namespace pygodot {
@@ -100,6 +101,185 @@ py::object variant_get_ptr_indexed_setter(GDExtensionVariantType type, GDExtensi
 	);
 }
 
+// length of indexable variant types, `size` for arrays and `length` for strings, both `() -> int`
+
+static GDExtensionPtrBuiltInMethod variant_get_ptr_length_method(GDExtensionVariantType type) {
+	return extension_interface::variant_get_ptr_builtin_method(type,
+		StringName(type == GDEXTENSION_VARIANT_TYPE_STRING ? "length" : "size"), 3173160232);
+}
+
+static GDExtensionInt variant_length(GDExtensionPtrBuiltInMethod length_method, py::object self,
+	GDExtensionVariantType type)
+{
+	GDExtensionInt length = 0;
+	length_method(cast(self, type), nullptr, (GDExtensionTypePtr)&length, 0);
+	return length;
+}
+
+
+py::object variant_get_ptr_indexed_getter_checked(GDExtensionVariantType type,
+	GDExtensionVariantType return_value_type, py::object slice_getter, py::object convert)
+{
+	auto* indexed_getter = extension_interface::variant_get_ptr_indexed_getter(type);
+	auto* length_method = variant_get_ptr_length_method(type);
+
+	if(!indexed_getter || !length_method) {
+		return py::none();
+	}
+
+	return py::cpp_function([type, indexed_getter, length_method, return_value_type, slice_getter, convert](
+			py::object self, py::object index_obj) -> py::object
+		{
+			if(PySlice_Check(index_obj.ptr())) {
+				if(slice_getter.is_none()) {
+					throw py::type_error("slicing is not supported");
+				}
+				return slice_getter(self, index_obj);
+			}
+
+			GDExtensionInt index = py::cast<GDExtensionInt>(index_obj);
+			GDExtensionInt length = variant_length(length_method, self, type);
+
+			if(index < 0) {
+				index += length;
+			}
+
+			if(index < 0 || index >= length) {
+				throw py::index_error("index out of range");
+			}
+
+			py::object ret;
+			indexed_getter(cast(self, type), index,
+				cast(std::ref(ret), return_value_type, false, nullptr)); // XXX: cast info
+
+			if(!convert.is_none()) {
+				return convert(ret);
+			}
+
+			return ret;
+		},
+		py::is_method(variant_type_handle(type)),
+		py::name("__getitem__")
+	);
+}
+
+py::object variant_get_ptr_indexed_setter_checked(GDExtensionVariantType type, GDExtensionVariantType value_type)
+{
+	auto* indexed_setter = extension_interface::variant_get_ptr_indexed_setter(type);
+	auto* length_method = variant_get_ptr_length_method(type);
+
+	if(!indexed_setter || !length_method) {
+		return py::none();
+	}
+
+	return py::cpp_function([type, indexed_setter, length_method, value_type](py::object self,
+			GDExtensionInt index, const py::object value)
+		{
+			GDExtensionInt length = variant_length(length_method, self, type);
+
+			if(index < 0) {
+				index += length;
+			}
+
+			if(index < 0 || index >= length) {
+				throw py::index_error("index out of range");
+			}
+
+			indexed_setter(cast(self, type), index, cast(value, value_type)); // XXX: cast info
+		},
+		py::is_method(variant_type_handle(type)),
+		py::name("__setitem__")
+	);
+}
+
+
+// iterates an indexable variant by index, the length is checked on each step so changes to the
+// length while iterating end the iteration instead of reading out of bounds
+
+class VariantIndexedIterator {
+	py::object obj;
+	py::object convert;
+
+	GDExtensionVariantType type;
+	GDExtensionVariantType return_value_type;
+	GDExtensionPtrIndexedGetter indexed_getter;
+	GDExtensionPtrBuiltInMethod length_method;
+
+	GDExtensionInt index;
+	bool reversed;
+
+public:
+	VariantIndexedIterator(py::object obj, py::object convert,
+		GDExtensionVariantType type, GDExtensionVariantType return_value_type,
+		GDExtensionPtrIndexedGetter indexed_getter, GDExtensionPtrBuiltInMethod length_method, bool reversed)
+		: obj(obj), convert(convert), type(type), return_value_type(return_value_type),
+		indexed_getter(indexed_getter), length_method(length_method), reversed(reversed)
+	{
+		index = reversed ? variant_length(length_method, obj, type) - 1 : 0;
+	}
+
+	py::object next() {
+		if(obj.is_none()) {
+			throw py::stop_iteration();
+		}
+
+		GDExtensionInt length = variant_length(length_method, obj, type);
+
+		if(index < 0 || index >= length) {
+			obj = py::none(); // release the iterated object like python's iterators
+			throw py::stop_iteration();
+		}
+
+		py::object ret;
+		indexed_getter(cast(obj, type), index,
+			cast(std::ref(ret), return_value_type, false, nullptr)); // XXX: cast info
+
+		index += reversed ? -1 : 1;
+
+		if(!convert.is_none()) {
+			return convert(ret);
+		}
+
+		return ret;
+	}
+
+	static py::object make_factory(GDExtensionVariantType type, GDExtensionVariantType return_value_type,
+		bool reversed, py::object convert)
+	{
+		auto* indexed_getter = extension_interface::variant_get_ptr_indexed_getter(type);
+		auto* length_method = variant_get_ptr_length_method(type);
+
+		if(!indexed_getter || !length_method) {
+			return py::none();
+		}
+
+		return py::cpp_function([type, return_value_type, indexed_getter, length_method, reversed, convert](
+				py::object self)
+			{
+				return VariantIndexedIterator(self, convert, type, return_value_type,
+					indexed_getter, length_method, reversed);
+			},
+			py::is_method(variant_type_handle(type)),
+			py::name(reversed ? "__reversed__" : "__iter__")
+		);
+	}
+
+	static void def(py::module_& module_) {
+		using type = VariantIndexedIterator;
+
+		py::class_<type>(module_, "_VariantIndexedIterator",
+			py::custom_type_setup(garbage_collection_type_setup<type>()
+				.collect(&type::obj)
+				.collect(&type::convert)
+			)
+		)
+			.def("__iter__", [](py::object self) { return self; })
+			.def("__next__", &type::next)
+		;
+	}
+};
+
+
 py::object variant_get_ptr_keyed_getter(GDExtensionVariantType type, GDExtensionVariantType key_type,
 	GDExtensionVariantType return_value_type)
 {
@@ -226,6 +406,38 @@ py::object variant_get_ptr_operator_evaluator(GDExtensionVariantOperator operato
 }
 
 
+py::object variant_get_ptr_operator_evaluator_inplace(GDExtensionVariantOperator operator_,
+	GDExtensionVariantType type_a, GDExtensionVariantType type_b, py::function fallback)
+{
+	auto* eval = extension_interface::variant_get_ptr_operator_evaluator(operator_, type_a, type_b);
+
+	if(!eval) {
+		return py::none();
+	}
+
+	// the result is written directly into the storage of the left operand, only valid when the
+	// operator returns the type of the left operand
+	// godot's evaluators compute the result before storing it so the operands may alias the result
+	return py::cpp_function([eval, type_a, type_b, fallback = std::move(fallback)](
+			py::object obj_a, py::object obj_b) -> py::object
+		{
+			if(!py::isinstance(obj_a, variant_type_handle(type_a))) {
+				// the left operand has no variant storage to write to, evaluate into a new value instead
+				return fallback(obj_a, obj_b);
+			}
+
+			auto a = cast(obj_a, type_a);
+			GDExtensionTypePtr ptr_a = a;
+
+			eval(ptr_a, cast(obj_b, type_b), ptr_a);
+
+			return obj_a;
+		},
+		py::name("eval_inplace")
+	);
+}
+
+
 
 
 py::object variant_get_ptr_builtin_method(
@@ -305,7 +517,8 @@ py::object variant_get_ptr_builtin_method(
 
 
 py::object classdb_get_method_bind(
-	const StringName& class_name, const PyGDExtensionClassMethodInfo& method, GDExtensionInt hash)
+	const StringName& class_name, const PyGDExtensionClassMethodInfo& method, GDExtensionInt hash,
+	bool release_gil)
 {
 	bool is_static_method = ((method.method_flags & GDEXTENSION_METHOD_FLAG_STATIC) != 0);
 
@@ -328,7 +541,7 @@ py::object classdb_get_method_bind(
 		auto type = resolve_name("godot." + std::string(class_name));
 
 		return py::cpp_function(
-			[name = std::move(name), type, method_ptr, return_type, arg_types]
+			[name = std::move(name), type, method_ptr, return_type, arg_types, release_gil]
 				(Object& self, py::args args) -> py::object
 			{
 				if(!self.is_valid()) {
@@ -341,9 +554,18 @@ py::object classdb_get_method_bind(
 				}
 
 				py::object ret;
-				call_without_gil(extension_interface::object_method_bind_ptrcall,
-					method_ptr, self, cast(args, arg_types), cast(std::ref(ret), return_type)
-				);
+				{
+					auto arg_ptrs = cast(args, arg_types);
+					auto ret_intermediate = cast(std::ref(ret), return_type);
+
+					// take the pointers before the gil may be released, taking the return pointer can create
+					// the returned python object
+					GDExtensionTypePtr ret_ptr = ret_intermediate;
+
+					call_with_gil_policy(release_gil, extension_interface::object_method_bind_ptrcall,
+						method_ptr, self, arg_ptrs.data(), ret_ptr
+					);
+				}
 				return ret;
 			},
 			py::is_method(type),
@@ -352,13 +574,22 @@ py::object classdb_get_method_bind(
 	}
 	else {
 		return py::cpp_function(
-			[name = std::move(name), method_ptr, return_type, arg_types]
+			[name = std::move(name), method_ptr, return_type, arg_types, release_gil]
 				(py::args args) -> py::object
 			{
 				py::object ret;
-				call_without_gil(extension_interface::object_method_bind_ptrcall,
-					method_ptr, nullptr, cast(args, arg_types), cast(std::ref(ret), return_type)
-				);
+				{
+					auto arg_ptrs = cast(args, arg_types);
+					auto ret_intermediate = cast(std::ref(ret), return_type);
+
+					// take the pointers before the gil may be released, taking the return pointer can create
+					// the returned python object
+					GDExtensionTypePtr ret_ptr = ret_intermediate;
+
+					call_with_gil_policy(release_gil, extension_interface::object_method_bind_ptrcall,
+						method_ptr, nullptr, arg_ptrs.data(), ret_ptr
+					);
+				}
 				return ret;
 			},
 			py::name(name_data)
@@ -368,6 +599,211 @@ py::object classdb_get_method_bind(
 
 
 
+// values of one argument for every item of a batch call, read in place from a buffer when its layout matches the
+// argument type, otherwise cast from the items of a sequence one at a time
+class batch_argument_t {
+	using item_cast_t = decltype(cast(std::declval<py::handle>(), std::declval<GDExtensionVariantType>()));
+
+	GDExtensionVariantType variant_type;
+
+	Py_buffer view{};
+	bool has_view = false;
+	size_t value_size = 0;
+
+	py::object sequence;
+	std::optional<item_cast_t> item_cast;
+
+	batch_argument_t() = delete;
+	batch_argument_t(const batch_argument_t&) = delete;
+	batch_argument_t(batch_argument_t&&) = delete;
+
+public:
+	batch_argument_t(py::handle values, GDExtensionVariantType variant_type, size_t count)
+		: variant_type(variant_type)
+	{
+		auto layout = get_variant_value_layout(variant_type);
+
+		if(layout && PyObject_CheckBuffer(values.ptr())) {
+			if(PyObject_GetBuffer(values.ptr(), &view, PyBUF_C_CONTIGUOUS | PyBUF_FORMAT) == 0) {
+				if(buffer_format_matches(view, *layout) && static_cast<size_t>(view.len) == count * layout->size) {
+					has_view = true;
+					value_size = layout->size;
+					return;
+				}
+
+				PyBuffer_Release(&view);
+			}
+			else {
+				PyErr_Clear();
+			}
+		}
+
+		sequence = py::reinterpret_steal<py::object>(
+			PySequence_Fast(values.ptr(), "batch arguments must be sequences or buffers"));
+
+		if(!sequence) {
+			throw py::error_already_set();
+		}
+
+		if(static_cast<size_t>(PySequence_Fast_GET_SIZE(sequence.ptr())) != count) {
+			throw py::value_error("batch arguments must have one value for each object, expected "
+				+ std::to_string(count) + " got " + std::to_string(PySequence_Fast_GET_SIZE(sequence.ptr())));
+		}
+	}
+
+	~batch_argument_t() {
+		if(has_view) {
+			PyBuffer_Release(&view);
+		}
+	}
+
+	// the pointer is valid until the next call
+	GDExtensionConstTypePtr get(size_t index) {
+		if(has_view) {
+			return static_cast<const std::byte*>(view.buf) + index * value_size;
+		}
+
+		GDExtensionConstTypePtr ptr;
+		ptr = item_cast.emplace(PySequence_Fast_GET_ITEM(sequence.ptr(), index), variant_type);
+		return ptr;
+	}
+};
+
+
+py::object classdb_get_method_bind_batch(
+	const StringName& class_name, const PyGDExtensionClassMethodInfo& method, GDExtensionInt hash)
+{
+	bool is_static_method = ((method.method_flags & GDEXTENSION_METHOD_FLAG_STATIC) != 0);
+	bool is_vararg = ((method.method_flags & GDEXTENSION_METHOD_FLAG_VARARG) != 0);
+
+	if(is_static_method || is_vararg) {
+		return py::none();
+	}
+
+	GDExtensionConstMethodBindPtr method_ptr = extension_interface::classdb_get_method_bind(
+		class_name, method.name, hash);
+
+	if(!method_ptr) {
+		return py::none();
+	}
+
+	const auto arg_types = get_arguments_cast_info(method);
+	const auto return_type = get_return_cast_info(method);
+
+	auto type = resolve_name("godot." + std::string(class_name));
+	auto qualname = std::make_unique<std::string>(std::string(class_name) + "." + std::string(method.name));
+	auto* name_data = qualname->data();
+
+	// calls the method on each object with the arguments at the same index, returns the results as a list, or
+	// writes them in place to `out` if given, a buffer matching the layout of the return type
+	return py::cpp_function(
+		[qualname = std::move(qualname), type, method_ptr, return_type, arg_types]
+			(py::handle objects, py::args args, py::object out) -> py::object
+		{
+			if(args.size() != arg_types.size()) {
+				throw py::type_error(*qualname + ".batch() takes " + std::to_string(arg_types.size())
+					+ " argument sequences but " + std::to_string(args.size()) + " were given");
+			}
+
+			auto objects_fast = py::reinterpret_steal<py::object>(
+				PySequence_Fast(objects.ptr(), "batch objects must be a sequence"));
+
+			if(!objects_fast) {
+				throw py::error_already_set();
+			}
+
+			size_t count = PySequence_Fast_GET_SIZE(objects_fast.ptr());
+
+			stable_vector<batch_argument_t> arguments(arg_types.size());
+			std::vector<GDExtensionConstTypePtr> argument_ptrs(arg_types.size());
+
+			for(size_t i = 0; i < arg_types.size(); i++) {
+				arguments.emplace_back(args[i], arg_types[i].variant_type, count);
+			}
+
+			bool has_return = (return_type.variant_type != GDEXTENSION_VARIANT_TYPE_NIL);
+
+			std::optional<py::buffer_info> out_info;
+			size_t out_value_size = 0;
+
+			if(!out.is_none()) {
+				auto layout = has_return ? get_variant_value_layout(return_type.variant_type) : std::nullopt;
+
+				if(!layout) {
+					throw py::type_error(*qualname + ".batch() can only write plain data return values to a buffer");
+				}
+
+				auto* view = new Py_buffer();
+
+				if(PyObject_GetBuffer(out.ptr(), view, PyBUF_C_CONTIGUOUS | PyBUF_FORMAT | PyBUF_WRITABLE) != 0) {
+					delete view;
+					throw py::error_already_set();
+				}
+
+				// takes ownership of the view, released and deleted with the buffer info
+				out_info.emplace(view, true);
+
+				if(!buffer_format_matches(*view, *layout) || static_cast<size_t>(view->len) != count * layout->size) {
+					throw py::value_error(*qualname + ".batch() output buffer must be contiguous and hold "
+						+ std::to_string(count) + " values of " + std::to_string(layout->scalar_count) + " scalars of "
+						+ std::to_string(layout->scalar_size) + " bytes");
+				}
+
+				out_value_size = layout->size;
+			}
+
+			py::list results((has_return && !out_info) ? count : 0);
+
+			for(size_t index = 0; index < count; index++) {
+				py::handle obj = PySequence_Fast_GET_ITEM(objects_fast.ptr(), index);
+
+				if(!py::isinstance(obj, type)) {
+					throw py::type_error(*qualname + ".batch() expected objects of type '"
+						+ std::string(py::str(type.attr("__name__"))) + "', got '"
+						+ get_fully_qualified_name(py::type::handle_of(obj)) + "' at index " + std::to_string(index));
+				}
+
+				auto& self = py::cast<Object&>(obj);
+
+				if(!self.is_valid()) {
+					throw std::runtime_error("Cannot call method '" + *qualname
+						+ "' on a previously freed instance at index " + std::to_string(index) + ".");
+				}
+
+				for(size_t i = 0; i < argument_ptrs.size(); i++) {
+					argument_ptrs[i] = arguments.data()[i].get(index);
+				}
+
+				if(out_info) {
+					extension_interface::object_method_bind_ptrcall(method_ptr, self, argument_ptrs.data(),
+						static_cast<std::byte*>(out_info->ptr) + index * out_value_size);
+
+					continue;
+				}
+
+				py::object ret;
+				extension_interface::object_method_bind_ptrcall(
+					method_ptr, self, argument_ptrs.data(), cast(std::ref(ret), return_type));
+
+				if(has_return) {
+					PyList_SET_ITEM(results.ptr(), index, ret.release().ptr());
+				}
+			}
+
+			if(out_info) {
+				return out;
+			}
+
+			return has_return ? py::object(results) : py::none();
+		},
+		py::name(name_data),
+		py::arg("objects"),
+		py::arg("out") = py::none()
+	);
+}
+
+
+
 py::object variant_get_ptr_utility_function(const PyGDExtensionClassMethodInfo& function, GDExtensionInt hash)
 {
 	bool is_vararg = ((function.method_flags & GDEXTENSION_METHOD_FLAG_VARARG) != 0);
@@ -439,6 +875,8 @@ py::str variant_stringify(py::object obj) {
 PYBIND11_EMBEDDED_MODULE(_gdextension, module_) {
 	using namespace pygodot;
 
+	module_set_gil_not_used(module_);
+
 	// enumerations
 
 #define ENUM_VALUE(type, name) .value(#name, type::name)
@@ -608,6 +1046,9 @@ PYBIND11_EMBEDDED_MODULE(_gdextension, module_) {
 	// internal types
 
 	MemoryReference::def(module_);
+	VariantIndexedIterator::def(module_);
+
+	def_method_wrapper(module_);
 
 	// methods
 
@@ -680,14 +1121,21 @@ PYBIND11_EMBEDDED_MODULE(_gdextension, module_) {
 
 	module_.def("variant_get_ptr_indexed_getter", variant_get_ptr_indexed_getter);
 	module_.def("variant_get_ptr_indexed_setter", variant_get_ptr_indexed_setter);
+	module_.def("variant_get_ptr_indexed_getter_checked", variant_get_ptr_indexed_getter_checked);
+	module_.def("variant_get_ptr_indexed_setter_checked", variant_get_ptr_indexed_setter_checked);
+	module_.def("variant_get_indexed_iterator", VariantIndexedIterator::make_factory);
 	module_.def("variant_get_ptr_keyed_getter", variant_get_ptr_keyed_getter);
 	module_.def("variant_get_ptr_keyed_setter", variant_get_ptr_keyed_setter);
 	module_.def("variant_get_ptr_getter", variant_get_ptr_getter);
 	module_.def("variant_get_ptr_setter", variant_get_ptr_setter);
 
 	module_.def("variant_get_ptr_operator_evaluator", variant_get_ptr_operator_evaluator);
+	module_.def("variant_get_ptr_operator_evaluator_inplace", variant_get_ptr_operator_evaluator_inplace);
 
-	module_.def("classdb_get_method_bind", classdb_get_method_bind);
+	module_.def("classdb_get_method_bind", classdb_get_method_bind,
+		py::arg("class_name"), py::arg("method"), py::arg("hash"), py::arg("release_gil") = false);
+
+	module_.def("classdb_get_method_bind_batch", classdb_get_method_bind_batch);
 
 	module_.def("variant_get_ptr_utility_function", variant_get_ptr_utility_function);
 
@@ -779,6 +1227,42 @@ PYBIND11_EMBEDDED_MODULE(_gdextension, module_) {
 		return image_memoryview(object, false);
 	});
 
+
+	// reads and writes python buffers directly, without going through a `PackedByteArray`
+
+	static auto request_contiguous_buffer = [](py::handle obj, bool writable) -> py::buffer_info {
+		auto* view = new Py_buffer();
+
+		int flags = PyBUF_C_CONTIGUOUS | PyBUF_FORMAT | (writable ? PyBUF_WRITABLE : 0);
+
+		if(PyObject_GetBuffer(obj.ptr(), view, flags) != 0) {
+			delete view;
+			throw py::error_already_set();
+		}
+
+		return py::buffer_info(view, true);
+	};
+
+	module_.def("file_access_readinto", [](Object& file, py::handle buffer) -> uint64_t {
+		auto info = request_contiguous_buffer(buffer, true);
+
+		py::gil_scoped_release release;
+
+		return extension_interface::file_access_get_buffer(file, static_cast<uint8_t*>(info.ptr),
+			info.size * info.itemsize);
+	});
+
+	module_.def("file_access_write", [](Object& file, py::handle buffer) -> uint64_t {
+		auto info = request_contiguous_buffer(buffer, false);
+
+		py::gil_scoped_release release;
+
+		extension_interface::file_access_store_buffer(file, static_cast<const uint8_t*>(info.ptr),
+			info.size * info.itemsize);
+
+		return info.size * info.itemsize;
+	});
+
 }
 
 
@@ -833,16 +1317,57 @@ static py::bytes get_file_as_bytes(py::str path) {
 }
 
 
+// engine threads calling into python get a thread state from pybind11 on each call, which is destroyed
+// again when the call returns, losing any thread local state. `thread_enter` keeps the thread state of
+// the calling thread until `thread_exit`, both are called with the gil held
+
+static thread_local std::optional<PyGILState_STATE> entered_thread_gil_state;
+
+static void thread_enter() {
+	if(entered_thread_gil_state) {
+		return;
+	}
+
+	// holding an extra reference to the current thread state keeps it alive between calls
+	entered_thread_gil_state = PyGILState_Ensure();
+}
+
+static void thread_exit() {
+	if(!entered_thread_gil_state) {
+		return;
+	}
+
+	// the thread state is destroyed once the current call releases its reference
+	PyGILState_Release(*entered_thread_gil_state);
+	entered_thread_gil_state.reset();
+}
+
+
 } // namespace pygodot
 
 
 PYBIND11_EMBEDDED_MODULE(_godot_internal_core_utils, module_) {
 	using namespace pygodot;
 
+	module_set_gil_not_used(module_);
+
 	module_.def("variant_type_from_enum", variant_type_handle<GDExtensionVariantType>);
 	module_.def("variant_enum_from_type_inferred", variant_type_from_type_handle_inferred<py::object>);
 
 	module_.def("get_file_as_bytes", get_file_as_bytes);
+
+	module_.def("thread_enter", thread_enter);
+	module_.def("thread_exit", thread_exit);
+
+	module_.def("get_native_startup_trace", []() {
+		py::list events;
+
+		for(auto& event : get_startup_trace_events()) {
+			events.append(py::make_tuple(event.name, event.start_ns, event.end_ns));
+		}
+
+		return py::make_tuple(events, startup_trace_clock_ns());
+	});
 }
 
 
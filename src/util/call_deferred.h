@@ -1,5 +1,6 @@
 #pragma once
 
+#include <atomic>
 #include <functional>
 
 #include "extension/extension.h"
@@ -11,12 +12,15 @@ namespace pygodot {
 class deferred_call_t {
 	std::function<void()> func;
 
+	// may be cancelled from another thread than the one making the call, `func` is only destroyed with the object
+	std::atomic<bool> cancelled = false;
+
 	template<typename Func>
 	deferred_call_t(Func&& func) : func(std::forward<Func>(func)) {
 	}
 
 	void operator()() {
-		if(func) {
+		if(!cancelled.load(std::memory_order_acquire)) {
 			func();
 		}
 	}
@@ -26,7 +30,7 @@ class deferred_call_t {
 
 public:
 	void cancel() {
-		func = decltype(func)();
+		cancelled.store(true, std::memory_order_release);
 	}
 };
 
@@ -36,5 +36,54 @@ decltype(auto) call_without_gil(Func&& func, Args&&... args) {
 }
 
 
+// releases the gil around `func` only if `release_gil` is set, releasing it on every engine call slows down
+// short calls so it is only done for calls that may block or run long (see `method_bind._release_gil_methods`)
+// `args` are passed on as given, any conversion that needs the gil must be done by the caller beforehand
+template<typename Func, typename... Args>
+decltype(auto) call_with_gil_policy(bool release_gil, Func&& func, Args&&... args) {
+	if(release_gil) {
+		py::gil_scoped_release released_gil;
+		return std::forward<Func>(func)(std::forward<Args>(args)...);
+	}
+
+	return std::forward<Func>(func)(std::forward<Args>(args)...);
+}
+
+
+// locks the per-object mutex of `obj` on free-threaded builds, serializing changes to state that the gil
+// protects otherwise, does nothing on builds with the gil (suspended like the gil while blocking)
+class scoped_critical_section {
+#ifdef Py_GIL_DISABLED
+	PyCriticalSection section;
+
+public:
+	scoped_critical_section(py::handle obj) {
+		PyCriticalSection_Begin(&section, obj.ptr());
+	}
+
+	~scoped_critical_section() {
+		PyCriticalSection_End(&section);
+	}
+#else
+public:
+	scoped_critical_section(py::handle obj) {
+	}
+#endif
+
+	scoped_critical_section(const scoped_critical_section&) = delete;
+	scoped_critical_section& operator=(const scoped_critical_section&) = delete;
+};
+
+
+// declares that the module does not need the gil on free-threaded builds, otherwise importing it enables the gil
+inline void module_set_gil_not_used(py::module_& module_) {
+#ifdef Py_GIL_DISABLED
+	if(PyUnstable_Module_SetGIL(module_.ptr(), Py_MOD_GIL_NOT_USED) < 0) {
+		throw py::error_already_set();
+	}
+#endif
+}
+
+
 } // namespace pygodot
 
@@ -1,5 +1,9 @@
 #pragma once
 
+#include <bit>
+#include <cstring>
+#include <optional>
+
 #include <pybind11/pybind11.h>
 
 #include "extension/extension.h"
@@ -282,6 +286,86 @@ void variant_release_buffer(PyObject* obj_base, Py_buffer* view) {
 }
 
 
+// plain data layout of a variant value type, used to read and write values directly in python buffers
+
+struct variant_value_layout_t {
+	size_t size; // size of a value
+	size_t scalar_size; // size of each scalar in the value
+	size_t scalar_count;
+	char scalar_kind; // 'f' floating point, 'i' signed or 'u' unsigned integer, '?' bool
+};
+
+
+template<typename Scalar>
+constexpr variant_value_layout_t make_variant_value_layout(size_t size) {
+	char kind = std::is_same_v<Scalar, GDExtensionBool> ? '?'
+		: std::is_floating_point_v<Scalar> ? 'f'
+		: std::is_signed_v<Scalar> ? 'i'
+		: 'u';
+
+	return {size, sizeof(Scalar), size / sizeof(Scalar), kind};
+}
+
+
+// returns `std::nullopt` for types that are not plain data, such as arrays, strings and objects
+inline std::optional<variant_value_layout_t> get_variant_value_layout(GDExtensionVariantType variant_type) {
+	switch(variant_type) {
+		case GDEXTENSION_VARIANT_TYPE_BOOL:
+			return make_variant_value_layout<GDExtensionBool>(sizeof(GDExtensionBool));
+		case GDEXTENSION_VARIANT_TYPE_INT:
+			return make_variant_value_layout<GDExtensionInt>(sizeof(GDExtensionInt));
+		case GDEXTENSION_VARIANT_TYPE_FLOAT:
+			return make_variant_value_layout<GDExtensionFloat>(sizeof(GDExtensionFloat));
+		default:
+			break;
+	}
+
+#define GDEXTENSION_BUFFER_TYPE(type_name, type_size, base_type, ndim, shape, strides) \
+	if constexpr(!VariantArrayType<type_name> && std::is_arithmetic_v<variant_buffer_base_type<type_name>>) { \
+		if(variant_type == variant_type_to_enum_value<type_name>) { \
+			return make_variant_value_layout<variant_buffer_base_type<type_name>>(variant_type_size<type_name>); \
+		} \
+	}
+	GDEXTENSION_BUFFER_TYPES
+#undef GDEXTENSION_BUFFER_TYPE
+
+	return std::nullopt;
+}
+
+
+// layout of the elements of a packed array, ie 2 float scalars for `PackedVector2Array`
+template<VariantBufferType T>
+	requires VariantArrayType<T> && std::is_arithmetic_v<variant_buffer_base_type<T>>
+constexpr variant_value_layout_t variant_buffer_element_layout
+	= make_variant_value_layout<variant_buffer_base_type<T>>(variant_buffer_strides<T>[0]);
+
+
+// whether the scalars of a buffer can be read as the scalars of `layout`, only native byte order is accepted
+inline bool buffer_format_matches(const Py_buffer& view, const variant_value_layout_t& layout) {
+	const char* format = view.format ? view.format : "B";
+
+	if(*format == '@' || *format == '=' || (*format == '<' && std::endian::native == std::endian::little)) {
+		format++;
+	}
+
+	if(!format[0] || format[1] || static_cast<size_t>(view.itemsize) != layout.scalar_size) {
+		return false;
+	}
+
+	char kind = std::strchr("fde", format[0]) ? 'f'
+		: std::strchr("bhilqn", format[0]) ? 'i'
+		: std::strchr("BHILQN", format[0]) ? 'u'
+		: format[0] == '?' ? '?'
+		: 0;
+
+	if(layout.scalar_kind == '?') {
+		return kind == '?' || kind == 'u' || kind == 'i';
+	}
+
+	return kind == layout.scalar_kind;
+}
+
+
 class MemoryReference {
 	py::object obj;
 	py::buffer_info info;
@@ -183,7 +183,9 @@ namespace godot {
 }*/
 
 
-static Object* _object_currently_binding = nullptr;
+// set while `get_bound_instance` constructs the python object for an existing godot object, per thread as
+// bindings may be created from several threads at once
+static thread_local Object* _object_currently_binding = nullptr;
 
 
 void Object::_free() {
@@ -222,10 +224,15 @@ bool Object::_reference(bool reference) {
 	py::gil_scoped_acquire gil;
 
 	if(reference) {
+		// `_deferred_release` is shared with other threads on free-threaded builds
+		scoped_critical_section lock(_handle);
+
 		if(_deferred_release) {
 			DEBUG_REFCOUNT_FUNC(this, "call_deferred", ("..."), ("cancelled"))
 
+#ifndef Py_GIL_DISABLED
 			assert(Py_REFCNT(_handle.ptr()) == 1 && get_reference_count() == 2);
+#endif
 
 			_deferred_release->cancel();
 			_deferred_release = nullptr;
@@ -234,31 +241,44 @@ bool Object::_reference(bool reference) {
 		_handle.inc_ref();
 	}
 	else {
-		// fast release for special case
-		if(Py_REFCNT(_handle.ptr()) == 2 && get_reference_count() == 1) {
-			DEBUG_REFCOUNT_FUNC(this, "call_deferred", ("..."), ("scheduled"))
+		{
+			scoped_critical_section lock(_handle);
 
-			assert(!_deferred_release);
+			// fast release for special case
+			if(Py_REFCNT(_handle.ptr()) == 2 && get_reference_count() == 1) {
+				DEBUG_REFCOUNT_FUNC(this, "call_deferred", ("..."), ("scheduled"))
 
-			if(!_deferred_release) {
-				_deferred_release = &call_deferred([this]() mutable {
-					DEBUG_REFCOUNT_FUNC(this, "call_deferred", ("..."), ("called"))
+				assert(!_deferred_release);
 
-					py::gil_scoped_acquire gil;
+				if(!_deferred_release) {
+					_deferred_release = &call_deferred([this]() mutable {
+						DEBUG_REFCOUNT_FUNC(this, "call_deferred", ("..."), ("called"))
 
-					_deferred_release = nullptr;
+						py::gil_scoped_acquire gil;
+
+						bool release;
+
+						{
+							scoped_critical_section lock(_handle);
 
-					if(_ptr && Py_REFCNT(_handle.ptr()) == 1 && get_reference_count() == 1) {
-						py::object obj = py::reinterpret_borrow<py::object>(_handle);
+							_deferred_release = nullptr;
 
-						if(unreference()) {
-							_destroy();
+							release = _ptr && Py_REFCNT(_handle.ptr()) == 1 && get_reference_count() == 1;
 						}
-					}
-				});
+
+						if(release) {
+							py::object obj = py::reinterpret_borrow<py::object>(_handle);
+
+							if(unreference()) {
+								_destroy();
+							}
+						}
+					});
+				}
 			}
 		}
 
+		// outside of the critical section, this may deallocate the python object
 		_handle.dec_ref();
 	}
 
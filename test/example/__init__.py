@@ -1,4 +1,5 @@
 import enum
+import threading
 
 import godot
 
@@ -41,6 +42,11 @@ class Example(godot.Node, expose_all_methods = True):
 	def __init__(self):
 		self._pos = godot.Vector2(0, 0)
 
+		self._thread_local = threading.local()
+		self._thread_calls_lock = threading.Lock()
+		self._thread_calls = {}
+		self._thread_local_calls = {}
+
 
 	def emit_custom_signal(self, name: str, value: int):
 		self.custom_signal.emit(name, value)
@@ -106,6 +112,194 @@ class Example(godot.Node, expose_all_methods = True):
 		return a + b
 
 
+	def threaded_call(self, value: int) -> int:
+		# called from engine worker threads at once
+		self._thread_local.calls = getattr(self._thread_local, 'calls', 0) + 1
+
+		with self._thread_calls_lock:
+			ident = threading.get_ident()
+			self._thread_calls[ident] = self._thread_calls.get(ident, 0) + 1
+			self._thread_local_calls[ident] = self._thread_local.calls
+
+		return value * value
+
+	def thread_state_kept(self) -> bool:
+		# thread local counts only match the totals if each thread kept its thread state between calls
+		with self._thread_calls_lock:
+			return len(self._thread_calls) > 0 and self._thread_calls == self._thread_local_calls
+
+
+	def interpreter_pool_squares(self, count: int, offset: int) -> godot.Array:
+		# runs `pool_tasks.square` in sub-interpreters, the module is imported there from its sent source
+		import pool_tasks
+
+		pool = godot.utils.get_interpreter_pool()
+		group_id = pool.add_group_task(pool_tasks.square, count, offset)
+
+		return godot.Array(pool.wait_for_group_task_completion(group_id))
+
+	def interpreter_pool_length(self, vector: godot.Vector2) -> float:
+		import pool_tasks
+
+		pool = godot.utils.get_interpreter_pool()
+
+		return pool.wait_for_task_completion(pool.add_task(pool_tasks.length, vector))
+
+
+	def test_slicing(self) -> godot.Array:
+		array = godot.PackedInt32Array(range(6))
+		string = godot.String('abcdef')
+
+		return godot.Array([
+			array[1:4], array[-2:], array[::2], array[::-1], array[4:1:-1], array[3:1],
+			godot.Array([1, 'a', 2.5])[::-1],
+			string[1:4], string[-2:], string[::2], string[::-1], string[-1:-4:-2],
+		])
+
+	def test_indexed_iteration(self) -> godot.Array:
+		array = godot.PackedInt32Array(range(5))
+		strings = godot.PackedStringArray(['a', 'b'])
+
+		# shrinking the array while iterating ends the iteration
+		shrinking = godot.PackedInt32Array(range(5))
+		values = []
+
+		for value in shrinking:
+			values.append(value)
+			shrinking.resize(3)
+
+		return godot.Array([
+			type(iter(array)).__name__, list(array), list(reversed(array)),
+			list(strings), all(type(value) is str for value in strings),
+			values,
+		])
+
+
+	def test_method_batch(self) -> godot.Array:
+		nodes = [godot.Node2D() for i in range(3)]
+
+		try:
+			godot.Node2D.set_position.batch(nodes, [godot.Vector2(i, -i) for i in range(3)])
+			# read in place, the buffer matches the float argument
+			godot.Node2D.set_rotation.batch(nodes, godot.PackedFloat64Array([0.0, 0.5, 1.0]))
+
+			out = godot.PackedVector2Array()
+			out.resize(len(nodes))
+			godot.Node2D.get_position.batch(nodes, out=godot.writable_memoryview(out))
+
+			return godot.Array([
+				godot.Node2D.get_position.batch(nodes), out, godot.Node2D.get_rotation.batch(nodes),
+			])
+
+		finally:
+			for node in nodes:
+				node.free()
+
+
+	def test_gather_scatter(self) -> godot.Array:
+		nodes = [godot.Node2D() for i in range(3)]
+		controls = [godot.Control() for i in range(2)]
+
+		try:
+			godot.scatter(nodes, 'position', godot.PackedVector2Array([godot.Vector2(i, 2 * i) for i in range(3)]))
+			godot.scatter(nodes, 'z_index', [1, 2, 3])
+			# indexed property, set_offset(SIDE_LEFT, value)
+			godot.scatter(controls, 'offset_left', [4.0, 5.0])
+
+			out = godot.PackedVector2Array()
+			out.resize(len(nodes))
+			godot.gather(nodes, 'position', godot.writable_memoryview(out))
+
+			return godot.Array([
+				godot.gather(nodes, 'position'), out, godot.gather(nodes, 'z_index'), godot.gather(controls, 'offset_left'),
+				godot.gather(nodes, 'name') == [node.name for node in nodes],
+			])
+
+		finally:
+			for node in nodes + controls:
+				node.free()
+
+
+	def test_packed_arrays_from_buffers(self) -> godot.Array:
+		import array
+
+		vectors = memoryview(array.array('f', [1, 2, 3, 4])).cast('B').cast('f', (2, 2))
+
+		return godot.Array([
+			godot.PackedByteArray(b'\x01\x02\x03'),
+			godot.PackedInt32Array(array.array('i', [1, -2, 3])),
+			godot.PackedFloat32Array(array.array('f', [0.5, 1.5])),
+			godot.PackedVector2Array(vectors),
+			# the item format doesn't match, cast element wise
+			godot.PackedFloat64Array(array.array('i', [1, 2])),
+		])
+
+
+	def test_image_buffers(self) -> godot.Array:
+		import array
+
+		def uint16_buffer(values, shape):
+			return memoryview(array.array('H', values)).cast('B').cast('H', shape)
+
+		pixels = godot.Image.create_from_buffer(memoryview(bytes(range(8))).cast('B', (1, 2, 4)))
+		view = pixels.get_data_view(writable=True)
+		view[0, 1, 3] = 255
+
+		floats = godot.Image.create_from_buffer(memoryview(array.array('f', range(6))).cast('B').cast('f', (1, 2, 3)))
+
+		# packed formats are never inferred, a single channel of uint16 is R16 where available
+		try:
+			height_map_format = godot.Image.create_from_buffer(uint16_buffer([1, 2, 3, 4], (2, 2))).get_format()
+		except ValueError:
+			height_map_format = None
+
+		packed = godot.Image.create_from_buffer(uint16_buffer([1, 2], (1, 2)), godot.Image.FORMAT_RGB565)
+
+		return godot.Array([
+			pixels.get_format(), list(view.shape), view.format, pixels.get_data(),
+			floats.get_format(), floats.get_data_view().tolist(),
+			height_map_format not in (godot.Image.FORMAT_RGBA4444, godot.Image.FORMAT_RGB565),
+			packed.get_format(), packed.get_data_view().tolist(),
+		])
+
+
+	def test_open_file(self) -> godot.Array:
+		import io
+
+		path = 'user://test_open_file.txt'
+
+		with godot.open_file(path, 'w') as file:
+			file.write('first line\nsecond line\n')
+
+		# writes in append mode go to the end, even after seeking to read
+		with godot.open_file(path, 'a+') as file:
+			file.write('third line\n')
+			file.seek(0)
+			first_line = file.readline()
+			file.write('fourth line\n')
+
+		with godot.open_file(path, 'rb') as file:
+			file.seek(6)
+			word = file.read(4)
+			file.seek(-5, io.SEEK_END)
+			tail = file.read()
+			size = file.tell()
+
+		with godot.open_file(path) as file:
+			lines = file.read().splitlines()
+
+		godot.DirAccess.remove_absolute(path)
+
+		try:
+			godot.open_file(path)
+		except FileNotFoundError:
+			missing = True
+		else:
+			missing = False
+
+		return godot.Array([first_line, lines, word.decode(), tail.decode(), size, missing])
+
+
 	def _input(self, event: godot.InputEvent):
 		if isinstance(event, godot.InputEventKey):
 			self.custom_signal.emit('_input: ' + event.as_text_key_label(), event.unicode) # XXX: key_label???
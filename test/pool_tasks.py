@@ -0,0 +1,11 @@
+# Run in sub-interpreters by the interpreter pool, must not import `godot`.
+
+import math
+
+
+def square(index: int, offset: int) -> int:
+	return index * index + offset
+
+
+def length(vector: tuple[float, float]) -> float:
+	return math.hypot(*vector)
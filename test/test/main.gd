@@ -109,6 +109,59 @@ func _ready():
 	event.unicode = 72
 	get_viewport().push_input(event)
 	assert_equal(custom_signal_emitted, ["_input: H", 72])
+
+	# Calls from many engine threads at once.
+	var thread_results := []
+	thread_results.resize(1000)
+	var group_task = WorkerThreadPool.add_group_task(
+		func(i): thread_results[i] = example.threaded_call(i), thread_results.size())
+	WorkerThreadPool.wait_for_group_task_completion(group_task)
+	assert_equal(thread_results, range(thread_results.size()).map(func(i): return i * i))
+	assert_true(example.thread_state_kept())
+
+	# Project code run in parallel sub-interpreters.
+	assert_equal(example.interpreter_pool_squares(100, 1), range(100).map(func(i): return i * i + 1))
+	assert_equal(example.interpreter_pool_length(Vector2(3, 4)), 5.0)
+	# Slicing, negative indices and steps.
+	assert_equal(example.test_slicing(), [
+		PackedInt32Array([1, 2, 3]), PackedInt32Array([4, 5]), PackedInt32Array([0, 2, 4]),
+		PackedInt32Array([5, 4, 3, 2, 1, 0]), PackedInt32Array([4, 3, 2]), PackedInt32Array(),
+		[2.5, "a", 1],
+		"bcd", "ef", "ace", "fedcba", "fd"])
+
+	# Native iteration of indexed types.
+	assert_equal(example.test_indexed_iteration(), [
+		"_VariantIndexedIterator", [0, 1, 2, 3, 4], [4, 3, 2, 1, 0],
+		["a", "b"], true,
+		[0, 1, 2]])
+
+	# Batched method calls.
+	var batch_positions = [Vector2(0, 0), Vector2(1, -1), Vector2(2, -2)]
+	assert_equal(example.test_method_batch(), [
+		batch_positions, PackedVector2Array(batch_positions), [0.0, 0.5, 1.0]])
+
+	# Gather and scatter properties of many objects.
+	var gathered_positions = PackedVector2Array([Vector2(0, 0), Vector2(1, 2), Vector2(2, 4)])
+	assert_equal(example.test_gather_scatter(), [
+		gathered_positions, gathered_positions, PackedInt64Array([1, 2, 3]), PackedFloat64Array([4.0, 5.0]),
+		true])
+
+	# Packed arrays from buffers.
+	assert_equal(example.test_packed_arrays_from_buffers(), [
+		PackedByteArray([1, 2, 3]), PackedInt32Array([1, -2, 3]), PackedFloat32Array([0.5, 1.5]),
+		PackedVector2Array([Vector2(1, 2), Vector2(3, 4)]), PackedFloat64Array([1.0, 2.0])])
+
+	# Image data views and images from buffers.
+	assert_equal(example.test_image_buffers(), [
+		Image.FORMAT_RGBA8, [1, 2, 4], "B", PackedByteArray([0, 1, 2, 3, 4, 5, 6, 255]),
+		Image.FORMAT_RGBF, [[[0.0, 1.0, 2.0], [3.0, 4.0, 5.0]]],
+		true,
+		Image.FORMAT_RGB565, [[[1], [2]]]])
+
+	# Files opened through FileAccess.
+	assert_equal(example.test_open_file(), [
+		"first line\n", ["first line", "second line", "third line", "fourth line"], "line", "line\n", 46, true])
+
 	#'''
 	exit_with_status()
 
@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+
+'''Benchmark batched method calls against calling the method on each object.
+
+Run from a project using the extension:
+
+	godot --headless --python-script path/to/tools/benchmark_batch_calls.py [COUNT]
+'''
+
+import sys
+import timeit
+
+
+def main():
+	import godot
+
+	count = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+
+	nodes = [godot.Node2D() for _ in range(count)]
+	positions = [godot.Vector2(i, -i) for i in range(count)]
+	packed_positions = godot.PackedVector2Array(positions)
+
+	set_position = godot.Node2D.set_position
+	get_position = godot.Node2D.get_position
+
+	def loop_set():
+		for node, position in zip(nodes, positions):
+			node.set_position(position)
+
+	def loop_get():
+		return [node.get_position() for node in nodes]
+
+	cases = [
+		('set_position loop', loop_set),
+		('set_position.batch list', lambda: set_position.batch(nodes, positions)),
+		('set_position.batch packed', lambda: set_position.batch(nodes, packed_positions)),
+		('get_position loop', loop_get),
+		('get_position.batch', lambda: get_position.batch(nodes)),
+	]
+
+	set_position.batch(nodes, packed_positions)
+	assert get_position.batch(nodes) == loop_get() == positions
+
+	print(f'{"case":<28}{"per call":>12}')
+
+	for name, func in cases:
+		elapsed = min(timeit.repeat(func, number=5, repeat=5)) / 5
+
+		print(f'{name:<28}{elapsed / count * 1e9:>9.0f} ns')
+
+	for node in nodes:
+		node.free()
+
+
+if __name__ == '__main__':
+	main()
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+
+'''Benchmark the cost of releasing the GIL around engine calls.
+
+Short calls are timed bound with the GIL held (the default) and released, then a long call is made
+while a python thread counts to show the thread only makes progress when the GIL is released.
+
+Run from a project using the extension:
+
+	godot --headless --python-script path/to/tools/benchmark_gil_release.py [NUMBER]
+'''
+
+import sys
+import threading
+import time
+import timeit
+
+
+def _bind(class_name, method_name, release_gil):
+	import _gdextension as gde
+	import godot
+
+	from godot._internal import utils
+	from godot._internal.api_info import api
+
+	cls = getattr(godot, class_name)
+	if not isinstance(cls, type):
+		cls = type(cls) # singleton
+
+	method_info = api.classes.get(class_name).methods.get(method_name)
+	class_method_info = utils.get_method_info(cls, method_name)
+
+	method = gde.classdb_get_method_bind(class_name, class_method_info, method_info.hash,
+		release_gil = release_gil)
+
+	return getattr(method, '__func__', method) # unwrap the instance method for static and non static use
+
+
+def _count_while(func):
+	count = 0
+	done = threading.Event()
+
+	def counter():
+		nonlocal count
+		while not done.is_set():
+			count += 1
+
+	thread = threading.Thread(target=counter)
+	thread.start()
+
+	try:
+		start = time.perf_counter()
+		func()
+		elapsed = time.perf_counter() - start
+
+	finally:
+		done.set()
+		thread.join()
+
+	return count, elapsed
+
+
+def main():
+	import godot
+
+	number = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+
+	node = godot.Node()
+
+	print(f'{"short call":<28}{"default":>12}{"held":>12}{"released":>12}')
+
+	for class_name, method_name, args in [
+		('Node', 'get_child_count', (node, )),
+		('Node', 'get_name', (node, )),
+		('Node', 'is_inside_tree', (node, )),
+	]:
+		held = _bind(class_name, method_name, False)
+		released = _bind(class_name, method_name, True)
+
+		default = getattr(node, method_name)
+		default_args = args[1:]
+
+		times = [
+			min(timeit.repeat(lambda: func(*func_args), number=number, repeat=5)) / number * 1e9
+			for func, func_args in ((default, default_args), (held, args), (released, args))
+		]
+
+		print(f'{class_name + "." + method_name:<28}' + ''.join(f'{t:>9.0f} ns' for t in times))
+
+	print()
+
+	os_ = godot.OS
+
+	for release_gil in (False, True):
+		delay_msec = _bind('OS', 'delay_msec', release_gil)
+
+		count, elapsed = _count_while(lambda: delay_msec(os_, 200))
+
+		print(f'OS.delay_msec(200) with the GIL {"released" if release_gil else "held":<8}: '
+			f'{elapsed * 1000:.0f} ms, counter thread reached {count}')
+
+	node.free()
+
+
+if __name__ == '__main__':
+	main()
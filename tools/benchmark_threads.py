@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+
+'''Benchmark python work split between threads, scales with the thread count on free-threaded builds.
+
+The same total amount of work, pure python and calls into the engine, is split between an increasing number
+of threads. With the GIL the wall time stays about the same, without it the work runs in parallel.
+
+Run from a project using the extension:
+
+	godot --headless --python-script path/to/tools/benchmark_threads.py [NUMBER]
+'''
+
+import os
+import sys
+import threading
+import time
+
+
+def _python_work(number):
+	total = 0
+	for i in range(number):
+		total += i * i % 7
+	return total
+
+
+def _engine_work(number):
+	import godot
+
+	v = godot.Vector2(1, 2)
+	total = 0.0
+	for i in range(number):
+		total += (v * i).length()
+	return total
+
+
+def _run_threads(func, number, thread_count):
+	barrier = threading.Barrier(thread_count + 1)
+
+	def target():
+		barrier.wait()
+		func(number // thread_count)
+
+	threads = [threading.Thread(target=target) for _ in range(thread_count)]
+
+	for thread in threads:
+		thread.start()
+
+	barrier.wait()
+	start = time.perf_counter()
+
+	for thread in threads:
+		thread.join()
+
+	return time.perf_counter() - start
+
+
+def main():
+	number = int(sys.argv[1]) if len(sys.argv) > 1 else 2_000_000
+
+	is_gil_enabled = getattr(sys, '_is_gil_enabled', lambda: True)()
+
+	print(f'python {sys.version.split()[0]}, GIL {"enabled" if is_gil_enabled else "disabled"}, '
+		f'{os.cpu_count()} cpus')
+	print()
+
+	thread_counts = [count for count in (1, 2, 4, 8) if count <= (os.cpu_count() or 1)]
+
+	print(f'{"work":<12}' + ''.join(f'{f"{count} threads":>14}' for count in thread_counts) + f'{"speedup":>10}')
+
+	for name, func, work_number in [
+		('python', _python_work, number),
+		('engine', _engine_work, number // 4),
+	]:
+		func(1000) # warm up, binds what the work uses
+
+		times = [_run_threads(func, work_number, count) for count in thread_counts]
+
+		print(f'{name:<12}' + ''.join(f'{t * 1000:>11.0f} ms' for t in times) + f'{times[0] / times[-1]:>9.1f}x')
+
+
+if __name__ == '__main__':
+	main()
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+
+'''Benchmark variant operators against the previous `functools.singledispatchmethod` based dispatch.
+
+Run from a project using the extension:
+
+	godot --headless --python-script path/to/tools/benchmark_variant_operators.py [NUMBER]
+'''
+
+import sys
+import functools
+import timeit
+
+
+def _make_singledispatch_reference(op_enum, left_type, right_type, return_type):
+	import _gdextension as gde
+
+	op_eval = gde.variant_get_ptr_operator_evaluator(op_enum,
+		left_type._variant_type, right_type._variant_type, return_type._variant_type)
+
+	op = functools.singledispatchmethod(lambda self, other: NotImplemented)
+	op.register(right_type._python_type, lambda self, other: op_eval(self, other))
+
+	class reference:
+		__op__ = op
+
+	return lambda left, right: reference.__op__.__get__(left)(right)
+
+
+def main():
+	import godot
+
+	Type = godot.Variant.Type
+	Operator = godot.Variant.Operator
+
+	class _type:
+		def __init__(self, python_type, variant_type):
+			self._python_type = python_type
+			self._variant_type = variant_type
+
+	float_ = _type(float, Type.TYPE_FLOAT)
+	vector2 = _type(godot.Vector2, Type.TYPE_VECTOR2)
+	vector3 = _type(godot.Vector3, Type.TYPE_VECTOR3)
+	color = _type(godot.Color, Type.TYPE_COLOR)
+	transform2d = _type(godot.Transform2D, Type.TYPE_TRANSFORM2D)
+
+	cases = [
+		('Vector2 * float', godot.Vector2(1, 2), 2.5, Operator.OP_MULTIPLY, vector2, float_, vector2),
+		('Vector2 + Vector2', godot.Vector2(1, 2), godot.Vector2(3, 4), Operator.OP_ADD, vector2, vector2, vector2),
+		('Vector3 - Vector3', godot.Vector3(1, 2, 3), godot.Vector3(4, 5, 6), Operator.OP_SUBTRACT, vector3, vector3, vector3),
+		('Color * Color', godot.Color(1, 0.5, 0.25), godot.Color(0.5, 0.5, 0.5), Operator.OP_MULTIPLY, color, color, color),
+		('Transform2D * Vector2', godot.Transform2D(), godot.Vector2(1, 2), Operator.OP_MULTIPLY, transform2d, vector2, vector2),
+	]
+
+	number = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+
+	print(f'{"operation":<24}{"dispatch table":>16}{"singledispatch":>16}{"speedup":>10}')
+
+	for name, left, right, op_enum, left_type, right_type, return_type in cases:
+		reference = _make_singledispatch_reference(op_enum, left_type, right_type, return_type)
+
+		current = {
+			Operator.OP_MULTIPLY: lambda: left * right,
+			Operator.OP_ADD: lambda: left + right,
+			Operator.OP_SUBTRACT: lambda: left - right,
+		}[op_enum]
+
+		assert current() == reference(left, right)
+
+		current_time = min(timeit.repeat(current, number=number, repeat=5))
+		reference_time = min(timeit.repeat(lambda: reference(left, right), number=number, repeat=5))
+
+		print(f'{name:<24}{current_time / number * 1e9:>13.0f} ns{reference_time / number * 1e9:>13.0f} ns'
+			f'{reference_time / current_time:>9.1f}x')
+
+
+if __name__ == '__main__':
+	main()
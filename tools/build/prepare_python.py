@@ -19,18 +19,43 @@ class PlatformConfig:
 	python_lib_dir: str
 	python_ext_dir: str
 	executable: str
+	python_version: str = '3.12'
+	abiflags: str = ''
+	install_dir: str = '' # path of the install inside the extracted `python` dir, set for full archives
 
 	@property
 	def name(self):
 		return f'{self.platform}-{self.arch}'
 
+	@property
+	def python_name(self):
+		return f'python{self.python_version}{self.abiflags}'
+
+	@property
+	def zip_name(self):
+		return f'python{self.python_version.replace(".", "")}{self.abiflags}'
+
 
 platform_configs = {}
+free_threaded_platform_configs = {}
 
-def add_platform_config(*args, **kwargs):
+def add_platform_config(*args, free_threaded: bool = False, **kwargs):
 	config = PlatformConfig(*args, **kwargs)
 	key = (config.platform, config.arch)
-	platform_configs[key] = config
+
+	if free_threaded:
+		free_threaded_platform_configs[key] = config
+	else:
+		platform_configs[key] = config
+
+
+def get_platform_config(platform: str, arch: str, free_threaded: bool = False) -> PlatformConfig:
+	configs = free_threaded_platform_configs if free_threaded else platform_configs
+
+	if (platform, arch) not in configs:
+		raise ValueError(f'no {"free-threaded " if free_threaded else ""}python build configured for {platform}-{arch}')
+
+	return configs[(platform, arch)]
 
 
 add_platform_config(
@@ -86,8 +111,71 @@ add_platform_config(
 )
 
 
-def fetch_python_for_platform(platform: str, arch: str, dest_dir: pathlib.Path):
-	config = platform_configs[(platform, arch)]
+# free-threaded builds (`python3.13t`), only published as full archives with the install under `python/install`
+# XXX: no windows build configured yet
+
+add_platform_config(
+	free_threaded = True,
+	platform = 'linux',
+	arch = 'x86_64',
+	source_url = 'https://github.com/indygreg/python-build-standalone/releases/download/'
+		'20241016/cpython-3.13.0+20241016-x86_64-unknown-linux-gnu-freethreaded+pgo+lto-full.tar.zst',
+	so_suffixes = ['.so'],
+	ext_suffixes = ['.so'],
+	so_path = 'lib/libpython3.13t.so.1.0',
+	python_lib_dir = 'lib/python3.13t',
+	python_ext_dir = 'lib/python3.13t/lib-dynload',
+	executable = 'bin/python3.13t',
+	python_version = '3.13',
+	abiflags = 't',
+	install_dir = 'install',
+)
+
+add_platform_config(
+	free_threaded = True,
+	platform = 'macos',
+	arch = 'x86_64',
+	source_url = 'https://github.com/indygreg/python-build-standalone/releases/download/'
+		'20241016/cpython-3.13.0+20241016-x86_64-apple-darwin-freethreaded+pgo+lto-full.tar.zst',
+	so_suffixes = ['.so', '.dylib'],
+	ext_suffixes = ['.so'],
+	so_path = 'lib/libpython3.13t.dylib',
+	python_lib_dir = 'lib/python3.13t',
+	python_ext_dir = 'lib/python3.13t/lib-dynload',
+	executable = 'bin/python3.13t',
+	python_version = '3.13',
+	abiflags = 't',
+	install_dir = 'install',
+)
+
+add_platform_config(
+	free_threaded = True,
+	platform = 'macos',
+	arch = 'arm64',
+	source_url = 'https://github.com/indygreg/python-build-standalone/releases/download/'
+		'20241016/cpython-3.13.0+20241016-aarch64-apple-darwin-freethreaded+pgo+lto-full.tar.zst',
+	so_suffixes = ['.so', '.dylib'],
+	ext_suffixes = ['.so'],
+	so_path = 'lib/libpython3.13t.dylib',
+	python_lib_dir = 'lib/python3.13t',
+	python_ext_dir = 'lib/python3.13t/lib-dynload',
+	executable = 'bin/python3.13t',
+	python_version = '3.13',
+	abiflags = 't',
+	install_dir = 'install',
+)
+
+
+def _unpack_archive(path: pathlib.Path, extract_dir: pathlib.Path):
+	if path.name.endswith('.tar.zst'):
+		# not supported by `shutil.unpack_archive`
+		subprocess.run(['tar', '--zstd', '-xf', path, '-C', extract_dir], check=True)
+	else:
+		shutil.unpack_archive(path, extract_dir = extract_dir)
+
+
+def fetch_python_for_platform(platform: str, arch: str, dest_dir: pathlib.Path, free_threaded: bool = False):
+	config = get_platform_config(platform, arch, free_threaded)
 
 	print(f'fetching python for {config.name}')
 	print(f'  {config.source_url}')
@@ -98,14 +186,14 @@ def fetch_python_for_platform(platform: str, arch: str, dest_dir: pathlib.Path):
 
 
 def prepare_for_platform(platform: str, arch: str,
-		src_dir: pathlib.Path, dest_dir: pathlib.Path) -> pathlib.Path:
-	config = platform_configs[(platform, arch)]
+		src_dir: pathlib.Path, dest_dir: pathlib.Path, free_threaded: bool = False) -> pathlib.Path:
+	config = get_platform_config(platform, arch, free_threaded)
 
 	print(f'preparing for {config.name}')
 
-	shutil.unpack_archive(src_dir / pathlib.Path(config.source_url).name, extract_dir = src_dir)
+	_unpack_archive(src_dir / pathlib.Path(config.source_url).name, src_dir)
 
-	src = src_dir / 'python'
+	src = src_dir / 'python' / config.install_dir
 	src_lib_path = src / config.so_path
 	lib_filename = pathlib.Path(config.so_path).name
 
@@ -123,20 +211,21 @@ def prepare_for_platform(platform: str, arch: str,
 		subprocess.run(['strip', '-s', dest_dir / lib_filename], check=True)
 
 	if (src / config.python_ext_dir).exists():
-		dest_ext_dir = dest_dir / 'python3.12' / 'lib-dynload'
+		dest_ext_dir = dest_dir / config.python_name / 'lib-dynload'
 		dest_ext_dir.mkdir(parents=True, exist_ok=True)
 
 		for path in (src / config.python_ext_dir).iterdir():
 			if any(suffix in path.suffixes for suffix in config.ext_suffixes):
 				shutil.copy2(path, dest_ext_dir)
 
-	shutil.make_archive(dest_dir / 'python312', 'zip', root_dir=src / config.python_lib_dir, base_dir='')
+	shutil.make_archive(dest_dir / config.zip_name, 'zip', root_dir=src / config.python_lib_dir, base_dir='')
 
 
-def get_python_for_platform(platform: str, arch: str, src_dir: pathlib.Path) -> pathlib.Path:
-	config = platform_configs[(platform, arch)]
+def get_python_for_platform(platform: str, arch: str, src_dir: pathlib.Path,
+		free_threaded: bool = False) -> pathlib.Path:
+	config = get_platform_config(platform, arch, free_threaded)
 
-	src = src_dir / 'python'
+	src = src_dir / 'python' / config.install_dir
 
 	return src / config.executable
 